@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Per-backend decode cost for Observe frames.
+
+Builds a representative StreamBody (one BoltLockTrait per lock), then times
+the envelope parse and each ``TraitDecoder`` strategy. Every available
+protobuf backend is measured in its own interpreter, selected through
+``PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION``; backends that cannot be loaded
+are reported as unavailable.
+
+Usage: python benchmarks/decode_backend.py [--locks 4] [--number 20000]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import timeit
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKENDS = ("upb", "cpp", "python")
+BOLT_LOCK = "weave.trait.security.BoltLockTrait"
+
+
+def build_frame(trait_registry, locks):
+    stream_pb2 = trait_registry.load_module("nest.stream_pb2")
+    BoltLockTrait = trait_registry.message_class(BOLT_LOCK)
+    bolt_lock = BoltLockTrait(
+        state=BoltLockTrait.BOLT_STATE_EXTENDED,
+        actuatorState=BoltLockTrait.BOLT_ACTUATOR_STATE_OK,
+        lockedState=BoltLockTrait.BOLT_LOCKED_STATE_LOCKED,
+    )
+    bolt_lock.boltLockActor.method = BoltLockTrait.BOLT_LOCK_ACTOR_METHOD_REMOTE_USER_EXPLICIT
+    bolt_lock.boltLockActor.originator.resourceId = "USER_015AB3C9D1E2F3A4"
+    bolt_lock.lockedStateLastChangedAt.seconds = 1700000000
+    body = stream_pb2.StreamBody()
+    for index in range(locks):
+        get_op = body.message.add().get.add()
+        get_op.object.id = f"DEVICE_{index:016X}"
+        get_op.object.key = "bolt_lock"
+        get_op.data.property.Pack(bolt_lock, "type.nestlabs.com")
+    return stream_pb2.StreamBody, body.SerializeToString()
+
+
+def run_worker(locks, number):
+    sys.path.insert(0, REPO_ROOT)
+    from custom_components.nest_yale import trait_registry
+
+    stream_body_cls, frame = build_frame(trait_registry, locks)
+    body = stream_body_cls.FromString(frame)
+    properties = [get_op.data.property for msg in body.message for get_op in msg.get]
+    reused = stream_body_cls()
+
+    def envelope_reuse():
+        reused.Clear()
+        reused.MergeFromString(frame)
+
+    cases = {
+        "envelope/parse": lambda: stream_body_cls.FromString(frame),
+        "envelope/reuse": envelope_reuse,
+    }
+    for strategy in ("unpack", "parse", "reuse"):
+        decoder = trait_registry.TraitDecoder(strategy)
+        cases[f"trait/{strategy}"] = (
+            lambda decoder=decoder: [decoder.decode(prop, BOLT_LOCK).lockedState for prop in properties]
+        )
+
+    results = {}
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=number, repeat=5)) / number
+        results[name] = round(best * 1e9)
+    print(json.dumps({
+        "backend": trait_registry.protobuf_backend(),
+        "default": trait_registry.TraitDecoder().strategy,
+        "frame_bytes": len(frame),
+        "ns": results,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--locks", type=int, default=4)
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.locks, args.number)
+        return 0
+
+    for backend in BACKENDS:
+        env = dict(os.environ, PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=backend)
+        # The pure Python backend is ~30x slower; keep its wall time sane
+        number = max(args.number // 30, 100) if backend == "python" else args.number
+        result = subprocess.run(
+            [sys.executable, __file__, "--worker", "--locks", str(args.locks), "--number", str(number)],
+            cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=False,
+        )
+        if result.returncode != 0:
+            print(f"{backend}: unavailable ({result.stderr.strip().splitlines()[-1:]})\n")
+            continue
+        report = json.loads(result.stdout.strip().splitlines()[-1])
+        if report["backend"] != backend:
+            print(f"{backend}: unavailable (interpreter fell back to {report['backend']})\n")
+            continue
+        print(f"{backend}: {report['frame_bytes']} byte frame, {args.locks} locks, default strategy {report['default']}")
+        for name, ns in report["ns"].items():
+            marker = " *" if name == f"trait/{report['default']}" else ""
+            print(f"  {name:<16} {ns / 1000:>9.2f} us{marker}")
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
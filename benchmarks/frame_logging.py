@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Per-frame logging cost on the Observe decode path.
+
+Times ``NestProtobufHandler._process_message`` on a representative frame
+with the integration logger at INFO (HA's default), at DEBUG, and with the
+sampled payload channel switched on. For comparison, ``legacy`` replays the
+eager f-string / ``hex()`` / ``str(StreamBody)`` formatting the hot path
+used to do on every frame regardless of log level.
+
+Records are routed to a NullHandler so only formatting cost is measured.
+
+Usage: python benchmarks/frame_logging.py [--locks 4] [--number 5000]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import timeit
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from decode_backend import build_frame  # noqa: E402
+from custom_components.nest_yale import protobuf_handler, trait_registry  # noqa: E402
+
+PACKAGE_LOGGER = logging.getLogger("custom_components.nest_yale")
+PAYLOAD_LOGGER = logging.getLogger("custom_components.nest_yale.payload")
+
+
+def legacy_formatting(handler, message, stream_body):
+    """The strings the pre-change hot path built for every frame."""
+    f"Stream chunk received (length={len(message)}): {message[:100].hex()}..."
+    f"Raw chunk (length={len(message)}): {message.hex()}"
+    f"Parsed StreamBody: {stream_body}"
+    for msg in stream_body.message:
+        for get_op in msg.get:
+            obj_id = get_op.object.id
+            f"Extracting `{get_op.data.property.type_url}` for `{obj_id}` with key `{get_op.object.key}`"
+            f"Parsed BoltLockTrait for {obj_id}: {dict(device_id=obj_id, bolt_locked=True)}, user_id=None"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--locks", type=int, default=4)
+    parser.add_argument("--number", type=int, default=5000)
+    args = parser.parse_args()
+
+    PACKAGE_LOGGER.addHandler(logging.NullHandler())
+    PACKAGE_LOGGER.propagate = False
+
+    stream_body_cls, frame = build_frame(trait_registry, args.locks)
+    stream_body = stream_body_cls.FromString(frame)
+    handler = protobuf_handler.NestProtobufHandler()
+    loop = asyncio.new_event_loop()
+
+    def process():
+        coro = handler._process_message(frame)
+        try:
+            coro.send(None)
+        except StopIteration:
+            pass
+        else:  # pragma: no cover - _process_message never awaits today
+            loop.run_until_complete(coro)
+
+    def timed(func):
+        return min(timeit.repeat(func, number=args.number, repeat=5)) / args.number * 1e6
+
+    scenarios = [
+        ("INFO (default)", logging.INFO, logging.NOTSET),
+        ("DEBUG", logging.DEBUG, logging.NOTSET),
+        ("DEBUG + payload", logging.DEBUG, logging.DEBUG),
+    ]
+    print(f"{len(frame)} byte frame, {args.locks} locks, protobuf backend {trait_registry.protobuf_backend()}")
+    baseline = None
+    for label, level, payload_level in scenarios:
+        PACKAGE_LOGGER.setLevel(level)
+        PAYLOAD_LOGGER.setLevel(payload_level)
+        cost = timed(process)
+        baseline = baseline if baseline is not None else cost
+        print(f"  {label:<18} {cost:>8.2f} us/frame")
+
+    PACKAGE_LOGGER.setLevel(logging.INFO)
+    PAYLOAD_LOGGER.setLevel(logging.NOTSET)
+    legacy = timed(lambda: legacy_formatting(handler, frame, stream_body))
+    print(f"  {'legacy (any level)':<18} {baseline + legacy:>8.2f} us/frame "
+          f"({legacy:.2f} us of eager formatting removed)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
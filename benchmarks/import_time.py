@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Import-time budget for the Nest Yale integration.
+
+Runs ``python -X importtime`` in a fresh interpreter, sums the self time of
+every ``custom_components.nest_yale`` module (generated protos included) and
+fails when the total exceeds the budget. Home Assistant and third-party
+packages are reported separately and do not count against the budget.
+
+Usage: python benchmarks/import_time.py [--budget-ms 60] [--runs 5] [module ...]
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "custom_components.nest_yale"
+DEFAULT_MODULES = [f"{PACKAGE}.api_client", f"{PACKAGE}.coordinator", f"{PACKAGE}.lock"]
+LINE_RE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(modules):
+    """Return {module: self_us} for one cold interpreter run."""
+    code = "; ".join(f"import {m}" for m in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=False,
+    )
+    if result.returncode != 0:
+        sys.exit(f"Import failed:\n{result.stderr[-2000:]}")
+    timings = {}
+    for line in result.stderr.splitlines():
+        match = LINE_RE.match(line)
+        if match:
+            timings[match.group(4)] = int(match.group(1))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--budget-ms", type=float, default=60.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    # Best-of-N per module smooths out disk cache and scheduler noise
+    best = {}
+    for _ in range(args.runs):
+        for name, self_us in measure(args.modules).items():
+            best[name] = min(self_us, best.get(name, self_us))
+
+    ours = {name: us for name, us in best.items() if name.startswith(PACKAGE)}
+    other_ms = sum(us for name, us in best.items() if not name.startswith(PACKAGE)) / 1000
+    total_ms = sum(ours.values()) / 1000
+
+    print(f"{'module':<70} {'self ms':>8}")
+    for name, us in sorted(ours.items(), key=lambda item: -item[1])[:20]:
+        print(f"{name:<70} {us / 1000:>8.2f}")
+    print(f"\nnest_yale total: {total_ms:.2f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"dependencies (HA, protobuf, aiohttp, ...): {other_ms:.2f} ms, not budgeted")
+    pb2_loaded = sorted(name for name in ours if name.endswith("_pb2"))
+    print(f"pb2 modules loaded at import: {', '.join(pb2_loaded) or 'none'}")
+    return 0 if total_ms <= args.budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
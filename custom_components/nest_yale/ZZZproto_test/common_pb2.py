@@ -1,63 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: weave/common.proto
-"""Generated protocol buffer code."""
-from google.protobuf.internal import builder as _builder
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
-from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x12weave/common.proto\x12\x0cweave.common\x1a\x1egoogle/protobuf/duration.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"_\n\x05Timer\x12\'\n\x04time\x18\x01 \x01(\x0b\x32\x19.google.protobuf.Duration\x12-\n\ttimeBasis\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"9\n\tTimeOfDay\x12\x0c\n\x04hour\x18\x05 \x01(\r\x12\x0e\n\x06minute\x18\x06 \x01(\r\x12\x0e\n\x06second\x18\x07 \x01(\r\" \n\nResourceId\x12\x12\n\nresourceId\x18\x01 \x01(\t\"$\n\x0cResourceName\x12\x14\n\x0cresourceName\x18\x01 \x01(\t\"\"\n\x0bTraitTypeId\x12\x13\n\x0btraitTypeId\x18\x01 \x01(\r\"W\n\x11TraitTypeInstance\x12.\n\x0btraitTypeId\x18\x01 \x01(\x0b\x32\x19.weave.common.TraitTypeId\x12\x12\n\ninstanceId\x18\x02 \x01(\r\"\xc9\x01\n\x0fTraitInstanceId\x12\x1a\n\x12traitInstanceLabel\x18\x01 \x01(\t\x12\x38\n\x0ftraitInstanceId\x18\x02 \x01(\x0b\x32\x1f.weave.common.TraitTypeInstance\"`\n\x11TraitInstanceCase\x12\x1a\n\x16TRAIT_INSTANCE_NOT_SET\x10\x00\x12\x18\n\x14TRAIT_INSTANCE_LABEL\x10\x01\x12\x15\n\x11TRAIT_INSTANCE_ID\x10\x02\"{\n\x13\x46ullTraitInstanceId\x12,\n\nresourceId\x18\x01 \x01(\x0b\x32\x18.weave.common.ResourceId\x12\x36\n\x0ftraitInstanceId\x18\x02 \x01(\x0b\x32\x1d.weave.common.TraitInstanceId\"&\n\rInterfaceName\x12\x15\n\rinterfaceName\x18\x01 \x01(\t\"v\n\x07\x45ventId\x12,\n\nresourceId\x18\x01 \x01(\x0b\x32\x18.weave.common.ResourceId\x12\x31\n\nimportance\x18\x02 \x01(\x0e\x32\x1d.weave.common.EventImportance\x12\n\n\x02id\x18\x03 \x01(\x04\"B\n\x19ProfileSpecificStatusCode\x12\x11\n\tprofileId\x18\x01 \x01(\r\x12\x12\n\nstatusCode\x18\x02 \x01(\r\"t\n\tStringRef\x12\x0f\n\x07literal\x18\x01 \x01(\t\x12\x11\n\treference\x18\x02 \x01(\r\"C\n\rStringRefCase\x12\x16\n\x12STRING_REF_NOT_SET\x10\x00\x12\x0b\n\x07LITERAL\x10\x01\x12\r\n\tREFERENCE\x10\x02*\xd8\x01\n\tDayOfWeek\x12\x1b\n\x17\x44\x41Y_OF_WEEK_UNSPECIFIED\x10\x00\x12\x16\n\x12\x44\x41Y_OF_WEEK_SUNDAY\x10\x01\x12\x16\n\x12\x44\x41Y_OF_WEEK_MONDAY\x10\x02\x12\x17\n\x13\x44\x41Y_OF_WEEK_TUESDAY\x10\x04\x12\x19\n\x15\x44\x41Y_OF_WEEK_WEDNESDAY\x10\x08\x12\x18\n\x14\x44\x41Y_OF_WEEK_THURSDAY\x10\x10\x12\x16\n\x12\x44\x41Y_OF_WEEK_FRIDAY\x10 \x12\x18\n\x14\x44\x41Y_OF_WEEK_SATURDAY\x10@*\xeb\x02\n\x0bMonthOfYear\x12\x1d\n\x19MONTH_OF_YEAR_UNSPECIFIED\x10\x00\x12\x19\n\x15MONTH_OF_YEAR_JANUARY\x10\x01\x12\x1a\n\x16MONTH_OF_YEAR_FEBRUARY\x10\x02\x12\x17\n\x13MONTH_OF_YEAR_MARCH\x10\x04\x12\x17\n\x13MONTH_OF_YEAR_APRIL\x10\x08\x12\x15\n\x11MONTH_OF_YEAR_MAY\x10\x10\x12\x16\n\x12MONTH_OF_YEAR_JUNE\x10 \x12\x16\n\x12MONTH_OF_YEAR_JULY\x10@\x12\x19\n\x14MONTH_OF_YEAR_AUGUST\x10\x80\x01\x12\x1c\n\x17MONTH_OF_YEAR_SEPTEMBER\x10\x80\x02\x12\x1a\n\x15MONTH_OF_YEAR_OCTOBER\x10\x80\x04\x12\x1b\n\x16MONTH_OF_YEAR_NOVEMBER\x10\x80\x08\x12\x1b\n\x16MONTH_OF_YEAR_DECEMBER\x10\x80\x10*\xb5\x02\n\x0cResourceType\x12\x1d\n\x19RESOURCE_TYPE_UNSPECIFIED\x10\x00\x12\x18\n\x14RESOURCE_TYPE_DEVICE\x10\x01\x12\x16\n\x12RESOURCE_TYPE_USER\x10\x02\x12\x19\n\x15RESOURCE_TYPE_ACCOUNT\x10\x03\x12\x16\n\x12RESOURCE_TYPE_AREA\x10\x04\x12\x19\n\x15RESOURCE_TYPE_FIXTURE\x10\x05\x12\x17\n\x13RESOURCE_TYPE_GROUP\x10\x06\x12\x1c\n\x18RESOURCE_TYPE_ANNOTATION\x10\x07\x12\x1b\n\x17RESOURCE_TYPE_STRUCTURE\x10\x08\x12\x17\n\x13RESOURCE_TYPE_GUEST\x10\t\x12\x19\n\x15RESOURCE_TYPE_SERVICE\x10\n*\xfc\x02\n\x0cQuantityType\x12\x1d\n\x19QUANTITY_TYPE_UNSPECIFIED\x10\x00\x12\n\n\x06LENGTH\x10\x01\x12\x08\n\x04MASS\x10\x02\x12\x0c\n\x08\x44URATION\x10\x03\x12\x0b\n\x07\x43URRENT\x10\x04\x12\x0f\n\x0bTEMPERATURE\x10\x05\x12\x16\n\x12LUMINOUS_INTENSITY\x10\x06\x12\x08\n\x04\x41REA\x10\x07\x12\n\n\x06VOLUME\x10\x08\x12\x0c\n\x08VELOCITY\x10\t\x12\x10\n\x0c\x41\x43\x43\x45LERATION\x10\n\x12\r\n\tFREQUENCY\x10\x1b\x12\n\n\x06\x45NERGY\x10\x1e\x12\x13\n\x0f\x45LECTRIC_CHARGE\x10 \x12\x0b\n\x07VOLTAGE\x10!\x12\x0e\n\nRESISTANCE\x10\"\x12\x19\n\x15MAGNETIC_FLUX_DENSITY\x10&\x12\x0f\n\x0bILLUMINANCE\x10*\x12\x0c\n\x08HUMIDITY\x10.\x12\x07\n\x03\x44\x42M\x10/\x12\x07\n\x03PPM\x10\x30\x12\x13\n\x0ePIRMEASUREMENT\x10\x80\x02\x12\x0f\n\nNORMALIZED\x10\x81\x02*\xbe\x01\n\x0f\x45ventImportance\x12 \n\x1c\x45VENT_IMPORTANCE_UNSPECIFIED\x10\x00\x12(\n$EVENT_IMPORTANCE_PRODUCTION_CRITICAL\x10\x01\x12(\n$EVENT_IMPORTANCE_PRODUCTION_STANDARD\x10\x02\x12\x19\n\x15\x45VENT_IMPORTANCE_INFO\x10\x03\x12\x1a\n\x16\x45VENT_IMPORTANCE_DEBUG\x10\x04\x62\x06proto3')
-
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'weave.common_pb2', globals())
-if _descriptor._USE_C_DESCRIPTORS == False:
-
-  DESCRIPTOR._options = None
-  _DAYOFWEEK._serialized_start=1130
-  _DAYOFWEEK._serialized_end=1346
-  _MONTHOFYEAR._serialized_start=1349
-  _MONTHOFYEAR._serialized_end=1712
-  _RESOURCETYPE._serialized_start=1715
-  _RESOURCETYPE._serialized_end=2024
-  _QUANTITYTYPE._serialized_start=2027
-  _QUANTITYTYPE._serialized_end=2407
-  _EVENTIMPORTANCE._serialized_start=2410
-  _EVENTIMPORTANCE._serialized_end=2600
-  _TIMER._serialized_start=101
-  _TIMER._serialized_end=196
-  _TIMEOFDAY._serialized_start=198
-  _TIMEOFDAY._serialized_end=255
-  _RESOURCEID._serialized_start=257
-  _RESOURCEID._serialized_end=289
-  _RESOURCENAME._serialized_start=291
-  _RESOURCENAME._serialized_end=327
-  _TRAITTYPEID._serialized_start=329
-  _TRAITTYPEID._serialized_end=363
-  _TRAITTYPEINSTANCE._serialized_start=365
-  _TRAITTYPEINSTANCE._serialized_end=452
-  _TRAITINSTANCEID._serialized_start=455
-  _TRAITINSTANCEID._serialized_end=656
-  _TRAITINSTANCEID_TRAITINSTANCECASE._serialized_start=560
-  _TRAITINSTANCEID_TRAITINSTANCECASE._serialized_end=656
-  _FULLTRAITINSTANCEID._serialized_start=658
-  _FULLTRAITINSTANCEID._serialized_end=781
-  _INTERFACENAME._serialized_start=783
-  _INTERFACENAME._serialized_end=821
-  _EVENTID._serialized_start=823
-  _EVENTID._serialized_end=941
-  _PROFILESPECIFICSTATUSCODE._serialized_start=943
-  _PROFILESPECIFICSTATUSCODE._serialized_end=1009
-  _STRINGREF._serialized_start=1011
-  _STRINGREF._serialized_end=1127
-  _STRINGREF_STRINGREFCASE._serialized_start=1060
-  _STRINGREF_STRINGREFCASE._serialized_end=1127
-# @@protoc_insertion_point(module_scope)
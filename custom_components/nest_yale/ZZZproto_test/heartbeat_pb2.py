@@ -1,32 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: weave/trait/heartbeat.proto
-"""Generated protocol buffer code."""
-from google.protobuf.internal import builder as _builder
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
-from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
-from google.protobuf import wrappers_pb2 as google_dot_protobuf_dot_wrappers__pb2
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1bweave/trait/heartbeat.proto\x12\x15weave.trait.heartbeat\x1a\x1egoogle/protobuf/duration.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1egoogle/protobuf/wrappers.proto\"\xc9\n\n\rLivenessTrait\x12I\n\x06status\x18\x01 \x01(\x0e\x32\x39.weave.trait.heartbeat.LivenessTrait.LivenessDeviceStatus\x12\x35\n\x11timeStatusChanged\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x38\n\x15maxInactivityDuration\x18\x03 \x01(\x0b\x32\x19.google.protobuf.Duration\x12R\n\x0fheartbeatStatus\x18\x04 \x01(\x0e\x32\x39.weave.trait.heartbeat.LivenessTrait.LivenessDeviceStatus\x12>\n\x1atimeHeartbeatStatusChanged\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x41\n\x1dnotifyRequestUnresponsiveness\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12R\n.notifyRequestUnresponsivenessTimeStatusChanged\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x42\n\x1e\x63ommandRequestUnresponsiveness\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12S\n/commandRequestUnresponsivenessTimeStatusChanged\x18\t \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a\x8a\x03\n\x13LivenessChangeEvent\x12I\n\x06status\x18\x01 \x01(\x0e\x32\x39.weave.trait.heartbeat.LivenessTrait.LivenessDeviceStatus\x12R\n\x0fheartbeatStatus\x18\x02 \x01(\x0e\x32\x39.weave.trait.heartbeat.LivenessTrait.LivenessDeviceStatus\x12\x41\n\x1dnotifyRequestUnresponsiveness\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12\x42\n\x1e\x63ommandRequestUnresponsiveness\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12M\n\nprevStatus\x18\x05 \x01(\x0e\x32\x39.weave.trait.heartbeat.LivenessTrait.LivenessDeviceStatus\"\xaa\x02\n\x14LivenessDeviceStatus\x12&\n\"LIVENESS_DEVICE_STATUS_UNSPECIFIED\x10\x00\x12!\n\x1dLIVENESS_DEVICE_STATUS_ONLINE\x10\x01\x12&\n\"LIVENESS_DEVICE_STATUS_UNREACHABLE\x10\x02\x12(\n$LIVENESS_DEVICE_STATUS_UNINITIALIZED\x10\x03\x12$\n LIVENESS_DEVICE_STATUS_REBOOTING\x10\x04\x12$\n LIVENESS_DEVICE_STATUS_UPGRADING\x10\x05\x12)\n%LIVENESS_DEVICE_STATUS_SCHEDULED_DOWN\x10\x06\x62\x06proto3')
-
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'weave.trait.heartbeat_pb2', globals())
-if _descriptor._USE_C_DESCRIPTORS == False:
-
-  DESCRIPTOR._options = None
-  _LIVENESSTRAIT._serialized_start=152
-  _LIVENESSTRAIT._serialized_end=1505
-  _LIVENESSTRAIT_LIVENESSCHANGEEVENT._serialized_start=810
-  _LIVENESSTRAIT_LIVENESSCHANGEEVENT._serialized_end=1204
-  _LIVENESSTRAIT_LIVENESSDEVICESTATUS._serialized_start=1207
-  _LIVENESSTRAIT_LIVENESSDEVICESTATUS._serialized_end=1505
-# @@protoc_insertion_point(module_scope)
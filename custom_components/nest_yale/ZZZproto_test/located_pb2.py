@@ -1,52 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: nest/trait/located.proto
-"""Generated protocol buffer code."""
-from google.protobuf.internal import builder as _builder
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x18nest/trait/located.proto\x12\x12nest.trait.located\x1a\x19google/protobuf/any.proto\"\xd4\x01\n\x1a\x44\x65viceLocatedSettingsTrait\x12\x35\n\x08where_id\x18\x02 \x01(\x0b\x32#.nest.trait.located.String_Indirect\x12H\n\x0b\x66ixtureType\x18\x04 \x01(\x0b\x32\x33.nest.trait.located.LocatedTrait.LocatedFixtureType\x12\x35\n\ttimestamp\x18\t \x01(\x0b\x32\".nest.trait.located.Int32_Indirect\"\x94\x03\n\x17LocatedAnnotationsTrait\x12K\n\x0b\x61nnotations\x18\x01 \x03(\x0b\x32\x36.nest.trait.located.LocatedAnnotationsTrait.Annotation\x12R\n\x12\x63ustom_annotations\x18\x02 \x03(\x0b\x32\x36.nest.trait.located.LocatedAnnotationsTrait.Annotation\x1a\xd7\x01\n\nAnnotation\x12S\n\x04info\x18\x02 \x01(\x0b\x32\x45.nest.trait.located.LocatedAnnotationsTrait.Annotation.AnnotationInfo\x1at\n\x0e\x41nnotationInfo\x12/\n\x02id\x18\x01 \x01(\x0b\x32#.nest.trait.located.String_Indirect\x12\x31\n\x04name\x18\x02 \x01(\x0b\x32#.nest.trait.located.String_Indirect\"\xc1\x0f\n\x0cLocatedTrait\x1a\xbd\x03\n\x12LocatedFixtureType\x12K\n\tmajorType\x18\x01 \x01(\x0e\x32\x38.nest.trait.located.LocatedTrait.LocatedMajorFixtureType\x12S\n\rminorTypeDoor\x18\x02 \x01(\x0e\x32<.nest.trait.located.LocatedTrait.LocatedMinorFixtureTypeDoor\x12W\n\x0fminorTypeWindow\x18\x03 \x01(\x0e\x32>.nest.trait.located.LocatedTrait.LocatedMinorFixtureTypeWindow\x12S\n\rminorTypeWall\x18\x04 \x01(\x0e\x32<.nest.trait.located.LocatedTrait.LocatedMinorFixtureTypeWall\x12W\n\x0fminorTypeObject\x18\x05 \x01(\x0e\x32>.nest.trait.located.LocatedTrait.LocatedMinorFixtureTypeObject\"\xdd\x01\n\x17LocatedMajorFixtureType\x12*\n&LOCATED_MAJOR_FIXTURE_TYPE_UNSPECIFIED\x10\x00\x12#\n\x1fLOCATED_MAJOR_FIXTURE_TYPE_DOOR\x10\x01\x12%\n!LOCATED_MAJOR_FIXTURE_TYPE_WINDOW\x10\x02\x12#\n\x1fLOCATED_MAJOR_FIXTURE_TYPE_WALL\x10\x03\x12%\n!LOCATED_MAJOR_FIXTURE_TYPE_OBJECT\x10\x04\"\xef\x02\n\x1bLocatedMinorFixtureTypeDoor\x12/\n+LOCATED_MINOR_FIXTURE_TYPE_DOOR_UNSPECIFIED\x10\x00\x12+\n\'LOCATED_MINOR_FIXTURE_TYPE_DOOR_GENERIC\x10\x01\x12*\n&LOCATED_MINOR_FIXTURE_TYPE_DOOR_HINGED\x10\x02\x12*\n&LOCATED_MINOR_FIXTURE_TYPE_DOOR_FRENCH\x10\x03\x12+\n\'LOCATED_MINOR_FIXTURE_TYPE_DOOR_SLIDING\x10\x04\x12\x34\n0LOCATED_MINOR_FIXTURE_TYPE_DOOR_GARAGE_SEGMENTED\x10\x05\x12\x37\n3LOCATED_MINOR_FIXTURE_TYPE_DOOR_GARAGE_SINGLE_PANEL\x10\x06\"\xc5\x04\n\x1dLocatedMinorFixtureTypeWindow\x12\x31\n-LOCATED_MINOR_FIXTURE_TYPE_WINDOW_UNSPECIFIED\x10\x00\x12-\n)LOCATED_MINOR_FIXTURE_TYPE_WINDOW_GENERIC\x10\x01\x12:\n6LOCATED_MINOR_FIXTURE_TYPE_WINDOW_VERTICAL_SINGLE_HUNG\x10\x02\x12<\n8LOCATED_MINOR_FIXTURE_TYPE_WINDOW_HORIZONTAL_SINGLE_HUNG\x10\x03\x12:\n6LOCATED_MINOR_FIXTURE_TYPE_WINDOW_VERTICAL_DOUBLE_HUNG\x10\x04\x12<\n8LOCATED_MINOR_FIXTURE_TYPE_WINDOW_HORIZONTAL_DOUBLE_HUNG\x10\x05\x12\x37\n3LOCATED_MINOR_FIXTURE_TYPE_WINDOW_VERTICAL_CASEMENT\x10\x06\x12\x39\n5LOCATED_MINOR_FIXTURE_TYPE_WINDOW_HORIZONTAL_CASEMENT\x10\x07\x12.\n*LOCATED_MINOR_FIXTURE_TYPE_WINDOW_TILTTURN\x10\x08\x12*\n&LOCATED_MINOR_FIXTURE_TYPE_WINDOW_ROOF\x10\t\"\xd2\x01\n\x1bLocatedMinorFixtureTypeWall\x12/\n+LOCATED_MINOR_FIXTURE_TYPE_WALL_UNSPECIFIED\x10\x00\x12+\n\'LOCATED_MINOR_FIXTURE_TYPE_WALL_GENERIC\x10\x01\x12*\n&LOCATED_MINOR_FIXTURE_TYPE_WALL_CORNER\x10\x02\x12)\n%LOCATED_MINOR_FIXTURE_TYPE_WALL_FLUSH\x10\x03\"\x81\x01\n\x1dLocatedMinorFixtureTypeObject\x12\x31\n-LOCATED_MINOR_FIXTURE_TYPE_OBJECT_UNSPECIFIED\x10\x00\x12-\n)LOCATED_MINOR_FIXTURE_TYPE_OBJECT_GENERIC\x10\x01\" \n\x0fString_Indirect\x12\r\n\x05value\x18\x01 \x01(\t\"\x1f\n\x0e\x46loat_Indirect\x12\r\n\x05value\x18\x01 \x01(\x02\"\x1f\n\x0eInt32_Indirect\x12\r\n\x05value\x18\x01 \x01(\x05\x62\x06proto3')
-
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'nest.trait.located_pb2', globals())
-if _descriptor._USE_C_DESCRIPTORS == False:
-
-  DESCRIPTOR._options = None
-  _DEVICELOCATEDSETTINGSTRAIT._serialized_start=76
-  _DEVICELOCATEDSETTINGSTRAIT._serialized_end=288
-  _LOCATEDANNOTATIONSTRAIT._serialized_start=291
-  _LOCATEDANNOTATIONSTRAIT._serialized_end=695
-  _LOCATEDANNOTATIONSTRAIT_ANNOTATION._serialized_start=480
-  _LOCATEDANNOTATIONSTRAIT_ANNOTATION._serialized_end=695
-  _LOCATEDANNOTATIONSTRAIT_ANNOTATION_ANNOTATIONINFO._serialized_start=579
-  _LOCATEDANNOTATIONSTRAIT_ANNOTATION_ANNOTATIONINFO._serialized_end=695
-  _LOCATEDTRAIT._serialized_start=698
-  _LOCATEDTRAIT._serialized_end=2683
-  _LOCATEDTRAIT_LOCATEDFIXTURETYPE._serialized_start=715
-  _LOCATEDTRAIT_LOCATEDFIXTURETYPE._serialized_end=1160
-  _LOCATEDTRAIT_LOCATEDMAJORFIXTURETYPE._serialized_start=1163
-  _LOCATEDTRAIT_LOCATEDMAJORFIXTURETYPE._serialized_end=1384
-  _LOCATEDTRAIT_LOCATEDMINORFIXTURETYPEDOOR._serialized_start=1387
-  _LOCATEDTRAIT_LOCATEDMINORFIXTURETYPEDOOR._serialized_end=1754
-  _LOCATEDTRAIT_LOCATEDMINORFIXTURETYPEWINDOW._serialized_start=1757
-  _LOCATEDTRAIT_LOCATEDMINORFIXTURETYPEWINDOW._serialized_end=2338
-  _LOCATEDTRAIT_LOCATEDMINORFIXTURETYPEWALL._serialized_start=2341
-  _LOCATEDTRAIT_LOCATEDMINORFIXTURETYPEWALL._serialized_end=2551
-  _LOCATEDTRAIT_LOCATEDMINORFIXTURETYPEOBJECT._serialized_start=2554
-  _LOCATEDTRAIT_LOCATEDMINORFIXTURETYPEOBJECT._serialized_end=2683
-  _STRING_INDIRECT._serialized_start=2685
-  _STRING_INDIRECT._serialized_end=2717
-  _FLOAT_INDIRECT._serialized_start=2719
-  _FLOAT_INDIRECT._serialized_end=2750
-  _INT32_INDIRECT._serialized_start=2752
-  _INT32_INDIRECT._serialized_end=2783
-# @@protoc_insertion_point(module_scope)
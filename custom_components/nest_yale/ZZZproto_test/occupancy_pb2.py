@@ -1,136 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: nest/trait/occupancy.proto
-"""Generated protocol buffer code."""
-from google.protobuf.internal import builder as _builder
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
-from google.protobuf import wrappers_pb2 as google_dot_protobuf_dot_wrappers__pb2
-from . import common_pb2 as weave_dot_common__pb2
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1anest/trait/occupancy.proto\x12\x14nest.trait.occupancy\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1egoogle/protobuf/wrappers.proto\x1a\x12weave/common.proto\"\xf1K\n\x12StructureModeTrait\x12M\n\rstructureMode\x18\x01 \x01(\x0e\x32\x36.nest.trait.occupancy.StructureModeTrait.StructureMode\x12\x45\n\toccupancy\x18\x02 \x01(\x0b\x32\x32.nest.trait.occupancy.StructureModeTrait.Occupancy\x12\x45\n\tallowance\x18\x03 \x01(\x0b\x32\x32.nest.trait.occupancy.StructureModeTrait.Allowance\x12Y\n\x13structureModeReason\x18\x04 \x01(\x0e\x32<.nest.trait.occupancy.StructureModeTrait.StructureModeReason\x12\x35\n\x13structureModeSetter\x18\x05 \x01(\x0b\x32\x18.weave.common.ResourceId\x12>\n\x1astructureModeEffectiveTime\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12]\n\x1d\x61\x63tivityAgnosticStructureMode\x18\x07 \x01(\x0e\x32\x36.nest.trait.occupancy.StructureModeTrait.StructureMode\x12N\n*activityAgnosticStructureModeEffectiveTime\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12W\n\x0cprivateState\x18\t \x01(\x0b\x32\x41.nest.trait.occupancy.StructureModeTrait.PrivateTraitHandlerState\x1a\x80\x02\n\tOccupancy\x12\x43\n\x08\x61\x63tivity\x18\x01 \x01(\x0e\x32\x31.nest.trait.occupancy.StructureModeTrait.Activity\x12\x43\n\x08presence\x18\x02 \x01(\x0e\x32\x31.nest.trait.occupancy.StructureModeTrait.Presence\x12\x34\n\x10lastActivityTime\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x33\n\x0f\x61\x63tivityHoldOff\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a\x9a\x01\n\tAllowance\x12O\n\x0emodeStickiness\x18\x02 \x01(\x0e\x32\x37.nest.trait.occupancy.StructureModeTrait.ModeStickiness\x12<\n\x18modeStickinessExpiration\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a\x35\n\x18PrivateTraitHandlerState\x12\x19\n\x11isCzUpdateStateOk\x18\x01 \x01(\x08\x1a\xce\x02\n\x1aStructureModeChangeRequest\x12M\n\rstructureMode\x18\x01 \x01(\x0e\x32\x36.nest.trait.occupancy.StructureModeTrait.StructureMode\x12L\n\x06reason\x18\x02 \x01(\x0e\x32<.nest.trait.occupancy.StructureModeTrait.StructureModeReason\x12(\n\x06userId\x18\x03 \x01(\x0b\x32\x18.weave.common.ResourceId\x12i\n\x1bnonPropagatingChangeDetails\x18\x04 \x01(\x0b\x32\x44.nest.trait.occupancy.StructureModeTrait.NonPropagatingChangeDetails\x1a\xaa\x01\n\x1bNonPropagatingChangeDetails\x12[\n\nsourceType\x18\x01 \x01(\x0e\x32G.nest.trait.occupancy.StructureModeTrait.NonPropagatingChangeSourceType\x12.\n\nchangeTime\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a}\n\x1bStructureModeChangeResponse\x12^\n\x0cresponseType\x18\x01 \x01(\x0e\x32H.nest.trait.occupancy.StructureModeTrait.StructureModeChangeResponseType\x1a\xb4\x05\n\"StructureModeCompleteUpdateRequest\x12M\n\rstructureMode\x18\x01 \x01(\x0e\x32\x36.nest.trait.occupancy.StructureModeTrait.StructureMode\x12\x45\n\toccupancy\x18\x02 \x01(\x0b\x32\x32.nest.trait.occupancy.StructureModeTrait.Occupancy\x12\x45\n\tallowance\x18\x03 \x01(\x0b\x32\x32.nest.trait.occupancy.StructureModeTrait.Allowance\x12Y\n\x13structureModeReason\x18\x04 \x01(\x0e\x32<.nest.trait.occupancy.StructureModeTrait.StructureModeReason\x12\x35\n\x13structureModeSetter\x18\x05 \x01(\x0b\x32\x18.weave.common.ResourceId\x12>\n\x1astructureModeEffectiveTime\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12]\n\x1d\x61\x63tivityAgnosticStructureMode\x18\x07 \x01(\x0e\x32\x36.nest.trait.occupancy.StructureModeTrait.StructureMode\x12N\n*activityAgnosticStructureModeEffectiveTime\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x30\n\nrevisionId\x18\t \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\x1a\xf5\x01\n#StructureModeCompleteUpdateResponse\x12^\n\x0cresponseType\x18\x01 \x01(\x0e\x32H.nest.trait.occupancy.StructureModeTrait.StructureModeChangeResponseType\x12n\n\x14\x63ompleteResponseType\x18\x02 \x01(\x0e\x32P.nest.trait.occupancy.StructureModeTrait.StructureModeCompleteUpdateResponseType\x1a\x96\x02\n LegacyStructureModeChangeRequest\x12M\n\rstructureMode\x18\x01 \x01(\x0e\x32\x36.nest.trait.occupancy.StructureModeTrait.StructureMode\x12L\n\x06reason\x18\x02 \x01(\x0e\x32<.nest.trait.occupancy.StructureModeTrait.StructureModeReason\x12(\n\x06userId\x18\x03 \x01(\x0b\x32\x18.weave.common.ResourceId\x12+\n\x05wwnId\x18\x04 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x1a\xd9\x01\n\"ConsumeOccupancyStateBeliefRequest\x12\x19\n\x11\x61\x63tiveProbability\x18\x01 \x01(\x02\x12\x18\n\x10sleepProbability\x18\x02 \x01(\x02\x12\x19\n\x11vacantProbability\x18\x03 \x01(\x02\x12%\n\x1didentifiedPresenceProbability\x18\x04 \x01(\x02\x12<\n\x18lastMotionEventTimestamp\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a&\n$ConsumeSecurityArmStateChangeRequest\x1a\'\n%ConsumeBoltActuatorStateChangeRequest\x1a\xf3\x02\n\'ConsumeLegacyStructureModeChangeRequest\x12\x46\n\x04\x61way\x18\x01 \x01(\x0e\x32\x38.nest.trait.occupancy.StructureModeTrait.LegacyAwayState\x12M\n\nawaySetter\x18\x02 \x01(\x0e\x32\x39.nest.trait.occupancy.StructureModeTrait.LegacyAwaySetter\x12\x37\n\x13manualAwayTimestamp\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12K\n\ttouchedBy\x18\x04 \x01(\x0e\x32\x38.nest.trait.occupancy.StructureModeTrait.LegacyTouchedBy\x12+\n\ttouchedId\x18\x05 \x01(\x0b\x32\x18.weave.common.ResourceId\x1a\xfc\x03\n\x18StructureModeChangeEvent\x12M\n\rstructureMode\x18\x01 \x01(\x0e\x32\x36.nest.trait.occupancy.StructureModeTrait.StructureMode\x12R\n\x12priorStructureMode\x18\x02 \x01(\x0e\x32\x36.nest.trait.occupancy.StructureModeTrait.StructureMode\x12L\n\x06reason\x18\x03 \x01(\x0e\x32<.nest.trait.occupancy.StructureModeTrait.StructureModeReason\x12(\n\x06userId\x18\x04 \x01(\x0b\x32\x18.weave.common.ResourceId\x12*\n\x08\x64\x65viceId\x18\x05 \x01(\x0b\x32\x18.weave.common.ResourceId\x12\x31\n\x0brtsDeviceId\x18\x06 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x39\n\x13\x63ontrolEventTypeUrl\x18\x07 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12+\n\x05wwnId\x18\x08 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x1a\xa9\x01\n\x14OccupancyChangeEvent\x12\x45\n\toccupancy\x18\x01 \x01(\x0b\x32\x32.nest.trait.occupancy.StructureModeTrait.Occupancy\x12J\n\x0epriorOccupancy\x18\x02 \x01(\x0b\x32\x32.nest.trait.occupancy.StructureModeTrait.Occupancy\x1a\xa9\x01\n\x14\x41llowanceChangeEvent\x12\x45\n\tallowance\x18\x01 \x01(\x0b\x32\x32.nest.trait.occupancy.StructureModeTrait.Allowance\x12J\n\x0epriorAllowance\x18\x02 \x01(\x0b\x32\x32.nest.trait.occupancy.StructureModeTrait.Allowance\x1a\xfa\x01\n\x07\x41utoAsk\x12G\n\nautoAskArm\x18\x01 \x01(\x0e\x32\x33.nest.trait.occupancy.StructureModeTrait.AutoAskArm\x12I\n\x0b\x61utoAskLock\x18\x02 \x01(\x0e\x32\x34.nest.trait.occupancy.StructureModeTrait.AutoAskLock\x12[\n\x14\x61utoAskStructureMode\x18\x03 \x01(\x0e\x32=.nest.trait.occupancy.StructureModeTrait.AutoAskStructureMode\x1a\xfe\x01\n\x0c\x41utoAskEvent\x12\x45\n\x07\x61skType\x18\x01 \x01(\x0e\x32\x34.nest.trait.occupancy.StructureModeTrait.AutoAskType\x12(\n\x06userId\x18\x02 \x03(\x0b\x32\x18.weave.common.ResourceId\x12*\n\x08\x64\x65viceId\x18\x03 \x01(\x0b\x32\x18.weave.common.ResourceId\x12\x0e\n\x06\x64ryRun\x18\x04 \x01(\x08\x12\x41\n\x07\x61utoAsk\x18\x05 \x01(\x0b\x32\x30.nest.trait.occupancy.StructureModeTrait.AutoAsk\x1a\xbb\x02\n(ActivityAgnosticStructureModeChangeEvent\x12]\n\x1d\x61\x63tivityAgnosticStructureMode\x18\x01 \x01(\x0e\x32\x36.nest.trait.occupancy.StructureModeTrait.StructureMode\x12\x62\n\"priorActivityAgnosticStructureMode\x18\x02 \x01(\x0e\x32\x36.nest.trait.occupancy.StructureModeTrait.StructureMode\x12L\n\x06reason\x18\x03 \x01(\x0e\x32<.nest.trait.occupancy.StructureModeTrait.StructureModeReason\x1a\xfc\x04\n\x1cStructureModeTraceEventState\x12M\n\rstructureMode\x18\x01 \x01(\x0e\x32\x36.nest.trait.occupancy.StructureModeTrait.StructureMode\x12\x45\n\toccupancy\x18\x02 \x01(\x0b\x32\x32.nest.trait.occupancy.StructureModeTrait.Occupancy\x12\x45\n\tallowance\x18\x03 \x01(\x0b\x32\x32.nest.trait.occupancy.StructureModeTrait.Allowance\x12Y\n\x13structureModeReason\x18\x04 \x01(\x0e\x32<.nest.trait.occupancy.StructureModeTrait.StructureModeReason\x12\x35\n\x13structureModeSetter\x18\x05 \x01(\x0b\x32\x18.weave.common.ResourceId\x12>\n\x1astructureModeEffectiveTime\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12]\n\x1d\x61\x63tivityAgnosticStructureMode\x18\x07 \x01(\x0e\x32\x36.nest.trait.occupancy.StructureModeTrait.StructureMode\x12N\n*activityAgnosticStructureModeEffectiveTime\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a\xcc\x01\n\"StructureModeTraceEventStateChange\x12S\n\x04\x66rom\x18\x01 \x01(\x0b\x32\x45.nest.trait.occupancy.StructureModeTrait.StructureModeTraceEventState\x12Q\n\x02to\x18\x02 \x01(\x0b\x32\x45.nest.trait.occupancy.StructureModeTrait.StructureModeTraceEventState\x1a\xd8\x01\n\x1bStructureModeTraceEventStep\x12(\n\x04time\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12`\n\x06labels\x18\x02 \x03(\x0b\x32P.nest.trait.occupancy.StructureModeTrait.StructureModeTraceEventStep.LabelsEntry\x1a-\n\x0bLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\xab\x03\n\x17StructureModeTraceEvent\x12\x0f\n\x07trigger\x18\x01 \x01(\t\x12\x14\n\x0ctriggerAgent\x18\x02 \x01(\t\x12\x17\n\x0ftriggerEventKey\x18\x03 \x01(\t\x12/\n\x0btriggerTime\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12-\n\tstartTime\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12`\n\x0bstateChange\x18\x06 \x01(\x0b\x32K.nest.trait.occupancy.StructureModeTrait.StructureModeTraceEventStateChange\x12S\n\x05steps\x18\x07 \x03(\x0b\x32\x44.nest.trait.occupancy.StructureModeTrait.StructureModeTraceEventStep\x12\x12\n\nscenarioId\x18\x08 \x03(\t\x12\r\n\x05\x65rror\x18\t \x01(\t\x12\x16\n\x0ertsStructureId\x18\n \x01(\t\"\x98\x01\n\rStructureMode\x12\x1e\n\x1aSTRUCTURE_MODE_UNSPECIFIED\x10\x00\x12\x17\n\x13STRUCTURE_MODE_HOME\x10\x01\x12\x17\n\x13STRUCTURE_MODE_AWAY\x10\x02\x12\x18\n\x14STRUCTURE_MODE_SLEEP\x10\x03\x12\x1b\n\x17STRUCTURE_MODE_VACATION\x10\x04\"P\n\x08\x41\x63tivity\x12\x18\n\x14\x41\x43TIVITY_UNSPECIFIED\x10\x00\x12\x13\n\x0f\x41\x43TIVITY_ACTIVE\x10\x01\x12\x15\n\x11\x41\x43TIVITY_INACTIVE\x10\x02\"i\n\x08Presence\x12\x18\n\x14PRESENCE_UNSPECIFIED\x10\x00\x12\x18\n\x14PRESENCE_UNAVAILABLE\x10\x01\x12\x14\n\x10PRESENCE_PRESENT\x10\x02\x12\x13\n\x0fPRESENCE_ABSENT\x10\x03\"\x8d\x01\n\x0eModeStickiness\x12\x1f\n\x1bMODE_STICKINESS_UNSPECIFIED\x10\x00\x12\x18\n\x14MODE_STICKINESS_NONE\x10\x01\x12\x19\n\x15MODE_STICKINESS_TIMED\x10\x02\x12%\n!MODE_STICKINESS_CONDITIONAL_TIMED\x10\x03\"\xe6\x02\n\x13StructureModeReason\x12%\n!STRUCTURE_MODE_REASON_UNSPECIFIED\x10\x00\x12)\n%STRUCTURE_MODE_REASON_EXPLICIT_INTENT\x10\x01\x12)\n%STRUCTURE_MODE_REASON_IMPLICIT_INTENT\x10\x02\x12\"\n\x1eSTRUCTURE_MODE_REASON_ACTIVITY\x10\x03\x12-\n)STRUCTURE_MODE_REASON_EXTENDED_INACTIVITY\x10\x04\x12-\n)STRUCTURE_MODE_REASON_IDENTIFIED_PRESENCE\x10\x05\x12,\n(STRUCTURE_MODE_REASON_IDENTIFIED_ABSENCE\x10\x06\x12\"\n\x1eSTRUCTURE_MODE_REASON_SCHEDULE\x10\x07\"\x7f\n\x1eNonPropagatingChangeSourceType\x12\x32\n.NON_PROPAGATING_CHANGE_SOURCE_TYPE_UNSPECIFIED\x10\x00\x12)\n%NON_PROPAGATING_CHANGE_SOURCE_TYPE_CZ\x10\x01\"\xbd\x01\n\x1fStructureModeChangeResponseType\x12\x33\n/STRUCTURE_MODE_CHANGE_RESPONSE_TYPE_UNSPECIFIED\x10\x00\x12/\n+STRUCTURE_MODE_CHANGE_RESPONSE_TYPE_SUCCESS\x10\x01\x12\x34\n0STRUCTURE_MODE_CHANGE_RESPONSE_TYPE_FAIL_ALREADY\x10\x02\"\xdc\x02\n\'StructureModeCompleteUpdateResponseType\x12<\n8STRUCTURE_MODE_COMPLETE_UPDATE_RESPONSE_TYPE_UNSPECIFIED\x10\x00\x12\x38\n4STRUCTURE_MODE_COMPLETE_UPDATE_RESPONSE_TYPE_SUCCESS\x10\x01\x12=\n9STRUCTURE_MODE_COMPLETE_UPDATE_RESPONSE_TYPE_FAIL_ALREADY\x10\x02\x12=\n9STRUCTURE_MODE_COMPLETE_UPDATE_RESPONSE_TYPE_FAIL_VERSION\x10\x03\x12;\n7STRUCTURE_MODE_COMPLETE_UPDATE_RESPONSE_TYPE_FAIL_OTHER\x10\x04\"m\n\x0fLegacyAwayState\x12!\n\x1dLEGACY_AWAY_STATE_UNSPECIFIED\x10\x00\x12\x1a\n\x16LEGACY_AWAY_STATE_TRUE\x10\x01\x12\x1b\n\x17LEGACY_AWAY_STATE_FALSE\x10\x02\"\x93\x01\n\x10LegacyAwaySetter\x12\"\n\x1eLEGACY_AWAY_SETTER_UNSPECIFIED\x10\x00\x12\x1d\n\x19LEGACY_AWAY_SETTER_CLIENT\x10\x01\x12\x1e\n\x1aLEGACY_AWAY_SETTER_CONTROL\x10\x02\x12\x1c\n\x18LEGACY_AWAY_SETTER_CLOUD\x10\x03\"\x82\x04\n\x0fLegacyTouchedBy\x12!\n\x1dLEGACY_TOUCHED_BY_UNSPECIFIED\x10\x00\x12\x1c\n\x18LEGACY_TOUCHED_BY_NOBODY\x10\x01\x12\x1e\n\x1aLEGACY_TOUCHED_BY_LEARNING\x10\x02\x12\x1b\n\x17LEGACY_TOUCHED_BY_LOCAL\x10\x03\x12\x1c\n\x18LEGACY_TOUCHED_BY_REMOTE\x10\x04\x12\x19\n\x15LEGACY_TOUCHED_BY_WEB\x10\x05\x12\x1d\n\x19LEGACY_TOUCHED_BY_ANDROID\x10\x06\x12\x19\n\x15LEGACY_TOUCHED_BY_IOS\x10\x07\x12 \n\x1cLEGACY_TOUCHED_BY_WIN_MOBILE\x10\x08\x12\x1d\n\x19LEGACY_TOUCHED_BY_TUNE_UP\x10\t\x12\x18\n\x14LEGACY_TOUCHED_BY_DR\x10\n\x12\x19\n\x15LEGACY_TOUCHED_BY_TOU\x10\x0b\x12\x1e\n\x1aLEGACY_TOUCHED_BY_TOPAZ_CO\x10\x0c\x12 \n\x1cLEGACY_TOUCHED_BY_PROGRAMMER\x10\r\x12!\n\x1dLEGACY_TOUCHED_BY_TOPAZ_SMOKE\x10\x0e\x12#\n\x1fLEGACY_TOUCHED_BY_DEMAND_CHARGE\x10\x0f\"\xa0\x01\n\x0b\x41utoAskType\x12\x1d\n\x19\x41UTO_ASK_TYPE_UNSPECIFIED\x10\x00\x12\x1e\n\x1a\x41UTO_ASK_TYPE_AWAY_AND_ARM\x10\x01\x12!\n\x1d\x41UTO_ASK_TYPE_HOME_AND_DISARM\x10\x02\x12\x15\n\x11\x41UTO_ASK_TYPE_ARM\x10\x03\x12\x18\n\x14\x41UTO_ASK_TYPE_DISARM\x10\x04\"c\n\nAutoAskArm\x12\x1c\n\x18\x41UTO_ASK_ARM_UNSPECIFIED\x10\x00\x12\x19\n\x15\x41UTO_ASK_ARM_TYPE_ARM\x10\x01\x12\x1c\n\x18\x41UTO_ASK_ARM_TYPE_DISARM\x10\x02\"h\n\x0b\x41utoAskLock\x12\x1d\n\x19\x41UTO_ASK_LOCK_UNSPECIFIED\x10\x00\x12\x1b\n\x17\x41UTO_ASK_LOCK_TYPE_LOCK\x10\x01\x12\x1d\n\x19\x41UTO_ASK_LOCK_TYPE_UNLOCK\x10\x02\"\x8d\x01\n\x14\x41utoAskStructureMode\x12\'\n#AUTO_ASK_STRUCTURE_MODE_UNSPECIFIED\x10\x00\x12%\n!AUTO_ASK_STRUCTURE_MODE_TYPE_HOME\x10\x01\x12%\n!AUTO_ASK_STRUCTURE_MODE_TYPE_AWAY\x10\x02\"\xa3\x0b\n\x1aStructureModeSettingsTrait\x12\x17\n\x0f\x65nableAutoSleep\x18\x01 \x01(\x08\x12S\n\rsleepSchedule\x18\x02 \x03(\x0b\x32<.nest.trait.occupancy.StructureModeSettingsTrait.DayTimeSpan\x12\\\n\x19\x64\x65rivedDailySleepSchedule\x18\x03 \x01(\x0b\x32\x39.nest.trait.occupancy.StructureModeSettingsTrait.TimeSpan\x12?\n\x1boccupancySensorArmTimestamp\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a`\n\x08TimeSpan\x12*\n\tstartTime\x18\x01 \x01(\x0b\x32\x17.weave.common.TimeOfDay\x12(\n\x07\x65ndTime\x18\x02 \x01(\x0b\x32\x17.weave.common.TimeOfDay\x1a\xb7\x01\n\x0b\x44\x61yTimeSpan\x12)\n\x08startDay\x18\x01 \x01(\x0e\x32\x17.weave.common.DayOfWeek\x12*\n\tstartTime\x18\x02 \x01(\x0b\x32\x17.weave.common.TimeOfDay\x12\'\n\x06\x65ndDay\x18\x03 \x01(\x0e\x32\x17.weave.common.DayOfWeek\x12(\n\x07\x65ndTime\x18\x04 \x01(\x0b\x32\x17.weave.common.TimeOfDay\x1a\x9e\x01\n%BuildUniformDailySleepScheduleRequest\x12K\n\x08timeSpan\x18\x01 \x01(\x0b\x32\x39.nest.trait.occupancy.StructureModeSettingsTrait.TimeSpan\x12(\n\x06userId\x18\x02 \x01(\x0b\x32\x18.weave.common.ResourceId\x1a\x9b\x01\n&BuildUniformDailySleepScheduleResponse\x12q\n\x0cresponseType\x18\x01 \x01(\x0e\x32[.nest.trait.occupancy.StructureModeSettingsTrait.BuildUniformDailySleepScheduleResponseType\x1a\xaa\x02\n\x18SleepScheduleChangeEvent\x12\x17\n\x0f\x65nableAutoSleep\x18\x01 \x01(\x08\x12\x1c\n\x14priorEnableAutoSleep\x18\x02 \x01(\x08\x12S\n\rsleepSchedule\x18\x03 \x03(\x0b\x32<.nest.trait.occupancy.StructureModeSettingsTrait.DayTimeSpan\x12X\n\x12priorSleepSchedule\x18\x04 \x03(\x0b\x32<.nest.trait.occupancy.StructureModeSettingsTrait.DayTimeSpan\x12(\n\x06userId\x18\x05 \x01(\x0b\x32\x18.weave.common.ResourceId\"\xef\x01\n*BuildUniformDailySleepScheduleResponseType\x12@\n<BUILD_UNIFORM_DAILY_SLEEP_SCHEDULE_RESPONSE_TYPE_UNSPECIFIED\x10\x00\x12<\n8BUILD_UNIFORM_DAILY_SLEEP_SCHEDULE_RESPONSE_TYPE_SUCCESS\x10\x01\x12\x41\n=BUILD_UNIFORM_DAILY_SLEEP_SCHEDULE_RESPONSE_TYPE_FAIL_ALREADY\x10\x02\"\xf6\x04\n\x18StructureGeofencingTrait\x12u\n\x1egeofenceEnhancedAutoawayStatus\x18\x01 \x01(\x0e\x32M.nest.trait.occupancy.StructureGeofencingTrait.GeofenceEnhancedAutoAwayStatus\x1a\xfa\x01\n$StructureGeofenceStateAssertionEvent\x12=\n\x05state\x18\x01 \x01(\x0e\x32..nest.trait.occupancy.Geofencing.GeofenceState\x12(\n\x06userId\x18\x02 \x01(\x0b\x32\x18.weave.common.ResourceId\x12\x30\n\nrtsFenceId\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x37\n\x11rtsMobileDeviceId\x18\x04 \x01(\x0b\x32\x1c.google.protobuf.StringValue\"\xe5\x01\n\x1eGeofenceEnhancedAutoAwayStatus\x12\x32\n.GEOFENCE_ENHANCED_AUTO_AWAY_STATUS_UNSPECIFIED\x10\x00\x12.\n*GEOFENCE_ENHANCED_AUTO_AWAY_STATUS_NOT_SET\x10\x01\x12.\n*GEOFENCE_ENHANCED_AUTO_AWAY_STATUS_ENABLED\x10\x02\x12/\n+GEOFENCE_ENHANCED_AUTO_AWAY_STATUS_DISABLED\x10\x03\"\x91\x01\n\nGeofencing\"\x82\x01\n\rGeofenceState\x12\x1e\n\x1aGEOFENCE_STATE_UNSPECIFIED\x10\x00\x12\x19\n\x15GEOFENCE_STATE_INSIDE\x10\x01\x12\x1a\n\x16GEOFENCE_STATE_OUTSIDE\x10\x02\x12\x1a\n\x16GEOFENCE_STATE_UNKNOWN\x10\x03\"?\n\x1bOccupancyInputSettingsTrait\x12 \n\x18\x64\x65viceActivityConsidered\x18\x01 \x01(\x08\"C\n\x1eStructureModeCapabilitiesTrait\x12!\n\x19sleepStructureModeEnabled\x18\x01 \x01(\x08\x62\x06proto3')
-
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'nest.trait.occupancy_pb2', globals())
-if _descriptor._USE_C_DESCRIPTORS == False:
-
-  DESCRIPTOR._options = None
-  _STRUCTUREMODETRAIT_STRUCTUREMODETRACEEVENTSTEP_LABELSENTRY._options = None
-  _STRUCTUREMODETRAIT_STRUCTUREMODETRACEEVENTSTEP_LABELSENTRY._serialized_options = b'8\001'
-  _STRUCTUREMODETRAIT._serialized_start=138
-  _STRUCTUREMODETRAIT._serialized_end=9851
-  _STRUCTUREMODETRAIT_OCCUPANCY._serialized_start=856
-  _STRUCTUREMODETRAIT_OCCUPANCY._serialized_end=1112
-  _STRUCTUREMODETRAIT_ALLOWANCE._serialized_start=1115
-  _STRUCTUREMODETRAIT_ALLOWANCE._serialized_end=1269
-  _STRUCTUREMODETRAIT_PRIVATETRAITHANDLERSTATE._serialized_start=1271
-  _STRUCTUREMODETRAIT_PRIVATETRAITHANDLERSTATE._serialized_end=1324
-  _STRUCTUREMODETRAIT_STRUCTUREMODECHANGEREQUEST._serialized_start=1327
-  _STRUCTUREMODETRAIT_STRUCTUREMODECHANGEREQUEST._serialized_end=1661
-  _STRUCTUREMODETRAIT_NONPROPAGATINGCHANGEDETAILS._serialized_start=1664
-  _STRUCTUREMODETRAIT_NONPROPAGATINGCHANGEDETAILS._serialized_end=1834
-  _STRUCTUREMODETRAIT_STRUCTUREMODECHANGERESPONSE._serialized_start=1836
-  _STRUCTUREMODETRAIT_STRUCTUREMODECHANGERESPONSE._serialized_end=1961
-  _STRUCTUREMODETRAIT_STRUCTUREMODECOMPLETEUPDATEREQUEST._serialized_start=1964
-  _STRUCTUREMODETRAIT_STRUCTUREMODECOMPLETEUPDATEREQUEST._serialized_end=2656
-  _STRUCTUREMODETRAIT_STRUCTUREMODECOMPLETEUPDATERESPONSE._serialized_start=2659
-  _STRUCTUREMODETRAIT_STRUCTUREMODECOMPLETEUPDATERESPONSE._serialized_end=2904
-  _STRUCTUREMODETRAIT_LEGACYSTRUCTUREMODECHANGEREQUEST._serialized_start=2907
-  _STRUCTUREMODETRAIT_LEGACYSTRUCTUREMODECHANGEREQUEST._serialized_end=3185
-  _STRUCTUREMODETRAIT_CONSUMEOCCUPANCYSTATEBELIEFREQUEST._serialized_start=3188
-  _STRUCTUREMODETRAIT_CONSUMEOCCUPANCYSTATEBELIEFREQUEST._serialized_end=3405
-  _STRUCTUREMODETRAIT_CONSUMESECURITYARMSTATECHANGEREQUEST._serialized_start=3407
-  _STRUCTUREMODETRAIT_CONSUMESECURITYARMSTATECHANGEREQUEST._serialized_end=3445
-  _STRUCTUREMODETRAIT_CONSUMEBOLTACTUATORSTATECHANGEREQUEST._serialized_start=3447
-  _STRUCTUREMODETRAIT_CONSUMEBOLTACTUATORSTATECHANGEREQUEST._serialized_end=3486
-  _STRUCTUREMODETRAIT_CONSUMELEGACYSTRUCTUREMODECHANGEREQUEST._serialized_start=3489
-  _STRUCTUREMODETRAIT_CONSUMELEGACYSTRUCTUREMODECHANGEREQUEST._serialized_end=3860
-  _STRUCTUREMODETRAIT_STRUCTUREMODECHANGEEVENT._serialized_start=3863
-  _STRUCTUREMODETRAIT_STRUCTUREMODECHANGEEVENT._serialized_end=4371
-  _STRUCTUREMODETRAIT_OCCUPANCYCHANGEEVENT._serialized_start=4374
-  _STRUCTUREMODETRAIT_OCCUPANCYCHANGEEVENT._serialized_end=4543
-  _STRUCTUREMODETRAIT_ALLOWANCECHANGEEVENT._serialized_start=4546
-  _STRUCTUREMODETRAIT_ALLOWANCECHANGEEVENT._serialized_end=4715
-  _STRUCTUREMODETRAIT_AUTOASK._serialized_start=4718
-  _STRUCTUREMODETRAIT_AUTOASK._serialized_end=4968
-  _STRUCTUREMODETRAIT_AUTOASKEVENT._serialized_start=4971
-  _STRUCTUREMODETRAIT_AUTOASKEVENT._serialized_end=5225
-  _STRUCTUREMODETRAIT_ACTIVITYAGNOSTICSTRUCTUREMODECHANGEEVENT._serialized_start=5228
-  _STRUCTUREMODETRAIT_ACTIVITYAGNOSTICSTRUCTUREMODECHANGEEVENT._serialized_end=5543
-  _STRUCTUREMODETRAIT_STRUCTUREMODETRACEEVENTSTATE._serialized_start=5546
-  _STRUCTUREMODETRAIT_STRUCTUREMODETRACEEVENTSTATE._serialized_end=6182
-  _STRUCTUREMODETRAIT_STRUCTUREMODETRACEEVENTSTATECHANGE._serialized_start=6185
-  _STRUCTUREMODETRAIT_STRUCTUREMODETRACEEVENTSTATECHANGE._serialized_end=6389
-  _STRUCTUREMODETRAIT_STRUCTUREMODETRACEEVENTSTEP._serialized_start=6392
-  _STRUCTUREMODETRAIT_STRUCTUREMODETRACEEVENTSTEP._serialized_end=6608
-  _STRUCTUREMODETRAIT_STRUCTUREMODETRACEEVENTSTEP_LABELSENTRY._serialized_start=6563
-  _STRUCTUREMODETRAIT_STRUCTUREMODETRACEEVENTSTEP_LABELSENTRY._serialized_end=6608
-  _STRUCTUREMODETRAIT_STRUCTUREMODETRACEEVENT._serialized_start=6611
-  _STRUCTUREMODETRAIT_STRUCTUREMODETRACEEVENT._serialized_end=7038
-  _STRUCTUREMODETRAIT_STRUCTUREMODE._serialized_start=7041
-  _STRUCTUREMODETRAIT_STRUCTUREMODE._serialized_end=7193
-  _STRUCTUREMODETRAIT_ACTIVITY._serialized_start=7195
-  _STRUCTUREMODETRAIT_ACTIVITY._serialized_end=7275
-  _STRUCTUREMODETRAIT_PRESENCE._serialized_start=7277
-  _STRUCTUREMODETRAIT_PRESENCE._serialized_end=7382
-  _STRUCTUREMODETRAIT_MODESTICKINESS._serialized_start=7385
-  _STRUCTUREMODETRAIT_MODESTICKINESS._serialized_end=7526
-  _STRUCTUREMODETRAIT_STRUCTUREMODEREASON._serialized_start=7529
-  _STRUCTUREMODETRAIT_STRUCTUREMODEREASON._serialized_end=7887
-  _STRUCTUREMODETRAIT_NONPROPAGATINGCHANGESOURCETYPE._serialized_start=7889
-  _STRUCTUREMODETRAIT_NONPROPAGATINGCHANGESOURCETYPE._serialized_end=8016
-  _STRUCTUREMODETRAIT_STRUCTUREMODECHANGERESPONSETYPE._serialized_start=8019
-  _STRUCTUREMODETRAIT_STRUCTUREMODECHANGERESPONSETYPE._serialized_end=8208
-  _STRUCTUREMODETRAIT_STRUCTUREMODECOMPLETEUPDATERESPONSETYPE._serialized_start=8211
-  _STRUCTUREMODETRAIT_STRUCTUREMODECOMPLETEUPDATERESPONSETYPE._serialized_end=8559
-  _STRUCTUREMODETRAIT_LEGACYAWAYSTATE._serialized_start=8561
-  _STRUCTUREMODETRAIT_LEGACYAWAYSTATE._serialized_end=8670
-  _STRUCTUREMODETRAIT_LEGACYAWAYSETTER._serialized_start=8673
-  _STRUCTUREMODETRAIT_LEGACYAWAYSETTER._serialized_end=8820
-  _STRUCTUREMODETRAIT_LEGACYTOUCHEDBY._serialized_start=8823
-  _STRUCTUREMODETRAIT_LEGACYTOUCHEDBY._serialized_end=9337
-  _STRUCTUREMODETRAIT_AUTOASKTYPE._serialized_start=9340
-  _STRUCTUREMODETRAIT_AUTOASKTYPE._serialized_end=9500
-  _STRUCTUREMODETRAIT_AUTOASKARM._serialized_start=9502
-  _STRUCTUREMODETRAIT_AUTOASKARM._serialized_end=9601
-  _STRUCTUREMODETRAIT_AUTOASKLOCK._serialized_start=9603
-  _STRUCTUREMODETRAIT_AUTOASKLOCK._serialized_end=9707
-  _STRUCTUREMODETRAIT_AUTOASKSTRUCTUREMODE._serialized_start=9710
-  _STRUCTUREMODETRAIT_AUTOASKSTRUCTUREMODE._serialized_end=9851
-  _STRUCTUREMODESETTINGSTRAIT._serialized_start=9854
-  _STRUCTUREMODESETTINGSTRAIT._serialized_end=11297
-  _STRUCTUREMODESETTINGSTRAIT_TIMESPAN._serialized_start=10153
-  _STRUCTUREMODESETTINGSTRAIT_TIMESPAN._serialized_end=10249
-  _STRUCTUREMODESETTINGSTRAIT_DAYTIMESPAN._serialized_start=10252
-  _STRUCTUREMODESETTINGSTRAIT_DAYTIMESPAN._serialized_end=10435
-  _STRUCTUREMODESETTINGSTRAIT_BUILDUNIFORMDAILYSLEEPSCHEDULEREQUEST._serialized_start=10438
-  _STRUCTUREMODESETTINGSTRAIT_BUILDUNIFORMDAILYSLEEPSCHEDULEREQUEST._serialized_end=10596
-  _STRUCTUREMODESETTINGSTRAIT_BUILDUNIFORMDAILYSLEEPSCHEDULERESPONSE._serialized_start=10599
-  _STRUCTUREMODESETTINGSTRAIT_BUILDUNIFORMDAILYSLEEPSCHEDULERESPONSE._serialized_end=10754
-  _STRUCTUREMODESETTINGSTRAIT_SLEEPSCHEDULECHANGEEVENT._serialized_start=10757
-  _STRUCTUREMODESETTINGSTRAIT_SLEEPSCHEDULECHANGEEVENT._serialized_end=11055
-  _STRUCTUREMODESETTINGSTRAIT_BUILDUNIFORMDAILYSLEEPSCHEDULERESPONSETYPE._serialized_start=11058
-  _STRUCTUREMODESETTINGSTRAIT_BUILDUNIFORMDAILYSLEEPSCHEDULERESPONSETYPE._serialized_end=11297
-  _STRUCTUREGEOFENCINGTRAIT._serialized_start=11300
-  _STRUCTUREGEOFENCINGTRAIT._serialized_end=11930
-  _STRUCTUREGEOFENCINGTRAIT_STRUCTUREGEOFENCESTATEASSERTIONEVENT._serialized_start=11448
-  _STRUCTUREGEOFENCINGTRAIT_STRUCTUREGEOFENCESTATEASSERTIONEVENT._serialized_end=11698
-  _STRUCTUREGEOFENCINGTRAIT_GEOFENCEENHANCEDAUTOAWAYSTATUS._serialized_start=11701
-  _STRUCTUREGEOFENCINGTRAIT_GEOFENCEENHANCEDAUTOAWAYSTATUS._serialized_end=11930
-  _GEOFENCING._serialized_start=11933
-  _GEOFENCING._serialized_end=12078
-  _GEOFENCING_GEOFENCESTATE._serialized_start=11948
-  _GEOFENCING_GEOFENCESTATE._serialized_end=12078
-  _OCCUPANCYINPUTSETTINGSTRAIT._serialized_start=12080
-  _OCCUPANCYINPUTSETTINGSTRAIT._serialized_end=12143
-  _STRUCTUREMODECAPABILITIESTRAIT._serialized_start=12145
-  _STRUCTUREMODECAPABILITIESTRAIT._serialized_end=12212
-# @@protoc_insertion_point(module_scope)
@@ -1,47 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: weave/trait/power.proto
-"""Generated protocol buffer code."""
-from google.protobuf.internal import builder as _builder
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-from google.protobuf import wrappers_pb2 as google_dot_protobuf_dot_wrappers__pb2
-from . import common_pb2 as weave_dot_common__pb2
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x17weave/trait/power.proto\x12\x11weave.trait.power\x1a\x1egoogle/protobuf/wrappers.proto\x1a\x12weave/common.proto\"\xc6\x04\n\x1cPowerSourceCapabilitiesTrait\x12M\n\x04type\x18\x01 \x01(\x0e\x32?.weave.trait.power.PowerSourceCapabilitiesTrait.PowerSourceType\x12,\n\x0b\x64\x65scription\x18\x02 \x01(\x0b\x32\x17.weave.common.StringRef\x12\x16\n\x0enominalVoltage\x18\x03 \x01(\x02\x12\x33\n\x0emaximumCurrent\x18\x04 \x01(\x0b\x32\x1b.google.protobuf.FloatValue\x12[\n\x0b\x63urrentType\x18\x05 \x01(\x0e\x32\x46.weave.trait.power.PowerSourceCapabilitiesTrait.PowerSourceCurrentType\x12\r\n\x05order\x18\x06 \x01(\r\x12\x11\n\tremovable\x18\x07 \x01(\x08\"S\n\x0fPowerSourceType\x12!\n\x1dPOWER_SOURCE_TYPE_UNSPECIFIED\x10\x00\x12\x1d\n\x19POWER_SOURCE_TYPE_BATTERY\x10\x01\"\x87\x01\n\x16PowerSourceCurrentType\x12)\n%POWER_SOURCE_CURRENT_TYPE_UNSPECIFIED\x10\x00\x12 \n\x1cPOWER_SOURCE_CURRENT_TYPE_DC\x10\x01\x12 \n\x1cPOWER_SOURCE_CURRENT_TYPE_AC\x10\x02\"\x82\x07\n\x10PowerSourceTrait\x12M\n\x04type\x18\x01 \x01(\x0e\x32?.weave.trait.power.PowerSourceCapabilitiesTrait.PowerSourceType\x12\x34\n\x0f\x61ssessedVoltage\x18\x02 \x01(\x0b\x32\x1b.google.protobuf.FloatValue\x12\x34\n\x0f\x61ssessedCurrent\x18\x03 \x01(\x0b\x32\x1b.google.protobuf.FloatValue\x12\x36\n\x11\x61ssessedFrequency\x18\x04 \x01(\x0b\x32\x1b.google.protobuf.FloatValue\x12K\n\tcondition\x18\x05 \x01(\x0e\x32\x38.weave.trait.power.PowerSourceTrait.PowerSourceCondition\x12\x45\n\x06status\x18\x06 \x01(\x0e\x32\x35.weave.trait.power.PowerSourceTrait.PowerSourceStatus\x12\x0f\n\x07present\x18\x07 \x01(\x08\x1a\xad\x01\n\x17PowerSourceChangedEvent\x12K\n\tcondition\x18\x01 \x01(\x0e\x32\x38.weave.trait.power.PowerSourceTrait.PowerSourceCondition\x12\x45\n\x06status\x18\x02 \x01(\x0e\x32\x35.weave.trait.power.PowerSourceTrait.PowerSourceStatus\"\x87\x01\n\x14PowerSourceCondition\x12&\n\"POWER_SOURCE_CONDITION_UNSPECIFIED\x10\x00\x12\"\n\x1ePOWER_SOURCE_CONDITION_NOMINAL\x10\x01\x12#\n\x1fPOWER_SOURCE_CONDITION_CRITICAL\x10\x02\"\x9b\x01\n\x11PowerSourceStatus\x12#\n\x1fPOWER_SOURCE_STATUS_UNSPECIFIED\x10\x00\x12\x1e\n\x1aPOWER_SOURCE_STATUS_ACTIVE\x10\x01\x12\x1f\n\x1bPOWER_SOURCE_STATUS_STANDBY\x10\x02\x12 \n\x1cPOWER_SOURCE_STATUS_INACTIVE\x10\x03\"\x94\n\n\x17\x42\x61tteryPowerSourceTrait\x12M\n\x04type\x18\x01 \x01(\x0e\x32?.weave.trait.power.PowerSourceCapabilitiesTrait.PowerSourceType\x12\x34\n\x0f\x61ssessedVoltage\x18\x02 \x01(\x0b\x32\x1b.google.protobuf.FloatValue\x12\x34\n\x0f\x61ssessedCurrent\x18\x03 \x01(\x0b\x32\x1b.google.protobuf.FloatValue\x12\x36\n\x11\x61ssessedFrequency\x18\x04 \x01(\x0b\x32\x1b.google.protobuf.FloatValue\x12K\n\tcondition\x18\x05 \x01(\x0e\x32\x38.weave.trait.power.PowerSourceTrait.PowerSourceCondition\x12\x45\n\x06status\x18\x06 \x01(\x0e\x32\x35.weave.trait.power.PowerSourceTrait.PowerSourceStatus\x12\x0f\n\x07present\x18\x07 \x01(\x08\x12\x64\n\x14replacementIndicator\x18  \x01(\x0e\x32\x46.weave.trait.power.BatteryPowerSourceTrait.BatteryReplacementIndicator\x12N\n\tremaining\x18! \x01(\x0b\x32;.weave.trait.power.BatteryPowerSourceTrait.BatteryRemaining\x1au\n\x10\x42\x61tteryRemaining\x12\x35\n\x10remainingPercent\x18\x01 \x01(\x0b\x32\x1b.google.protobuf.FloatValue\x12*\n\rremainingTime\x18\x02 \x01(\x0b\x32\x13.weave.common.Timer\x1a\xdf\x02\n\x13\x42\x61tteryChangedEvent\x12K\n\tcondition\x18\x01 \x01(\x0e\x32\x38.weave.trait.power.PowerSourceTrait.PowerSourceCondition\x12\x45\n\x06status\x18\x02 \x01(\x0e\x32\x35.weave.trait.power.PowerSourceTrait.PowerSourceStatus\x12\x64\n\x14replacementIndicator\x18\x10 \x01(\x0e\x32\x46.weave.trait.power.BatteryPowerSourceTrait.BatteryReplacementIndicator\x12N\n\tremaining\x18\x11 \x01(\x0b\x32;.weave.trait.power.BatteryPowerSourceTrait.BatteryRemaining\"\xd1\x01\n\x1b\x42\x61tteryReplacementIndicator\x12-\n)BATTERY_REPLACEMENT_INDICATOR_UNSPECIFIED\x10\x00\x12,\n(BATTERY_REPLACEMENT_INDICATOR_NOT_AT_ALL\x10\x01\x12&\n\"BATTERY_REPLACEMENT_INDICATOR_SOON\x10\x02\x12-\n)BATTERY_REPLACEMENT_INDICATOR_IMMEDIATELY\x10\x03\x62\x06proto3')
-
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'weave.trait.power_pb2', globals())
-if _descriptor._USE_C_DESCRIPTORS == False:
-
-  DESCRIPTOR._options = None
-  _POWERSOURCECAPABILITIESTRAIT._serialized_start=99
-  _POWERSOURCECAPABILITIESTRAIT._serialized_end=681
-  _POWERSOURCECAPABILITIESTRAIT_POWERSOURCETYPE._serialized_start=460
-  _POWERSOURCECAPABILITIESTRAIT_POWERSOURCETYPE._serialized_end=543
-  _POWERSOURCECAPABILITIESTRAIT_POWERSOURCECURRENTTYPE._serialized_start=546
-  _POWERSOURCECAPABILITIESTRAIT_POWERSOURCECURRENTTYPE._serialized_end=681
-  _POWERSOURCETRAIT._serialized_start=684
-  _POWERSOURCETRAIT._serialized_end=1582
-  _POWERSOURCETRAIT_POWERSOURCECHANGEDEVENT._serialized_start=1113
-  _POWERSOURCETRAIT_POWERSOURCECHANGEDEVENT._serialized_end=1286
-  _POWERSOURCETRAIT_POWERSOURCECONDITION._serialized_start=1289
-  _POWERSOURCETRAIT_POWERSOURCECONDITION._serialized_end=1424
-  _POWERSOURCETRAIT_POWERSOURCESTATUS._serialized_start=1427
-  _POWERSOURCETRAIT_POWERSOURCESTATUS._serialized_end=1582
-  _BATTERYPOWERSOURCETRAIT._serialized_start=1585
-  _BATTERYPOWERSOURCETRAIT._serialized_end=2885
-  _BATTERYPOWERSOURCETRAIT_BATTERYREMAINING._serialized_start=2202
-  _BATTERYPOWERSOURCETRAIT_BATTERYREMAINING._serialized_end=2319
-  _BATTERYPOWERSOURCETRAIT_BATTERYCHANGEDEVENT._serialized_start=2322
-  _BATTERYPOWERSOURCETRAIT_BATTERYCHANGEDEVENT._serialized_end=2673
-  _BATTERYPOWERSOURCETRAIT_BATTERYREPLACEMENTINDICATOR._serialized_start=2676
-  _BATTERYPOWERSOURCETRAIT_BATTERYREPLACEMENTINDICATOR._serialized_end=2885
-# @@protoc_insertion_point(module_scope)
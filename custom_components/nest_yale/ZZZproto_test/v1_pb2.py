@@ -1,110 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: nestlabs/gateway/v1.proto
-"""Generated protocol buffer code."""
-from google.protobuf.internal import builder as _builder
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
-from google.protobuf import field_mask_pb2 as google_dot_protobuf_dot_field__mask__pb2
-from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
-from . import messages_pb2 as nest_dot_messages__pb2
-from . import common_pb2 as weave_dot_common__pb2
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x19nestlabs/gateway/v1.proto\x12\x13nestlabs.gateway.v1\x1a\x19google/protobuf/any.proto\x1a google/protobuf/field_mask.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x13nest/messages.proto\x1a\x12weave/common.proto\"\xd9\x02\n\x16TraitStateNotification\x12#\n\x05state\x18\x01 \x01(\x0b\x32\x14.google.protobuf.Any\x12-\n\tstateMask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\x12\x18\n\x10monotonicVersion\x18\x03 \x01(\x04\x12\\\n\x13notificationContext\x18\x04 \x01(\x0e\x32?.nestlabs.gateway.v1.TraitStateNotification.NotificationContext\x12\x18\n\x10publisherVersion\x18\x05 \x01(\x04\"Y\n\x13NotificationContext\x12$\n NOTIFICATION_CONTEXT_UNSPECIFIED\x10\x00\x12\x1c\n\x18INITIAL_OBSERVE_RESPONSE\x10\x01\"\xe3\x01\n\x17TraitEventsNotification\x12*\n\x06\x65vents\x18\x01 \x03(\x0b\x32\x1a.nestlabs.gateway.v1.Event\x12\x37\n\x13requestUtcTimestamp\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12%\n\x1drequestSystemTimeOffsetMillis\x18\x03 \x01(\x04\x12<\n\x18serviceReceivedTimestamp\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xd0\x03\n\x05\x45vent\x12\"\n\x04\x64\x61ta\x18\x01 \x01(\x0b\x32\x14.google.protobuf.Any\x12\x31\n\nimportance\x18\x02 \x01(\x0e\x32\x1d.weave.common.EventImportance\x12\x0f\n\x07\x65ventId\x18\x03 \x01(\x04\x12=\n\x16relatedEventImportance\x18\x04 \x01(\x0e\x32\x1d.weave.common.EventImportance\x12\x16\n\x0erelatedEventId\x18\x05 \x01(\x04\x12\x30\n\x0cutcTimestamp\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x1e\n\x16systemTimeOffsetMillis\x18\x07 \x01(\x04\x12\x19\n\x11relaybyResourceId\x18\x08 \x01(\t\x12\x19\n\x11subjectResourceId\x18\t \x01(\t\x12\x17\n\x0fsubjectPairerId\x18\n \x01(\t\x12\x17\n\x0fsubjectTypeName\x18\x0b \x01(\t\x12\x19\n\x11subjectInstanceId\x18\x0c \x01(\t\x12\x33\n\rschemaVersion\x18\r \x01(\x0b\x32\x1c.nest.messages.SchemaVersion\"I\n\x0cTraitRequest\x12\x12\n\nresourceId\x18\x01 \x01(\t\x12\x12\n\ntraitLabel\x18\x02 \x01(\t\x12\x11\n\trequestId\x18\x03 \x01(\t\"\x87\x04\n\x0eTraitOperation\x12\x37\n\x0ctraitRequest\x18\x01 \x01(\x0b\x32!.nestlabs.gateway.v1.TraitRequest\x12;\n\x08progress\x18\x02 \x01(\x0e\x32).nestlabs.gateway.v1.TraitOperation.State\x12%\n\x06status\x18\x03 \x01(\x0b\x32\x15.nest.messages.Status\x12.\n\x05\x65vent\x18\x04 \x01(\x0b\x32\x1f.nestlabs.gateway.v1.TraitEvent\x12%\n\x1dpublisherAcceptedStateVersion\x18\x05 \x01(\x04\x12\x32\n\x07\x63ommand\x18\x06 \x01(\x0b\x32!.nestlabs.gateway.v1.TraitCommand\x12<\n\x06update\x18\x07 \x01(\x0b\x32,.nestlabs.gateway.v1.TraitUpdateStateRequest\";\n\x0bRequestCase\x12\x13\n\x0fREQUEST_NOT_SET\x10\x00\x12\x0b\n\x07\x43OMMAND\x10\x06\x12\n\n\x06UPDATE\x10\x07\"R\n\x05State\x12\x15\n\x11STATE_UNSPECIFIED\x10\x00\x12\n\n\x06QUEUED\x10\x01\x12\x0b\n\x07PENDING\x10\x02\x12\x0b\n\x07STARTED\x10\x03\x12\x0c\n\x08\x43OMPLETE\x10\x04\"\xde\x01\n\x13TraitObserveRequest\x12\x37\n\x0ctraitRequest\x18\x01 \x01(\x0b\x32!.nestlabs.gateway.v1.TraitRequest\x12-\n\tfieldMask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\x12\x1e\n\x16monotonicVersionFilter\x18\x03 \x01(\x04\x12\x1d\n\x15includeConfirmedState\x18\x04 \x01(\x08\x12 \n\x18includePendingOperations\x18\x05 \x01(\x08\"\xcb\x02\n\x14TraitObserveResponse\x12\x37\n\x0ctraitRequest\x18\x01 \x01(\x0b\x32!.nestlabs.gateway.v1.TraitRequest\x12\x42\n\racceptedState\x18\x02 \x01(\x0b\x32+.nestlabs.gateway.v1.TraitStateNotification\x12\x31\n\ttraitInfo\x18\x03 \x01(\x0b\x32\x1e.nestlabs.gateway.v1.TraitInfo\x12\x43\n\x0e\x63onfirmedState\x18\x04 \x01(\x0b\x32+.nestlabs.gateway.v1.TraitStateNotification\x12>\n\x11pendingOperations\x18\x05 \x03(\x0b\x32#.nestlabs.gateway.v1.TraitOperation\"\xdf\x01\n\x14TraitGetStateRequest\x12\x37\n\x0ctraitRequest\x18\x01 \x01(\x0b\x32!.nestlabs.gateway.v1.TraitRequest\x12-\n\tfieldMask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\x12\x1e\n\x16monotonicVersionFilter\x18\x03 \x01(\x04\x12\x1d\n\x15includeConfirmedState\x18\x04 \x01(\x08\x12 \n\x18includePendingOperations\x18\x05 \x01(\x08\"\x8c\x02\n\x15TraitGetStateResponse\x12\x37\n\x0ctraitRequest\x18\x01 \x01(\x0b\x32!.nestlabs.gateway.v1.TraitRequest\x12\x42\n\racceptedState\x18\x02 \x01(\x0b\x32+.nestlabs.gateway.v1.TraitStateNotification\x12\x31\n\ttraitInfo\x18\x03 \x01(\x0b\x32\x1e.nestlabs.gateway.v1.TraitInfo\x12\x43\n\x0e\x63onfirmedState\x18\x04 \x01(\x0b\x32+.nestlabs.gateway.v1.TraitStateNotification\"S\n\tTraitInfo\x12\x11\n\ttraitType\x18\x01 \x01(\t\x12\x33\n\rschemaVersion\x18\x02 \x01(\x0b\x32\x1c.nest.messages.SchemaVersion\"\xfa\x01\n\x17TraitUpdateStateRequest\x12\x37\n\x0ctraitRequest\x18\x01 \x01(\x0b\x32!.nestlabs.gateway.v1.TraitRequest\x12#\n\x05state\x18\x02 \x01(\x0b\x32\x14.google.protobuf.Any\x12-\n\tstateMask\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\x12\x1d\n\x15matchPublisherVersion\x18\x04 \x01(\x04\x12\x33\n\rschemaVersion\x18\x05 \x01(\x0b\x32\x1c.nest.messages.SchemaVersion\"\xd0\x01\n\x12TraitNotifyRequest\x12\x37\n\x0ctraitRequest\x18\x01 \x01(\x0b\x32!.nestlabs.gateway.v1.TraitRequest\x12\x43\n\x0e\x63onfirmedState\x18\x02 \x01(\x0b\x32+.nestlabs.gateway.v1.TraitStateNotification\x12<\n\x06\x65vents\x18\x03 \x01(\x0b\x32,.nestlabs.gateway.v1.TraitEventsNotification\"N\n\x13TraitNotifyResponse\x12\x37\n\x0ctraitRequest\x18\x01 \x01(\x0b\x32!.nestlabs.gateway.v1.TraitRequest\"1\n\nTraitEvent\x12#\n\x05\x65vent\x18\x01 \x01(\x0b\x32\x14.google.protobuf.Any\"\x9e\x02\n\x0cTraitCommand\x12\x37\n\x0ctraitRequest\x18\x01 \x01(\x0b\x32!.nestlabs.gateway.v1.TraitRequest\x12%\n\x07\x63ommand\x18\x02 \x01(\x0b\x32\x14.google.protobuf.Any\x12.\n\nexpiryTime\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x15\n\rauthenticator\x18\x04 \x01(\x0c\x12\x1d\n\x15matchPublisherVersion\x18\x05 \x01(\x04\x12\x33\n\rschemaVersion\x18\x06 \x01(\x0b\x32\x1c.nest.messages.SchemaVersion\x12\x13\n\x0bnamespaceId\x18\x07 \x01(\t\":\n\x11WeaveStatusReport\x12\x11\n\tprofileId\x18\x01 \x01(\r\x12\x12\n\nstatusCode\x18\x02 \x01(\r\"M\n\x0fResourceRequest\x12\x12\n\nresourceId\x18\x01 \x01(\t\x12\x11\n\trequestId\x18\x02 \x01(\t\x12\x13\n\x0bnamespaceId\x18\x03 \x01(\t\"\xdc\x01\n\x16ResourceObserveRequest\x12=\n\x0fresourceRequest\x18\x01 \x01(\x0b\x32$.nestlabs.gateway.v1.ResourceRequest\x12\x42\n\x12traitStateObserves\x18\x02 \x03(\x0b\x32&.nestlabs.gateway.v1.TraitStateObserve\x12\x1d\n\x15includeConfirmedState\x18\x03 \x01(\x08\x12 \n\x18includePendingOperations\x18\x04 \x01(\x08\"v\n\x11TraitStateObserve\x12\x12\n\ntraitLabel\x18\x01 \x01(\t\x12-\n\tfieldMask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\x12\x1e\n\x16monotonicVersionFilter\x18\x03 \x01(\x04\"\xd4\x01\n\x17ResourceObserveResponse\x12=\n\x0fresourceRequest\x18\x01 \x01(\x0b\x32$.nestlabs.gateway.v1.ResourceRequest\x12\x37\n\x0cresourceInfo\x18\x02 \x01(\x0b\x32!.nestlabs.gateway.v1.ResourceInfo\x12\x41\n\x0etraitResponses\x18\x03 \x03(\x0b\x32).nestlabs.gateway.v1.TraitObserveResponse\"\x90\x02\n\x0cResourceInfo\x12\x14\n\x0cresourceType\x18\x04 \x01(\t\x12\x45\n\ntraitInfos\x18\x05 \x03(\x0b\x32\x31.nestlabs.gateway.v1.ResourceInfo.TraitInfosEntry\x12\x32\n\nifaceInfos\x18\x06 \x03(\x0b\x32\x1e.nestlabs.gateway.v1.IfaceInfo\x12\x1c\n\x14\x63urrentSchemaVersion\x18\x07 \x01(\r\x1aQ\n\x0fTraitInfosEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12-\n\x05value\x18\x02 \x01(\x0b\x32\x1e.nestlabs.gateway.v1.TraitInfo:\x02\x38\x01\"\x91\x01\n\tIfaceInfo\x12\x11\n\tifaceType\x18\x01 \x01(\t\x12<\n\x0fifaceTraitInfos\x18\x02 \x03(\x0b\x32#.nestlabs.gateway.v1.IfaceTraitInfo\x12\x33\n\rschemaVersion\x18\x06 \x01(\x0b\x32\x1c.nest.messages.SchemaVersion\"E\n\x0eIfaceTraitInfo\x12\x17\n\x0fifaceTraitLabel\x18\x01 \x01(\t\x12\x1a\n\x12resourceTraitLabel\x18\x02 \x01(\t\"\xdb\x01\n\x17ResourceGetStateRequest\x12=\n\x0fresourceRequest\x18\x01 \x01(\x0b\x32$.nestlabs.gateway.v1.ResourceRequest\x12@\n\x11resourceGetStates\x18\x02 \x03(\x0b\x32%.nestlabs.gateway.v1.ResourceGetState\x12\x1d\n\x15includeConfirmedState\x18\x03 \x01(\x08\x12 \n\x18includePendingOperations\x18\x04 \x01(\x08\"u\n\x10ResourceGetState\x12\x12\n\ntraitLabel\x18\x01 \x01(\t\x12-\n\tfieldMask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\x12\x1e\n\x16monotonicVersionFilter\x18\x03 \x01(\x04\"\xd6\x01\n\x18ResourceGetStateResponse\x12=\n\x0fresourceRequest\x18\x01 \x01(\x0b\x32$.nestlabs.gateway.v1.ResourceRequest\x12\x37\n\x0cresourceInfo\x18\x02 \x01(\x0b\x32!.nestlabs.gateway.v1.ResourceInfo\x12\x42\n\x0etraitResponses\x18\x03 \x03(\x0b\x32*.nestlabs.gateway.v1.TraitGetStateResponse\"\xea\x01\n\x15ResourceNotifyRequest\x12=\n\x0fresourceRequest\x18\x01 \x01(\x0b\x32$.nestlabs.gateway.v1.ResourceRequest\x12G\n\x15resourceStateNotifies\x18\x02 \x03(\x0b\x32(.nestlabs.gateway.v1.ResourceStateNotify\x12I\n\x16resourceEventsNotifies\x18\x03 \x03(\x0b\x32).nestlabs.gateway.v1.ResourceEventsNotify\"n\n\x13ResourceStateNotify\x12\x12\n\ntraitLabel\x18\x01 \x01(\t\x12\x43\n\x0e\x63onfirmedState\x18\x02 \x01(\x0b\x32+.nestlabs.gateway.v1.TraitStateNotification\"h\n\x14ResourceEventsNotify\x12\x12\n\ntraitLabel\x18\x01 \x01(\t\x12<\n\x06\x65vents\x18\x02 \x01(\x0b\x32,.nestlabs.gateway.v1.TraitEventsNotification\"\x99\x01\n\x16ResourceNotifyResponse\x12=\n\x0fresourceRequest\x18\x01 \x01(\x0b\x32$.nestlabs.gateway.v1.ResourceRequest\x12@\n\x0etraitResponses\x18\x02 \x03(\x0b\x32(.nestlabs.gateway.v1.TraitNotifyResponse\"\x97\x01\n\x16ResourceCommandRequest\x12=\n\x0fresourceRequest\x18\x01 \x01(\x0b\x32$.nestlabs.gateway.v1.ResourceRequest\x12>\n\x10resourceCommands\x18\x02 \x03(\x0b\x32$.nestlabs.gateway.v1.ResourceCommand\"\xe7\x01\n\x0fResourceCommand\x12\x12\n\ntraitLabel\x18\x01 \x01(\t\x12%\n\x07\x63ommand\x18\x02 \x01(\x0b\x32\x14.google.protobuf.Any\x12.\n\nexpiryTime\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x15\n\rauthenticator\x18\x04 \x01(\x0c\x12\x1d\n\x15matchPublisherVersion\x18\x05 \x01(\x04\x12\x33\n\rschemaVersion\x18\x06 \x01(\x0b\x32\x1c.nest.messages.SchemaVersion\"\x96\x01\n\x17ResourceCommandResponse\x12=\n\x0fresourceRequest\x18\x01 \x01(\x0b\x32$.nestlabs.gateway.v1.ResourceRequest\x12<\n\x0ftraitOperations\x18\x02 \x03(\x0b\x32#.nestlabs.gateway.v1.TraitOperation\"^\n\x1c\x42\x61tchTraitUpdateStateRequest\x12>\n\x08requests\x18\x01 \x03(\x0b\x32,.nestlabs.gateway.v1.TraitUpdateStateRequest\"R\n\x13\x42\x61tchTraitOperation\x12;\n\x0etraitOperation\x18\x01 \x03(\x0b\x32#.nestlabs.gateway.v1.TraitOperation\"\x7f\n\x1eResourceCommandResponseFromAPI\x12L\n\x16resouceCommandResponse\x18\x01 \x03(\x0b\x32,.nestlabs.gateway.v1.ResourceCommandResponse\x12\x0f\n\x07unknown\x18\x02 \x01(\tb\x06proto3')
-
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'nestlabs.gateway.v1_pb2', globals())
-if _descriptor._USE_C_DESCRIPTORS == False:
-
-  DESCRIPTOR._options = None
-  _RESOURCEINFO_TRAITINFOSENTRY._options = None
-  _RESOURCEINFO_TRAITINFOSENTRY._serialized_options = b'8\001'
-  _TRAITSTATENOTIFICATION._serialized_start=186
-  _TRAITSTATENOTIFICATION._serialized_end=531
-  _TRAITSTATENOTIFICATION_NOTIFICATIONCONTEXT._serialized_start=442
-  _TRAITSTATENOTIFICATION_NOTIFICATIONCONTEXT._serialized_end=531
-  _TRAITEVENTSNOTIFICATION._serialized_start=534
-  _TRAITEVENTSNOTIFICATION._serialized_end=761
-  _EVENT._serialized_start=764
-  _EVENT._serialized_end=1228
-  _TRAITREQUEST._serialized_start=1230
-  _TRAITREQUEST._serialized_end=1303
-  _TRAITOPERATION._serialized_start=1306
-  _TRAITOPERATION._serialized_end=1825
-  _TRAITOPERATION_REQUESTCASE._serialized_start=1682
-  _TRAITOPERATION_REQUESTCASE._serialized_end=1741
-  _TRAITOPERATION_STATE._serialized_start=1743
-  _TRAITOPERATION_STATE._serialized_end=1825
-  _TRAITOBSERVEREQUEST._serialized_start=1828
-  _TRAITOBSERVEREQUEST._serialized_end=2050
-  _TRAITOBSERVERESPONSE._serialized_start=2053
-  _TRAITOBSERVERESPONSE._serialized_end=2384
-  _TRAITGETSTATEREQUEST._serialized_start=2387
-  _TRAITGETSTATEREQUEST._serialized_end=2610
-  _TRAITGETSTATERESPONSE._serialized_start=2613
-  _TRAITGETSTATERESPONSE._serialized_end=2881
-  _TRAITINFO._serialized_start=2883
-  _TRAITINFO._serialized_end=2966
-  _TRAITUPDATESTATEREQUEST._serialized_start=2969
-  _TRAITUPDATESTATEREQUEST._serialized_end=3219
-  _TRAITNOTIFYREQUEST._serialized_start=3222
-  _TRAITNOTIFYREQUEST._serialized_end=3430
-  _TRAITNOTIFYRESPONSE._serialized_start=3432
-  _TRAITNOTIFYRESPONSE._serialized_end=3510
-  _TRAITEVENT._serialized_start=3512
-  _TRAITEVENT._serialized_end=3561
-  _TRAITCOMMAND._serialized_start=3564
-  _TRAITCOMMAND._serialized_end=3850
-  _WEAVESTATUSREPORT._serialized_start=3852
-  _WEAVESTATUSREPORT._serialized_end=3910
-  _RESOURCEREQUEST._serialized_start=3912
-  _RESOURCEREQUEST._serialized_end=3989
-  _RESOURCEOBSERVEREQUEST._serialized_start=3992
-  _RESOURCEOBSERVEREQUEST._serialized_end=4212
-  _TRAITSTATEOBSERVE._serialized_start=4214
-  _TRAITSTATEOBSERVE._serialized_end=4332
-  _RESOURCEOBSERVERESPONSE._serialized_start=4335
-  _RESOURCEOBSERVERESPONSE._serialized_end=4547
-  _RESOURCEINFO._serialized_start=4550
-  _RESOURCEINFO._serialized_end=4822
-  _RESOURCEINFO_TRAITINFOSENTRY._serialized_start=4741
-  _RESOURCEINFO_TRAITINFOSENTRY._serialized_end=4822
-  _IFACEINFO._serialized_start=4825
-  _IFACEINFO._serialized_end=4970
-  _IFACETRAITINFO._serialized_start=4972
-  _IFACETRAITINFO._serialized_end=5041
-  _RESOURCEGETSTATEREQUEST._serialized_start=5044
-  _RESOURCEGETSTATEREQUEST._serialized_end=5263
-  _RESOURCEGETSTATE._serialized_start=5265
-  _RESOURCEGETSTATE._serialized_end=5382
-  _RESOURCEGETSTATERESPONSE._serialized_start=5385
-  _RESOURCEGETSTATERESPONSE._serialized_end=5599
-  _RESOURCENOTIFYREQUEST._serialized_start=5602
-  _RESOURCENOTIFYREQUEST._serialized_end=5836
-  _RESOURCESTATENOTIFY._serialized_start=5838
-  _RESOURCESTATENOTIFY._serialized_end=5948
-  _RESOURCEEVENTSNOTIFY._serialized_start=5950
-  _RESOURCEEVENTSNOTIFY._serialized_end=6054
-  _RESOURCENOTIFYRESPONSE._serialized_start=6057
-  _RESOURCENOTIFYRESPONSE._serialized_end=6210
-  _RESOURCECOMMANDREQUEST._serialized_start=6213
-  _RESOURCECOMMANDREQUEST._serialized_end=6364
-  _RESOURCECOMMAND._serialized_start=6367
-  _RESOURCECOMMAND._serialized_end=6598
-  _RESOURCECOMMANDRESPONSE._serialized_start=6601
-  _RESOURCECOMMANDRESPONSE._serialized_end=6751
-  _BATCHTRAITUPDATESTATEREQUEST._serialized_start=6753
-  _BATCHTRAITUPDATESTATEREQUEST._serialized_end=6847
-  _BATCHTRAITOPERATION._serialized_start=6849
-  _BATCHTRAITOPERATION._serialized_end=6931
-  _RESOURCECOMMANDRESPONSEFROMAPI._serialized_start=6933
-  _RESOURCECOMMANDRESPONSEFROMAPI._serialized_end=7060
-# @@protoc_insertion_point(module_scope)
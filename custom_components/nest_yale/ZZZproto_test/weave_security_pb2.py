@@ -1,145 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: weave/trait/security.proto
-"""Generated protocol buffer code."""
-from google.protobuf.internal import builder as _builder
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
-from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
-from google.protobuf import wrappers_pb2 as google_dot_protobuf_dot_wrappers__pb2
-from . import common_pb2 as weave_dot_common__pb2
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1aweave/trait/security.proto\x12\x14weave.trait.security\x1a\x1egoogle/protobuf/duration.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1egoogle/protobuf/wrappers.proto\x1a\x12weave/common.proto\"\xbc\x0c\n\x19UserPincodesSettingsTrait\x12W\n\x0cuserPincodes\x18\x01 \x03(\x0b\x32\x41.weave.trait.security.UserPincodesSettingsTrait.UserPincodesEntry\x1ap\n\x11UserPincodesEntry\x12\x0b\n\x03key\x18\x01 \x01(\r\x12J\n\x05value\x18\x02 \x01(\x0b\x32;.weave.trait.security.UserPincodesSettingsTrait.UserPincode:\x02\x38\x01\x1a\x86\x01\n\x0bUserPincode\x12(\n\x06userId\x18\x01 \x01(\x0b\x32\x18.weave.common.ResourceId\x12\x0f\n\x07pincode\x18\x02 \x01(\x0c\x12<\n\x18pincodeCredentialEnabled\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x1ai\n\x15SetUserPincodeRequest\x12P\n\x0buserPincode\x18\x01 \x01(\x0b\x32;.weave.trait.security.UserPincodesSettingsTrait.UserPincode\x1ak\n\x16SetUserPincodeResponse\x12Q\n\x06status\x18\x01 \x01(\x0e\x32\x41.weave.trait.security.UserPincodesSettingsTrait.PincodeErrorCodes\x1a\x41\n\x15GetUserPincodeRequest\x12(\n\x06userId\x18\x01 \x01(\x0b\x32\x18.weave.common.ResourceId\x1aj\n\x16GetUserPincodeResponse\x12P\n\x0buserPincode\x18\x01 \x01(\x0b\x32;.weave.trait.security.UserPincodesSettingsTrait.UserPincode\x1a\x44\n\x18\x44\x65leteUserPincodeRequest\x12(\n\x06userId\x18\x01 \x01(\x0b\x32\x18.weave.common.ResourceId\x1an\n\x19\x44\x65leteUserPincodeResponse\x12Q\n\x06status\x18\x01 \x01(\x0e\x32\x41.weave.trait.security.UserPincodesSettingsTrait.PincodeErrorCodes\x1a\x97\x01\n\x16UserPincodeChangeEvent\x12(\n\x06userId\x18\x01 \x01(\x0b\x32\x18.weave.common.ResourceId\x12S\n\x06reason\x18\x02 \x01(\x0e\x32\x43.weave.trait.security.UserPincodesSettingsTrait.PincodeChangeReason\"\xee\x02\n\x11PincodeErrorCodes\x12#\n\x1fPINCODE_ERROR_CODES_UNSPECIFIED\x10\x00\x12)\n%PINCODE_ERROR_CODES_DUPLICATE_PINCODE\x10\x01\x12)\n%PINCODE_ERROR_CODES_TOO_MANY_PINCODES\x10\x02\x12\'\n#PINCODE_ERROR_CODES_INVALID_PINCODE\x10\x03\x12/\n+PINCODE_ERROR_CODES_SUCCESS_PINCODE_DELETED\x10\x04\x12.\n*PINCODE_ERROR_CODES_SUCCESS_PINCODE_STATUS\x10\x05\x12\'\n#PINCODE_ERROR_CODES_DUPLICATE_NONCE\x10\x06\x12+\n\'PINCODE_ERROR_CODES_EXCEEDED_RATE_LIMIT\x10\x07\"\x82\x01\n\x13PincodeChangeReason\x12%\n!PINCODE_CHANGE_REASON_UNSPECIFIED\x10\x00\x12 \n\x1cPINCODE_CHANGE_REASON_UPDATE\x10\x01\x12\"\n\x1ePINCODE_CHANGE_REASON_DELETION\x10\x02\"\xeb\x07\n\x1bUserNFCTokenManagementTrait\x1a~\n\x1bTransferUserNFCTokenRequest\x12.\n\x0ctargetUserId\x18\x01 \x01(\x0b\x32\x18.weave.common.ResourceId\x12/\n\rtokenDeviceId\x18\x02 \x01(\x0b\x32\x18.weave.common.ResourceId\x1a\x65\n!SetUserNFCTokenEnableStateRequest\x12/\n\rtokenDeviceId\x18\x01 \x01(\x0b\x32\x18.weave.common.ResourceId\x12\x0f\n\x07\x65nabled\x18\x02 \x01(\x08\x1a\x98\x01\n\"AuthUserNFCTokenToStructureRequest\x12/\n\rtokenDeviceId\x18\x01 \x01(\x0b\x32\x18.weave.common.ResourceId\x12\x12\n\nauthorized\x18\x02 \x01(\x08\x12-\n\x0bstructureId\x18\x03 \x01(\x0b\x32\x18.weave.common.ResourceId\x1a\xb6\x02\n\x1bUserNFCTokenManagementEvent\x12`\n\x17nfcTokenManagementEvent\x18\x01 \x01(\x0e\x32?.weave.trait.security.UserNFCTokenManagementTrait.NFCTokenEvent\x12O\n\x0cuserNfcToken\x18\x02 \x01(\x0b\x32\x39.weave.trait.security.UserNFCTokensTrait.UserNFCTokenData\x12\x32\n\x10initiatingUserId\x18\x03 \x01(\x0b\x32\x18.weave.common.ResourceId\x12\x30\n\x0epreviousUserId\x18\x04 \x01(\x0b\x32\x18.weave.common.ResourceId\"\x90\x02\n\rNFCTokenEvent\x12\x1f\n\x1bNFC_TOKEN_EVENT_UNSPECIFIED\x10\x00\x12\x1a\n\x16NFC_TOKEN_EVENT_PAIRED\x10\x01\x12\x1c\n\x18NFC_TOKEN_EVENT_UNPAIRED\x10\x02\x12\"\n\x1eNFC_TOKEN_EVENT_STRUCTURE_AUTH\x10\x03\x12$\n NFC_TOKEN_EVENT_STRUCTURE_UNAUTH\x10\x04\x12\x1f\n\x1bNFC_TOKEN_EVENT_TRANSFERRED\x10\x05\x12\x1c\n\x18NFC_TOKEN_EVENT_DISABLED\x10\x06\x12\x1b\n\x17NFC_TOKEN_EVENT_ENABLED\x10\x07\"\xad\x10\n\rBoltLockTrait\x12<\n\x05state\x18\x01 \x01(\x0e\x32-.weave.trait.security.BoltLockTrait.BoltState\x12L\n\ractuatorState\x18\x02 \x01(\x0e\x32\x35.weave.trait.security.BoltLockTrait.BoltActuatorState\x12H\n\x0blockedState\x18\x03 \x01(\x0e\x32\x33.weave.trait.security.BoltLockTrait.BoltLockedState\x12N\n\rboltLockActor\x18\x04 \x01(\x0b\x32\x37.weave.trait.security.BoltLockTrait.BoltLockActorStruct\x12<\n\x18lockedStateLastChangedAt\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a\xb5\x01\n\x13\x42oltLockActorStruct\x12G\n\x06method\x18\x01 \x01(\x0e\x32\x37.weave.trait.security.BoltLockTrait.BoltLockActorMethod\x12,\n\noriginator\x18\x02 \x01(\x0b\x32\x18.weave.common.ResourceId\x12\'\n\x05\x61gent\x18\x03 \x01(\x0b\x32\x18.weave.common.ResourceId\x1a\xa5\x01\n\x15\x42oltLockChangeRequest\x12<\n\x05state\x18\x01 \x01(\x0e\x32-.weave.trait.security.BoltLockTrait.BoltState\x12N\n\rboltLockActor\x18\x04 \x01(\x0b\x32\x37.weave.trait.security.BoltLockTrait.BoltLockActorStruct\x1a\xc4\x02\n\x1c\x42oltActuatorStateChangeEvent\x12<\n\x05state\x18\x01 \x01(\x0e\x32-.weave.trait.security.BoltLockTrait.BoltState\x12L\n\ractuatorState\x18\x02 \x01(\x0e\x32\x35.weave.trait.security.BoltLockTrait.BoltActuatorState\x12H\n\x0blockedState\x18\x03 \x01(\x0e\x32\x33.weave.trait.security.BoltLockTrait.BoltLockedState\x12N\n\rboltLockActor\x18\x04 \x01(\x0b\x32\x37.weave.trait.security.BoltLockTrait.BoltLockActorStruct\"Z\n\tBoltState\x12\x1a\n\x16\x42OLT_STATE_UNSPECIFIED\x10\x00\x12\x18\n\x14\x42OLT_STATE_RETRACTED\x10\x01\x12\x17\n\x13\x42OLT_STATE_EXTENDED\x10\x02\"\xed\x03\n\x13\x42oltLockActorMethod\x12&\n\"BOLT_LOCK_ACTOR_METHOD_UNSPECIFIED\x10\x00\x12 \n\x1c\x42OLT_LOCK_ACTOR_METHOD_OTHER\x10\x01\x12#\n\x1f\x42OLT_LOCK_ACTOR_METHOD_PHYSICAL\x10\x02\x12%\n!BOLT_LOCK_ACTOR_METHOD_KEYPAD_PIN\x10\x03\x12)\n%BOLT_LOCK_ACTOR_METHOD_LOCAL_IMPLICIT\x10\x04\x12/\n+BOLT_LOCK_ACTOR_METHOD_REMOTE_USER_EXPLICIT\x10\x05\x12/\n+BOLT_LOCK_ACTOR_METHOD_REMOTE_USER_IMPLICIT\x10\x06\x12,\n(BOLT_LOCK_ACTOR_METHOD_REMOTE_USER_OTHER\x10\x07\x12*\n&BOLT_LOCK_ACTOR_METHOD_REMOTE_DELEGATE\x10\x08\x12-\n)BOLT_LOCK_ACTOR_METHOD_LOW_POWER_SHUTDOWN\x10\t\x12*\n&BOLT_LOCK_ACTOR_METHOD_VOICE_ASSISTANT\x10\n\"\xb0\x02\n\x11\x42oltActuatorState\x12#\n\x1f\x42OLT_ACTUATOR_STATE_UNSPECIFIED\x10\x00\x12\x1a\n\x16\x42OLT_ACTUATOR_STATE_OK\x10\x01\x12\x1f\n\x1b\x42OLT_ACTUATOR_STATE_LOCKING\x10\x02\x12!\n\x1d\x42OLT_ACTUATOR_STATE_UNLOCKING\x10\x03\x12\x1e\n\x1a\x42OLT_ACTUATOR_STATE_MOVING\x10\x04\x12&\n\"BOLT_ACTUATOR_STATE_JAMMED_LOCKING\x10\x05\x12(\n$BOLT_ACTUATOR_STATE_JAMMED_UNLOCKING\x10\x06\x12$\n BOLT_ACTUATOR_STATE_JAMMED_OTHER\x10\x07\"\x91\x01\n\x0f\x42oltLockedState\x12!\n\x1d\x42OLT_LOCKED_STATE_UNSPECIFIED\x10\x00\x12\x1e\n\x1a\x42OLT_LOCKED_STATE_UNLOCKED\x10\x01\x12\x1c\n\x18\x42OLT_LOCKED_STATE_LOCKED\x10\x02\x12\x1d\n\x19\x42OLT_LOCKED_STATE_UNKNOWN\x10\x03\"\xa1\t\n\x16SensorAssociationTrait\x12P\n\x07sensors\x18\x01 \x03(\x0b\x32?.weave.trait.security.SensorAssociationTrait.SensorDeviceStatus\x12:\n\x18\x61ssociatedSensorDeviceId\x18\x02 \x01(\x0b\x32\x18.weave.common.ResourceId\x1aS\n\x1fSetUserSensorAssociationRequest\x12\x30\n\x0esensorDeviceId\x18\x01 \x01(\x0b\x32\x18.weave.common.ResourceId\x1ak\n SetUserSensorAssociationResponse\x12G\n\x06status\x18\x01 \x01(\x0e\x32\x37.weave.trait.security.SensorAssociationTrait.StatusCode\x1a\x92\x02\n\x12SensorDeviceStatus\x12*\n\x08\x64\x65viceId\x18\x01 \x01(\x0b\x32\x18.weave.common.ResourceId\x12\x65\n\x17sensorAssociationStatus\x18\x02 \x01(\x0e\x32\x44.weave.trait.security.SensorAssociationTrait.SensorAssociationStatus\x12i\n\x1bsensorAssociationStatusList\x18\x03 \x03(\x0e\x32\x44.weave.trait.security.SensorAssociationTrait.SensorAssociationStatus\"\x82\x02\n\nStatusCode\x12\x1b\n\x17STATUS_CODE_UNSPECIFIED\x10\x00\x12\x17\n\x13STATUS_CODE_SUCCESS\x10\x01\x12\x17\n\x13STATUS_CODE_FAILURE\x10\x02\x12/\n+STATUS_CODE_SENSOR_ALREADY_ASSOCIATED_OTHER\x10\x03\x12.\n*STATUS_CODE_SENSOR_ALREADY_ASSOCIATED_SELF\x10\x04\x12\x1e\n\x1aSTATUS_CODE_SENSOR_INVALID\x10\x05\x12$\n STATUS_CODE_USER_SETTING_INVALID\x10\x06\"\x9c\x02\n\x17SensorAssociationStatus\x12)\n%SENSOR_ASSOCIATION_STATUS_UNSPECIFIED\x10\x00\x12-\n)SENSOR_ASSOCIATION_STATUS_ASSOCIATED_SELF\x10\x01\x12.\n*SENSOR_ASSOCIATION_STATUS_ASSOCIATED_OTHER\x10\x02\x12%\n!SENSOR_ASSOCIATION_STATUS_DEFAULT\x10\x03\x12&\n\"SENSOR_ASSOCIATION_STATUS_ELIGIBLE\x10\x04\x12(\n$SENSOR_ASSOCIATION_STATUS_INELIGIBLE\x10\x05\"\xed\x06\n\x11PincodeInputTrait\x12T\n\x11pincodeInputState\x18\x01 \x01(\x0e\x32\x39.weave.trait.security.PincodeInputTrait.PincodeInputState\x1a\xed\x01\n\x10KeypadEntryEvent\x12<\n\x18pincodeCredentialEnabled\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12(\n\x06userId\x18\x02 \x01(\x0b\x32\x18.weave.common.ResourceId\x12\x19\n\x11invalidEntryCount\x18\x03 \x01(\r\x12V\n\x12pincodeEntryResult\x18\x04 \x01(\x0e\x32:.weave.trait.security.PincodeInputTrait.PincodeEntryResult\x1a\x9e\x01\n\x1cPincodeInputStateChangeEvent\x12T\n\x11pincodeInputState\x18\x01 \x01(\x0e\x32\x39.weave.trait.security.PincodeInputTrait.PincodeInputState\x12(\n\x06userId\x18\x02 \x01(\x0b\x32\x18.weave.common.ResourceId\"\xf3\x01\n\x12PincodeEntryResult\x12$\n PINCODE_ENTRY_RESULT_UNSPECIFIED\x10\x00\x12\x30\n,PINCODE_ENTRY_RESULT_FAILURE_INVALID_PINCODE\x10\x01\x12\x30\n,PINCODE_ENTRY_RESULT_FAILURE_OUT_OF_SCHEDULE\x10\x02\x12\x31\n-PINCODE_ENTRY_RESULT_FAILURE_PINCODE_DISABLED\x10\x03\x12 \n\x1cPINCODE_ENTRY_RESULT_SUCCESS\x10\x04\"{\n\x11PincodeInputState\x12#\n\x1fPINCODE_INPUT_STATE_UNSPECIFIED\x10\x00\x12\x1f\n\x1bPINCODE_INPUT_STATE_ENABLED\x10\x01\x12 \n\x1cPINCODE_INPUT_STATE_DISABLED\x10\x02\"\xf5\x03\n\x0bTamperTrait\x12\x42\n\x0btamperState\x18\x01 \x01(\x0e\x32-.weave.trait.security.TamperTrait.TamperState\x12\x33\n\x0f\x66irstObservedAt\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x35\n\x11\x66irstObservedAtMs\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a\x14\n\x12ResetTamperRequest\x1a\xa5\x01\n\x16TamperStateChangeEvent\x12\x42\n\x0btamperState\x18\x01 \x01(\x0e\x32-.weave.trait.security.TamperTrait.TamperState\x12G\n\x10priorTamperState\x18\x02 \x01(\x0e\x32-.weave.trait.security.TamperTrait.TamperState\"x\n\x0bTamperState\x12\x1c\n\x18TAMPER_STATE_UNSPECIFIED\x10\x00\x12\x16\n\x12TAMPER_STATE_CLEAR\x10\x01\x12\x19\n\x15TAMPER_STATE_TAMPERED\x10\x02\x12\x18\n\x14TAMPER_STATE_UNKNOWN\x10\x03\"\xab\x05\n\x17UserNFCTokenAccessTrait\x1a\xc6\x01\n\x17UserNFCTokenAccessEvent\x12V\n\x06result\x18\x01 \x01(\x0e\x32\x46.weave.trait.security.UserNFCTokenAccessTrait.UserNFCTokenAccessResult\x12)\n\x07tokenId\x18\x02 \x01(\x0b\x32\x18.weave.common.ResourceId\x12(\n\x06userId\x18\x03 \x01(\x0b\x32\x18.weave.common.ResourceId\"\xc6\x03\n\x18UserNFCTokenAccessResult\x12,\n(USER_NFC_TOKEN_ACCESS_RESULT_UNSPECIFIED\x10\x00\x12(\n$USER_NFC_TOKEN_ACCESS_RESULT_SUCCESS\x10\x01\x12\x36\n2USER_NFC_TOKEN_ACCESS_RESULT_FAILURE_UNKNOWN_TOKEN\x10\x02\x12\x36\n2USER_NFC_TOKEN_ACCESS_RESULT_FAILURE_INVALID_TOKEN\x10\x03\x12\x38\n4USER_NFC_TOKEN_ACCESS_RESULT_FAILURE_OUT_OF_SCHEDULE\x10\x04\x12\x37\n3USER_NFC_TOKEN_ACCESS_RESULT_FAILURE_TOKEN_DISABLED\x10\x05\x12\x38\n4USER_NFC_TOKEN_ACCESS_RESULT_FAILURE_INVALID_VERSION\x10\x06\x12\x35\n1USER_NFC_TOKEN_ACCESS_RESULT_FAILURE_OTHER_REASON\x10\x07\"\xf2\x02\n\x12UserNFCTokensTrait\x12P\n\ruserNfcTokens\x18\x01 \x03(\x0b\x32\x39.weave.trait.security.UserNFCTokensTrait.UserNFCTokenData\x1a\x89\x02\n\x10UserNFCTokenData\x12(\n\x06userId\x18\x01 \x01(\x0b\x32\x18.weave.common.ResourceId\x12/\n\rtokenDeviceId\x18\x02 \x01(\x0b\x32\x18.weave.common.ResourceId\x12\x0f\n\x07\x65nabled\x18\x03 \x01(\x08\x12.\n\x0cstructureIds\x18\x04 \x03(\x0b\x32\x18.weave.common.ResourceId\x12\r\n\x05label\x18\x05 \x01(\t\x12J\n\x08metadata\x18\x06 \x01(\x0b\x32\x38.weave.trait.security.UserNFCTokenMetadataTrait.Metadata\"\x9c\x01\n\x19UserNFCTokenMetadataTrait\x12J\n\x08metadata\x18\x01 \x01(\x0b\x32\x38.weave.trait.security.UserNFCTokenMetadataTrait.Metadata\x1a\x33\n\x08Metadata\x12\x14\n\x0cserialNumber\x18\x01 \x01(\t\x12\x11\n\ttagNumber\x18\x02 \x01(\t\"\x9d\x03\n\x19\x42oltLockCapabilitiesTrait\x12\x62\n\nhandedness\x18\x01 \x01(\x0e\x32N.weave.trait.security.BoltLockCapabilitiesTrait.BoltLockCapabilitiesHandedness\x12\x38\n\x15maxAutoRelockDuration\x18\x02 \x01(\x0b\x32\x19.google.protobuf.Duration\"\xe1\x01\n\x1e\x42oltLockCapabilitiesHandedness\x12\x31\n-BOLT_LOCK_CAPABILITIES_HANDEDNESS_UNSPECIFIED\x10\x00\x12+\n\'BOLT_LOCK_CAPABILITIES_HANDEDNESS_RIGHT\x10\x01\x12*\n&BOLT_LOCK_CAPABILITIES_HANDEDNESS_LEFT\x10\x02\x12\x33\n/BOLT_LOCK_CAPABILITIES_HANDEDNESS_FIXED_UNKNOWN\x10\x03\"q\n\x1dUserPincodesCapabilitiesTrait\x12\x18\n\x10minPincodeLength\x18\x01 \x01(\r\x12\x18\n\x10maxPincodeLength\x18\x02 \x01(\r\x12\x1c\n\x14maxPincodesSupported\x18\x03 \x01(\r\"d\n\x15\x42oltLockSettingsTrait\x12\x14\n\x0c\x61utoRelockOn\x18\x01 \x01(\x08\x12\x35\n\x12\x61utoRelockDuration\x18\x02 \x01(\x0b\x32\x19.google.protobuf.Duration\"\x80\x01\n\x16\x44oorCheckSettingsTrait\x12\x34\n\x10\x64oorCheckEnabled\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12\x30\n\x0esensorDeviceId\x18\x02 \x01(\x0b\x32\x18.weave.common.ResourceId\"\xe8\x02\n\x19UserNFCTokenSettingsTrait\x12Y\n\ruserNfcTokens\x18\x01 \x03(\x0b\x32\x42.weave.trait.security.UserNFCTokenSettingsTrait.UserNfcTokensEntry\x1ar\n\x12UserNfcTokensEntry\x12\x0b\n\x03key\x18\x01 \x01(\r\x12K\n\x05value\x18\x02 \x01(\x0b\x32<.weave.trait.security.UserNFCTokenSettingsTrait.UserNFCToken:\x02\x38\x01\x1a|\n\x0cUserNFCToken\x12(\n\x06userId\x18\x01 \x01(\x0b\x32\x18.weave.common.ResourceId\x12/\n\rtokenDeviceId\x18\x02 \x01(\x0b\x32\x18.weave.common.ResourceId\x12\x11\n\tpublicKey\x18\x03 \x01(\x0c\"r\n\x19PincodeInputSettingsTrait\x12\x1b\n\x13wrongEntryCodeLimit\x18\x01 \x01(\r\x12\x38\n\x15wrongEntryDisableTime\x18\x02 \x01(\x0b\x32\x19.google.protobuf.Durationb\x06proto3')
-
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'weave.trait.security_pb2', globals())
-if _descriptor._USE_C_DESCRIPTORS == False:
-
-  DESCRIPTOR._options = None
-  _USERPINCODESSETTINGSTRAIT_USERPINCODESENTRY._options = None
-  _USERPINCODESSETTINGSTRAIT_USERPINCODESENTRY._serialized_options = b'8\001'
-  _USERNFCTOKENSETTINGSTRAIT_USERNFCTOKENSENTRY._options = None
-  _USERNFCTOKENSETTINGSTRAIT_USERNFCTOKENSENTRY._serialized_options = b'8\001'
-  _USERPINCODESSETTINGSTRAIT._serialized_start=170
-  _USERPINCODESSETTINGSTRAIT._serialized_end=1766
-  _USERPINCODESSETTINGSTRAIT_USERPINCODESENTRY._serialized_start=288
-  _USERPINCODESSETTINGSTRAIT_USERPINCODESENTRY._serialized_end=400
-  _USERPINCODESSETTINGSTRAIT_USERPINCODE._serialized_start=403
-  _USERPINCODESSETTINGSTRAIT_USERPINCODE._serialized_end=537
-  _USERPINCODESSETTINGSTRAIT_SETUSERPINCODEREQUEST._serialized_start=539
-  _USERPINCODESSETTINGSTRAIT_SETUSERPINCODEREQUEST._serialized_end=644
-  _USERPINCODESSETTINGSTRAIT_SETUSERPINCODERESPONSE._serialized_start=646
-  _USERPINCODESSETTINGSTRAIT_SETUSERPINCODERESPONSE._serialized_end=753
-  _USERPINCODESSETTINGSTRAIT_GETUSERPINCODEREQUEST._serialized_start=755
-  _USERPINCODESSETTINGSTRAIT_GETUSERPINCODEREQUEST._serialized_end=820
-  _USERPINCODESSETTINGSTRAIT_GETUSERPINCODERESPONSE._serialized_start=822
-  _USERPINCODESSETTINGSTRAIT_GETUSERPINCODERESPONSE._serialized_end=928
-  _USERPINCODESSETTINGSTRAIT_DELETEUSERPINCODEREQUEST._serialized_start=930
-  _USERPINCODESSETTINGSTRAIT_DELETEUSERPINCODEREQUEST._serialized_end=998
-  _USERPINCODESSETTINGSTRAIT_DELETEUSERPINCODERESPONSE._serialized_start=1000
-  _USERPINCODESSETTINGSTRAIT_DELETEUSERPINCODERESPONSE._serialized_end=1110
-  _USERPINCODESSETTINGSTRAIT_USERPINCODECHANGEEVENT._serialized_start=1113
-  _USERPINCODESSETTINGSTRAIT_USERPINCODECHANGEEVENT._serialized_end=1264
-  _USERPINCODESSETTINGSTRAIT_PINCODEERRORCODES._serialized_start=1267
-  _USERPINCODESSETTINGSTRAIT_PINCODEERRORCODES._serialized_end=1633
-  _USERPINCODESSETTINGSTRAIT_PINCODECHANGEREASON._serialized_start=1636
-  _USERPINCODESSETTINGSTRAIT_PINCODECHANGEREASON._serialized_end=1766
-  _USERNFCTOKENMANAGEMENTTRAIT._serialized_start=1769
-  _USERNFCTOKENMANAGEMENTTRAIT._serialized_end=2772
-  _USERNFCTOKENMANAGEMENTTRAIT_TRANSFERUSERNFCTOKENREQUEST._serialized_start=1800
-  _USERNFCTOKENMANAGEMENTTRAIT_TRANSFERUSERNFCTOKENREQUEST._serialized_end=1926
-  _USERNFCTOKENMANAGEMENTTRAIT_SETUSERNFCTOKENENABLESTATEREQUEST._serialized_start=1928
-  _USERNFCTOKENMANAGEMENTTRAIT_SETUSERNFCTOKENENABLESTATEREQUEST._serialized_end=2029
-  _USERNFCTOKENMANAGEMENTTRAIT_AUTHUSERNFCTOKENTOSTRUCTUREREQUEST._serialized_start=2032
-  _USERNFCTOKENMANAGEMENTTRAIT_AUTHUSERNFCTOKENTOSTRUCTUREREQUEST._serialized_end=2184
-  _USERNFCTOKENMANAGEMENTTRAIT_USERNFCTOKENMANAGEMENTEVENT._serialized_start=2187
-  _USERNFCTOKENMANAGEMENTTRAIT_USERNFCTOKENMANAGEMENTEVENT._serialized_end=2497
-  _USERNFCTOKENMANAGEMENTTRAIT_NFCTOKENEVENT._serialized_start=2500
-  _USERNFCTOKENMANAGEMENTTRAIT_NFCTOKENEVENT._serialized_end=2772
-  _BOLTLOCKTRAIT._serialized_start=2775
-  _BOLTLOCKTRAIT._serialized_end=4868
-  _BOLTLOCKTRAIT_BOLTLOCKACTORSTRUCT._serialized_start=3149
-  _BOLTLOCKTRAIT_BOLTLOCKACTORSTRUCT._serialized_end=3330
-  _BOLTLOCKTRAIT_BOLTLOCKCHANGEREQUEST._serialized_start=3333
-  _BOLTLOCKTRAIT_BOLTLOCKCHANGEREQUEST._serialized_end=3498
-  _BOLTLOCKTRAIT_BOLTACTUATORSTATECHANGEEVENT._serialized_start=3501
-  _BOLTLOCKTRAIT_BOLTACTUATORSTATECHANGEEVENT._serialized_end=3825
-  _BOLTLOCKTRAIT_BOLTSTATE._serialized_start=3827
-  _BOLTLOCKTRAIT_BOLTSTATE._serialized_end=3917
-  _BOLTLOCKTRAIT_BOLTLOCKACTORMETHOD._serialized_start=3920
-  _BOLTLOCKTRAIT_BOLTLOCKACTORMETHOD._serialized_end=4413
-  _BOLTLOCKTRAIT_BOLTACTUATORSTATE._serialized_start=4416
-  _BOLTLOCKTRAIT_BOLTACTUATORSTATE._serialized_end=4720
-  _BOLTLOCKTRAIT_BOLTLOCKEDSTATE._serialized_start=4723
-  _BOLTLOCKTRAIT_BOLTLOCKEDSTATE._serialized_end=4868
-  _SENSORASSOCIATIONTRAIT._serialized_start=4871
-  _SENSORASSOCIATIONTRAIT._serialized_end=6056
-  _SENSORASSOCIATIONTRAIT_SETUSERSENSORASSOCIATIONREQUEST._serialized_start=5039
-  _SENSORASSOCIATIONTRAIT_SETUSERSENSORASSOCIATIONREQUEST._serialized_end=5122
-  _SENSORASSOCIATIONTRAIT_SETUSERSENSORASSOCIATIONRESPONSE._serialized_start=5124
-  _SENSORASSOCIATIONTRAIT_SETUSERSENSORASSOCIATIONRESPONSE._serialized_end=5231
-  _SENSORASSOCIATIONTRAIT_SENSORDEVICESTATUS._serialized_start=5234
-  _SENSORASSOCIATIONTRAIT_SENSORDEVICESTATUS._serialized_end=5508
-  _SENSORASSOCIATIONTRAIT_STATUSCODE._serialized_start=5511
-  _SENSORASSOCIATIONTRAIT_STATUSCODE._serialized_end=5769
-  _SENSORASSOCIATIONTRAIT_SENSORASSOCIATIONSTATUS._serialized_start=5772
-  _SENSORASSOCIATIONTRAIT_SENSORASSOCIATIONSTATUS._serialized_end=6056
-  _PINCODEINPUTTRAIT._serialized_start=6059
-  _PINCODEINPUTTRAIT._serialized_end=6936
-  _PINCODEINPUTTRAIT_KEYPADENTRYEVENT._serialized_start=6167
-  _PINCODEINPUTTRAIT_KEYPADENTRYEVENT._serialized_end=6404
-  _PINCODEINPUTTRAIT_PINCODEINPUTSTATECHANGEEVENT._serialized_start=6407
-  _PINCODEINPUTTRAIT_PINCODEINPUTSTATECHANGEEVENT._serialized_end=6565
-  _PINCODEINPUTTRAIT_PINCODEENTRYRESULT._serialized_start=6568
-  _PINCODEINPUTTRAIT_PINCODEENTRYRESULT._serialized_end=6811
-  _PINCODEINPUTTRAIT_PINCODEINPUTSTATE._serialized_start=6813
-  _PINCODEINPUTTRAIT_PINCODEINPUTSTATE._serialized_end=6936
-  _TAMPERTRAIT._serialized_start=6939
-  _TAMPERTRAIT._serialized_end=7440
-  _TAMPERTRAIT_RESETTAMPERREQUEST._serialized_start=7130
-  _TAMPERTRAIT_RESETTAMPERREQUEST._serialized_end=7150
-  _TAMPERTRAIT_TAMPERSTATECHANGEEVENT._serialized_start=7153
-  _TAMPERTRAIT_TAMPERSTATECHANGEEVENT._serialized_end=7318
-  _TAMPERTRAIT_TAMPERSTATE._serialized_start=7320
-  _TAMPERTRAIT_TAMPERSTATE._serialized_end=7440
-  _USERNFCTOKENACCESSTRAIT._serialized_start=7443
-  _USERNFCTOKENACCESSTRAIT._serialized_end=8126
-  _USERNFCTOKENACCESSTRAIT_USERNFCTOKENACCESSEVENT._serialized_start=7471
-  _USERNFCTOKENACCESSTRAIT_USERNFCTOKENACCESSEVENT._serialized_end=7669
-  _USERNFCTOKENACCESSTRAIT_USERNFCTOKENACCESSRESULT._serialized_start=7672
-  _USERNFCTOKENACCESSTRAIT_USERNFCTOKENACCESSRESULT._serialized_end=8126
-  _USERNFCTOKENSTRAIT._serialized_start=8129
-  _USERNFCTOKENSTRAIT._serialized_end=8499
-  _USERNFCTOKENSTRAIT_USERNFCTOKENDATA._serialized_start=8234
-  _USERNFCTOKENSTRAIT_USERNFCTOKENDATA._serialized_end=8499
-  _USERNFCTOKENMETADATATRAIT._serialized_start=8502
-  _USERNFCTOKENMETADATATRAIT._serialized_end=8658
-  _USERNFCTOKENMETADATATRAIT_METADATA._serialized_start=8607
-  _USERNFCTOKENMETADATATRAIT_METADATA._serialized_end=8658
-  _BOLTLOCKCAPABILITIESTRAIT._serialized_start=8661
-  _BOLTLOCKCAPABILITIESTRAIT._serialized_end=9074
-  _BOLTLOCKCAPABILITIESTRAIT_BOLTLOCKCAPABILITIESHANDEDNESS._serialized_start=8849
-  _BOLTLOCKCAPABILITIESTRAIT_BOLTLOCKCAPABILITIESHANDEDNESS._serialized_end=9074
-  _USERPINCODESCAPABILITIESTRAIT._serialized_start=9076
-  _USERPINCODESCAPABILITIESTRAIT._serialized_end=9189
-  _BOLTLOCKSETTINGSTRAIT._serialized_start=9191
-  _BOLTLOCKSETTINGSTRAIT._serialized_end=9291
-  _DOORCHECKSETTINGSTRAIT._serialized_start=9294
-  _DOORCHECKSETTINGSTRAIT._serialized_end=9422
-  _USERNFCTOKENSETTINGSTRAIT._serialized_start=9425
-  _USERNFCTOKENSETTINGSTRAIT._serialized_end=9785
-  _USERNFCTOKENSETTINGSTRAIT_USERNFCTOKENSENTRY._serialized_start=9545
-  _USERNFCTOKENSETTINGSTRAIT_USERNFCTOKENSENTRY._serialized_end=9659
-  _USERNFCTOKENSETTINGSTRAIT_USERNFCTOKEN._serialized_start=9661
-  _USERNFCTOKENSETTINGSTRAIT_USERNFCTOKEN._serialized_end=9785
-  _PINCODEINPUTSETTINGSTRAIT._serialized_start=9787
-  _PINCODEINPUTSETTINGSTRAIT._serialized_end=9901
-# @@protoc_insertion_point(module_scope)
@@ -1,15 +1,24 @@
 #!/usr/bin/env python3
-import logging
 import asyncio
+import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from .const import DOMAIN, PLATFORMS
+from .const import (
+    ACTIVITY_LOG_MAX_SEGMENTS,
+    ACTIVITY_LOG_RETENTION_DAYS,
+    ACTIVITY_LOG_SEGMENT_RECORDS,
+    DOMAIN,
+    PLATFORMS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Nest Yale component."""
     _LOGGER.debug("Starting async_setup for Nest Yale component")
+    from .services import async_setup_services  # noqa: WPS433
+
+    async_setup_services(hass)
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -25,33 +34,55 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                       issue_token, api_key, cookies)
         return False
 
+    if entry.unique_id in (None, DOMAIN):
+        # Entries from the single-account era: key them by account like new ones
+        from .config_flow import account_unique_id  # noqa: WPS433
+
+        unique_id = account_unique_id(issue_token)
+        if not any(other.unique_id == unique_id for other in hass.config_entries.async_entries(DOMAIN)):
+            hass.config_entries.async_update_entry(entry, unique_id=unique_id)
+
     try:
         # Import heavy protobuf / API modules lazily so config flow import is cheap
         from .api_client import NestAPIClient  # noqa: WPS433 (runtime import intentional)
         from .coordinator import NestCoordinator  # noqa: WPS433
+        from .storage import NestYaleStore  # noqa: WPS433
+        from .activity_log import ActivityLog  # noqa: WPS433
+        from . import trait_registry  # noqa: WPS433
 
+        trait_registry.check_protobuf_backend()
+        store = NestYaleStore(hass, entry.entry_id)
         _LOGGER.debug("Creating NestAPIClient")
-        conn = await NestAPIClient.create(hass, issue_token, api_key, cookies)
+        conn = NestAPIClient(hass, issue_token, api_key, cookies)
+        stored = await store.async_load()
+        restored_locks = conn.restore_state(stored)
         _LOGGER.debug("Creating NestCoordinator")
-        coordinator = NestCoordinator(hass, conn)
-        _LOGGER.debug("Setting up coordinator")
-        await coordinator.async_setup()
-        # Retry initial data fetch if empty
-        for _ in range(3):
-            await coordinator.async_refresh()
-            if coordinator.data:
-                break
-            _LOGGER.warning("Coordinator data still empty, retrying...")
-            await asyncio.sleep(2)
-        _LOGGER.debug("Coordinator setup complete, initial data: %s", coordinator.data)
-        if not coordinator.data:
-            _LOGGER.error("Failed to fetch initial data after retries")
+        activity_log = ActivityLog(
+            hass.config.path(".storage", f"{DOMAIN}_activity", entry.entry_id),
+            ACTIVITY_LOG_SEGMENT_RECORDS,
+            ACTIVITY_LOG_MAX_SEGMENTS,
+            ACTIVITY_LOG_RETENTION_DAYS,
+        )
+        coordinator = NestCoordinator(hass, conn, store, activity_log)
+        coordinator.battery_history.restore(stored.get("battery_history"))
+        if restored_locks:
+            # Warm start: entities come up from the persisted snapshot and are
+            # reconciled once auth and the observe stream catch up.
+            coordinator.async_restore(restored_locks)
+            entry.async_create_background_task(
+                hass, _async_warm_setup(hass, entry, coordinator), f"{DOMAIN}_setup_{entry.entry_id}"
+            )
+        else:
+            _LOGGER.debug("Setting up coordinator")
+            await coordinator.async_setup()
+            _LOGGER.debug("Coordinator setup complete, initial data: %s", coordinator.data)
+            if not coordinator.data:
+                _LOGGER.warning("No lock data yet, waiting for observer updates")
     except Exception as e:
         _LOGGER.error("Failed to initialize API client or coordinator: %s", e, exc_info=True)
         return False
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
-    hass.data[DOMAIN].setdefault("entities", [])
 
     _LOGGER.debug("Forwarding setup to platforms: %s", PLATFORMS)
     try:
@@ -64,6 +95,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("Nest Yale Lock integration successfully set up for entry_id: %s", entry.entry_id)
     return True
 
+async def _async_warm_setup(hass: HomeAssistant, entry: ConfigEntry, coordinator) -> None:
+    """Finish a warm start in the background; reload the entry if it fails."""
+    from .backoff import reconnect_delay  # noqa: WPS433
+
+    try:
+        await coordinator.async_setup()
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        # Nothing else would notice: entities keep the restored state with no stream behind them
+        delay = reconnect_delay(1)
+        _LOGGER.error("Background setup failed, reloading entry in %.0fs: %s", delay, e, exc_info=True)
+        await asyncio.sleep(delay)
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug("Unloading Nest Yale Lock integration for entry_id: %s", entry.entry_id)
@@ -73,11 +119,20 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.debug("Unloading coordinator")
         await coordinator.async_unload()
 
-    hass.data[DOMAIN]["entities"] = []
     try:
         result = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
         _LOGGER.debug("Unload platforms result: %s", result)
         return result
     except Exception as e:
         _LOGGER.error("Failed to unload platforms: %s", e, exc_info=True)
-        return False
\ No newline at end of file
+        return False
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop persisted token, snapshot and activity log when the entry is deleted."""
+    import shutil  # noqa: WPS433
+    from .storage import NestYaleStore  # noqa: WPS433
+
+    await NestYaleStore(hass, entry.entry_id).async_remove()
+    await hass.async_add_executor_job(
+        shutil.rmtree, hass.config.path(".storage", f"{DOMAIN}_activity", entry.entry_id), True
+    )
@@ -0,0 +1,372 @@
+"""Append-only on-disk log of lock activity, queryable by lock and time range.
+
+Each config entry logs to its own directory of segment files. A segment is
+a header followed by fixed-size little-endian records, so record N lives at
+a known offset and is read straight out of an ``mmap`` without parsing
+anything before it. Strings (lock and user resource IDs) are stored once in
+``strings.json`` and referenced by index.
+
+Every record carries the index of the previous record for the same lock in
+its segment, which chains a lock's activity together. A query for one lock
+walks that chain backwards from the lock's newest record. Each segment also
+keeps a sparse time index: the min/max timestamp of every block of
+``BLOCK_RECORDS`` records, used to skip blocks outside the requested range.
+
+Segments are sealed and rotated at a fixed record count. Sealed segments
+store their index in a sidecar so reopening them reads no records. After
+each rotation, expired records are compacted out of old segments and the
+oldest segments are dropped past the segment cap, which bounds disk use.
+
+All methods block on file I/O; call them from an executor.
+"""
+import os
+import json
+import mmap
+import time
+import struct
+import logging
+import threading
+from .models import ActorMethod, ActuatorState, LockActivity
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"NYAL"
+VERSION = 1
+# timestamp, previous record of the same lock, lock, originator, agent,
+# actor method, action, actuator state, source
+RECORD = struct.Struct("<dIHHHBBBBxx")
+HEADER = struct.Struct("<4sHH16x")  # magic, version, record size; padded to one record
+NO_RECORD = 0xFFFFFFFF
+NO_STRING = 0xFFFF
+BLOCK_RECORDS = 64
+
+ACTIONS = ("unlocked", "locked", "moving", "jammed")
+SOURCES = ("state", "event")
+
+
+def _action_code(activity):
+    return ACTIONS.index(activity.action)
+
+
+class _Segment:
+    """One segment file and its in-memory index."""
+
+    def __init__(self, path, seq):
+        self.path = path
+        self.seq = seq
+        self.count = 0
+        self.blocks = []  # [min_ts, max_ts] per BLOCK_RECORDS records
+        self.tails = {}  # lock string index -> index of its newest record
+
+    @property
+    def index_path(self):
+        return self.path + ".idx"
+
+    @property
+    def min_ts(self):
+        return min(block[0] for block in self.blocks) if self.blocks else None
+
+    @property
+    def max_ts(self):
+        return max(block[1] for block in self.blocks) if self.blocks else None
+
+    def note(self, index, timestamp, device):
+        block = index // BLOCK_RECORDS
+        if block == len(self.blocks):
+            self.blocks.append([timestamp, timestamp])
+        else:
+            bounds = self.blocks[block]
+            bounds[0] = min(bounds[0], timestamp)
+            bounds[1] = max(bounds[1], timestamp)
+        self.tails[device] = index
+        self.count = index + 1
+
+    def save_index(self):
+        with open(self.index_path, "w", encoding="utf-8") as handle:
+            json.dump({"count": self.count, "blocks": self.blocks, "tails": self.tails}, handle)
+
+    def load_index(self):
+        """Read the sidecar of a sealed segment; False when missing or stale."""
+        try:
+            with open(self.index_path, encoding="utf-8") as handle:
+                index = json.load(handle)
+        except (OSError, ValueError):
+            return False
+        if index.get("count") != self._records_on_disk():
+            return False
+        self.count = index["count"]
+        self.blocks = index["blocks"]
+        self.tails = {int(device): tail for device, tail in index["tails"].items()}
+        return True
+
+    def rebuild_index(self):
+        self.count = 0
+        self.blocks = []
+        self.tails = {}
+        with self.open_map() as records:
+            for index in range(self._records_on_disk()):
+                timestamp, _, device, *_ = RECORD.unpack_from(records, HEADER.size + index * RECORD.size)
+                self.note(index, timestamp, device)
+
+    def truncate_partial(self):
+        """Cut a record torn by a crash mid-append so new records stay aligned."""
+        size = HEADER.size + self._records_on_disk() * RECORD.size
+        if os.path.getsize(self.path) != size:
+            os.truncate(self.path, size)
+
+    def _records_on_disk(self):
+        return max(0, (os.path.getsize(self.path) - HEADER.size) // RECORD.size)
+
+    def open_map(self):
+        with open(self.path, "rb") as handle:
+            return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def overlaps(self, start, end):
+        return self.blocks and self.min_ts <= end and self.max_ts >= start
+
+
+class ActivityLog:
+    """Lock activity log for one config entry."""
+
+    def __init__(self, directory, segment_records, max_segments, retention_days):
+        self.directory = directory
+        self.segment_records = segment_records
+        self.max_segments = max_segments
+        self.retention_seconds = retention_days * 86400
+        self._lock = threading.Lock()
+        self._strings = []
+        self._string_ids = {}
+        self._segments = []
+        self._opened = False
+
+    # -- setup -------------------------------------------------------------
+
+    def _open(self):
+        if self._opened:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        try:
+            with open(self._strings_path, encoding="utf-8") as handle:
+                self._strings = json.load(handle)
+        except (OSError, ValueError):
+            self._strings = []
+        self._string_ids = {value: index for index, value in enumerate(self._strings)}
+        seqs = sorted(
+            int(name[len("segment-"):-len(".bin")])
+            for name in os.listdir(self.directory)
+            if name.startswith("segment-") and name.endswith(".bin")
+        )
+        for seq in seqs:
+            segment = _Segment(self._segment_path(seq), seq)
+            if not self._valid_header(segment.path):
+                _LOGGER.warning("Ignoring unreadable activity log segment %s", segment.path)
+                continue
+            # Only the last segment is still appended to; the others are sealed
+            if seq == seqs[-1]:
+                segment.truncate_partial()
+                segment.rebuild_index()
+            elif not segment.load_index():
+                segment.rebuild_index()
+            self._segments.append(segment)
+        if not self._segments:
+            self._new_segment(0)
+        self._opened = True
+
+    @property
+    def _strings_path(self):
+        return os.path.join(self.directory, "strings.json")
+
+    def _segment_path(self, seq):
+        return os.path.join(self.directory, f"segment-{seq:06d}.bin")
+
+    @staticmethod
+    def _valid_header(path):
+        try:
+            with open(path, "rb") as handle:
+                magic, version, record_size = HEADER.unpack(handle.read(HEADER.size))
+        except (OSError, struct.error):
+            return False
+        return magic == MAGIC and version == VERSION and record_size == RECORD.size
+
+    def _new_segment(self, seq):
+        segment = _Segment(self._segment_path(seq), seq)
+        with open(segment.path, "wb") as handle:
+            handle.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        self._segments.append(segment)
+        return segment
+
+    def _string_id(self, value):
+        if value is None:
+            return NO_STRING
+        index = self._string_ids.get(value)
+        if index is None:
+            index = self._string_ids[value] = len(self._strings)
+            self._strings.append(value)
+            tmp_path = self._strings_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(self._strings, handle)
+            os.replace(tmp_path, self._strings_path)
+        return index
+
+    def _string(self, index):
+        return None if index == NO_STRING else self._strings[index]
+
+    # -- writing -----------------------------------------------------------
+
+    def append(self, activities):
+        """Append activities in arrival order."""
+        with self._lock:
+            self._open()
+            segment = self._segments[-1]
+            encoded = bytearray()
+            for activity in activities:
+                # segment.count already includes records still buffered in `encoded`
+                if segment.count >= self.segment_records:
+                    self._write(segment, encoded)
+                    encoded = bytearray()
+                    segment = self._rotate()
+                index = segment.count
+                device = self._string_id(activity.device_id)
+                encoded += RECORD.pack(
+                    activity.timestamp,
+                    segment.tails.get(device, NO_RECORD),
+                    device,
+                    self._string_id(activity.originator),
+                    self._string_id(activity.agent),
+                    int(activity.method),
+                    _action_code(activity),
+                    int(activity.actuator_state),
+                    SOURCES.index(activity.source),
+                )
+                segment.note(index, activity.timestamp, device)
+            self._write(segment, encoded)
+
+    @staticmethod
+    def _write(segment, encoded):
+        if encoded:
+            with open(segment.path, "ab") as handle:
+                handle.write(encoded)
+
+    def _rotate(self):
+        sealed = self._segments[-1]
+        sealed.save_index()
+        segment = self._new_segment(sealed.seq + 1)
+        self._compact()
+        return segment
+
+    def _compact(self):
+        """Drop or rewrite expired sealed segments, then enforce the segment cap."""
+        cutoff = time.time() - self.retention_seconds
+        for segment in list(self._segments[:-1]):
+            if segment.max_ts is None or segment.max_ts < cutoff:
+                self._remove(segment)
+            elif segment.min_ts < cutoff:
+                self._rewrite(segment, cutoff)
+        while len(self._segments) > self.max_segments:
+            self._remove(self._segments[0])
+
+    def _remove(self, segment):
+        self._segments.remove(segment)
+        for path in (segment.path, segment.index_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _rewrite(self, segment, cutoff):
+        """Keep only records at or after `cutoff`, relinking the per-lock chains."""
+        tmp_path = segment.path + ".tmp"
+        compacted = _Segment(segment.path, segment.seq)
+        with segment.open_map() as records, open(tmp_path, "wb") as handle:
+            handle.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+            kept = 0
+            for index in range(segment.count):
+                row = RECORD.unpack_from(records, HEADER.size + index * RECORD.size)
+                if row[0] < cutoff:
+                    continue
+                device = row[2]
+                handle.write(RECORD.pack(row[0], compacted.tails.get(device, NO_RECORD), *row[2:]))
+                compacted.note(kept, row[0], device)
+                kept += 1
+        os.replace(tmp_path, segment.path)
+        compacted.save_index()
+        self._segments[self._segments.index(segment)] = compacted
+
+    # -- reading -----------------------------------------------------------
+
+    def query(self, device_id=None, start=None, end=None, limit=100):
+        """Activities newest first, optionally for one lock, within [start, end].
+
+        Timestamps come from the lock's clock or arrival time, so records are
+        not strictly in time order; each segment's matches are sorted.
+        """
+        start = float("-inf") if start is None else start
+        end = float("inf") if end is None else end
+        with self._lock:
+            self._open()
+            device = self._string_ids.get(device_id) if device_id is not None else None
+            if device_id is not None and device is None:
+                return []
+            results = []
+            for segment in reversed(self._segments):
+                if len(results) >= limit:
+                    break
+                if not segment.overlaps(start, end):
+                    continue
+                if device is not None and device not in segment.tails:
+                    continue
+                with segment.open_map() as records:
+                    if device is not None:
+                        rows = self._walk_chain(records, segment.tails[device], start, end)
+                    else:
+                        rows = self._scan_blocks(records, segment, start, end)
+                    for row in sorted(rows, key=lambda row: row[0], reverse=True):
+                        results.append(self._activity(row))
+                        if len(results) >= limit:
+                            break
+            return results
+
+    @staticmethod
+    def _walk_chain(records, index, start, end):
+        # The chain is in append order, which need not be time order
+        while index != NO_RECORD:
+            row = RECORD.unpack_from(records, HEADER.size + index * RECORD.size)
+            if start <= row[0] <= end:
+                yield row
+            index = row[1]
+
+    @staticmethod
+    def _scan_blocks(records, segment, start, end):
+        for block in reversed(range(len(segment.blocks))):
+            block_min, block_max = segment.blocks[block]
+            if block_max < start or block_min > end:
+                continue
+            first = block * BLOCK_RECORDS
+            last = min(segment.count, first + BLOCK_RECORDS)
+            for index in reversed(range(first, last)):
+                row = RECORD.unpack_from(records, HEADER.size + index * RECORD.size)
+                if start <= row[0] <= end:
+                    yield row
+
+    def _activity(self, row):
+        timestamp, _, device, originator, agent, method, action, actuator, source = row
+        action = ACTIONS[action]
+        return LockActivity(
+            device_id=self._string(device),
+            timestamp=timestamp,
+            bolt_locked={"locked": True, "unlocked": False}.get(action),
+            actuator_state=ActuatorState.coerce(actuator),
+            method=ActorMethod.coerce(method),
+            originator=self._string(originator),
+            agent=self._string(agent),
+            source=SOURCES[source],
+        )
+
+    def stats(self):
+        with self._lock:
+            self._open()
+            return {
+                "segments": len(self._segments),
+                "records": sum(segment.count for segment in self._segments),
+                "bytes": sum(os.path.getsize(segment.path) for segment in self._segments),
+            }
@@ -1,47 +1,68 @@
-import os
 import logging
 import uuid
 import aiohttp
 import asyncio
 import jwt
+import time
 from aiohttp import ClientSession
 from google.protobuf import any_pb2
+from google.protobuf.message import DecodeError
 from .auth import NestAuthenticator
+from .backoff import reconnect_delay
+from .exceptions import NestAuthError, NestCommandDecodeError, command_error_from_status
+from .metrics import MetricsRegistry
+from .models import LockStateRecord
+from .payload_log import PayloadLog
 from .protobuf_handler import NestProtobufHandler
-from .protobuf_manager import read_protobuf_file
+from .token_manager import NestTokenManager
 from .const import (
     API_RETRY_DELAY_SECONDS,
+    COMMAND_MAX_ATTEMPTS,
     URL_PROTOBUF,
     ENDPOINT_OBSERVE,
     ENDPOINT_SENDCOMMAND,
     PRODUCTION_HOSTNAME,
     USER_AGENT_STRING,
 )
-#from .proto import root_pb2
-from .proto.nestlabs.gateway import v1_pb2
+from . import trait_registry
 
 _LOGGER = logging.getLogger(__name__)
 
 class ConnectionShim:
-    def __init__(self, session):
+    def __init__(self, session, metrics=None):
         self.connected = True
         self.session = session
+        self.metrics = metrics or MetricsRegistry()
+        self.chunk_log = PayloadLog("Stream chunk")
+        self.request_log = PayloadLog("POST request", every=1)
+        self.response_log = PayloadLog("POST response", every=1)
 
     async def stream(self, api_url, headers, data):
         async with self.session.post(api_url, headers=headers, data=data) as response:
-            _LOGGER.debug(f"Response headers: {dict(response.headers)}")
+            _LOGGER.debug("Response headers: %s", response.headers)
+            if response.status == 401:
+                raise NestAuthError("Stream rejected with HTTP 401")
             if response.status != 200:
                 _LOGGER.error(f"HTTP {response.status}: {await response.text()}")
                 raise Exception(f"Stream failed with status {response.status}")
-            async for chunk in response.content.iter_chunked(1024):
-                _LOGGER.debug(f"Stream chunk received (length={len(chunk)}): {chunk[:100].hex()}...")
-                yield chunk
+            self.metrics.stream_connected()
+            try:
+                async for chunk in response.content.iter_chunked(1024):
+                    self.metrics.bytes_received.inc(len(chunk))
+                    self.chunk_log.log(chunk)
+                    yield chunk
+            finally:
+                self.metrics.stream_disconnected()
 
     async def post(self, api_url, headers, data):
-        _LOGGER.debug(f"Sending POST to {api_url}, headers={headers}, data={data.hex()}")
+        _LOGGER.debug("Sending POST to %s (%d bytes)", api_url, len(data))
+        self.request_log.log(data, api_url)
         async with self.session.post(api_url, headers=headers, data=data) as response:
             response_data = await response.read()
-            _LOGGER.debug(f"Post response status: {response.status}, response: {response_data.hex()}")
+            _LOGGER.debug("Post response status: %s (%d bytes)", response.status, len(response_data))
+            self.response_log.log(response_data, f"HTTP {response.status}")
+            if response.status == 401:
+                raise NestAuthError("Post rejected with HTTP 401")
             if response.status != 200:
                 _LOGGER.error(f"HTTP {response.status}: {await response.text()}")
                 raise Exception(f"Post failed with status {response.status}")
@@ -57,17 +78,29 @@ class NestAPIClient:
     def __init__(self, hass, issue_token, api_key, cookies):
         self.hass = hass
         self.authenticator = NestAuthenticator(issue_token, api_key, cookies)
-        self.protobuf_handler = NestProtobufHandler()
-        self.access_token = None
-        self.auth_data = {}
+        self.metrics = MetricsRegistry()
+        self.protobuf_handler = NestProtobufHandler(self.metrics)
         self.transport_url = None
         self._user_id = None  # Discover dynamically
-        self._structure_id = None  # Discover dynamically
+        self._structure_id = None  # Discover dynamically; account default
+        self.structure_ids = set()  # every structure seen for this account
+        self.device_structures = {}  # device_id -> structure_id learned from the stream
+        self.device_metadata = {}  # device_id -> persisted name / serial / firmware
         self.current_state = {"devices": {"locks": {}}, "user_id": self._user_id, "structure_id": self._structure_id}
         self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=600))
-        self.connection = ConnectionShim(self.session)
+        self.connection = ConnectionShim(self.session, self.metrics)
+        self.token_manager = NestTokenManager(hass, self.authenticator, self.session, self.metrics)
+        self.on_events = None  # called with each frame's typed events (lock activity, ...)
         _LOGGER.debug("NestAPIClient initialized with session")
 
+    @property
+    def access_token(self):
+        return self.token_manager.access_token
+
+    @property
+    def auth_data(self):
+        return self.token_manager.auth_data
+
     @property
     def user_id(self):
         return self._user_id
@@ -76,6 +109,30 @@ class NestAPIClient:
     def structure_id(self):
         return self._structure_id
 
+    def structure_for(self, device_id):
+        """Structure a device's commands are routed to: learned, else the account default."""
+        return self.device_structures.get(device_id) or self._structure_id
+
+    def _apply_stream_ids(self, locks_data):
+        """Record user and structure IDs carried by a decoded Observe frame."""
+        if locks_data.get("user_id"):
+            old_user_id = self._user_id
+            self._user_id = locks_data["user_id"]
+            self.current_state["user_id"] = self._user_id
+            if old_user_id != self._user_id:
+                _LOGGER.info(f"Updated user_id from stream: {self._user_id} (was {old_user_id})")
+        structure_id = locks_data.get("structure_id")
+        if structure_id:
+            self.structure_ids.add(structure_id)
+            if not self._structure_id:
+                self._structure_id = structure_id
+                self.current_state["structure_id"] = structure_id
+                _LOGGER.info(f"Using structure_id from stream: {structure_id}")
+        for device_id, device_structure in locks_data.get("device_structures", {}).items():
+            if self.device_structures.get(device_id) != device_structure:
+                _LOGGER.debug("Device %s belongs to structure %s", device_id, device_structure)
+                self.device_structures[device_id] = device_structure
+
     @classmethod
     async def create(cls, hass, issue_token, api_key, cookies, user_id=None):
         _LOGGER.debug("Entering create")
@@ -98,11 +155,8 @@ class NestAPIClient:
     async def authenticate(self):
         _LOGGER.debug("Authenticating with Nest API")
         try:
-            self.auth_data = await self.authenticator.authenticate(self.session)
+            await self.token_manager.async_get_token()
             _LOGGER.debug(f"Raw auth data received: {self.auth_data}")
-            if not self.auth_data or "access_token" not in self.auth_data:
-                raise ValueError("Invalid authentication data received")
-            self.access_token = self.auth_data["access_token"]
             self.transport_url = self.auth_data.get("urls", {}).get("transport_url")
             id_token = self.auth_data.get("id_token")
             if id_token:
@@ -113,27 +167,46 @@ class NestAPIClient:
             else:
                 _LOGGER.warning(f"No id_token in auth_data, awaiting stream for user_id and structure_id")
             _LOGGER.info(f"Authenticated with access_token: {self.access_token[:10]}..., user_id: {self._user_id}, structure_id: {self._structure_id}")
-            await self.refresh_state()  # Initial refresh to discover IDs
-            # Also ensure structure_id is set via REST directly
-            self._structure_id = await self.fetch_structure_id()
-            self.current_state["structure_id"] = self._structure_id
         except Exception as e:
             _LOGGER.error(f"Authentication failed: {e}", exc_info=True)
             await self.close()
             raise
 
+    async def async_prewarm(self):
+        """Resolve DNS and finish the TLS handshake to the gRPC host while auth is in flight.
+
+        The pooled keep-alive connection is then reused by the first Observe.
+        """
+        url = f"{URL_PROTOBUF.format(grpc_hostname=PRODUCTION_HOSTNAME['grpc_hostname'])}/"
+        try:
+            async with self.session.head(url, headers={"User-Agent": USER_AGENT_STRING}) as response:
+                _LOGGER.debug(f"Pre-warmed connection to {url} (HTTP {response.status})")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            _LOGGER.debug(f"Connection pre-warm to {url} failed: {e}")
+
+    async def update_structure_id(self):
+        """Look up the structure over REST and record it."""
+        structure_id = await self.fetch_structure_id()
+        if structure_id:
+            self._structure_id = structure_id
+            self.current_state["structure_id"] = structure_id
+            self.structure_ids.add(structure_id)
+        return self._structure_id
+
     async def fetch_structure_id(self):
         """Mimic Homebridge's REST call to get structureId."""
-        if not self.access_token:
-            _LOGGER.warning("Cannot fetch structure_id without access_token")
-            return None
+        access_token = await self.token_manager.async_get_token()
         target_user = self._user_id or 'self'
-        url = f"https://home.nest.com/api/0.1/user/{target_user}?auth={self.access_token}"
+        url = f"https://home.nest.com/api/0.1/user/{target_user}?auth={access_token}"
         headers = {
             "User-Agent": USER_AGENT_STRING,
             "Accept": "application/json",
         }
         async with self.session.get(url, headers=headers) as resp:
+            if resp.status == 401:
+                await self.token_manager.async_invalidate(access_token)
+                _LOGGER.warning("Token rejected while fetching structureId, re-authenticated")
+                return None
             if resp.status != 200:
                 _LOGGER.error(f"Failed to fetch structureId. Status: {resp.status}")
                 return None
@@ -150,14 +223,16 @@ class NestAPIClient:
             if not structures:
                 _LOGGER.warning("No structures found in user response")
                 return None
+            self.structure_ids.update(structures)
+            if len(structures) > 1:
+                _LOGGER.info(f"Account has {len(structures)} structures; commands use the per-device structure once the stream reports it")
             return next(iter(structures.keys()))
 
     async def refresh_state(self):
-        if not self.access_token:
-            await self.authenticate()
+        access_token = await self.token_manager.async_get_token()
 
         headers = {
-            "Authorization": f"Basic {self.access_token}",
+            "Authorization": f"Basic {access_token}",
             "Content-Type": "application/x-protobuf",
             "User-Agent": USER_AGENT_STRING,
             "X-Accept-Response-Streaming": "true",
@@ -168,35 +243,39 @@ class NestAPIClient:
         }
 
         api_url = f"{URL_PROTOBUF.format(grpc_hostname=PRODUCTION_HOSTNAME['grpc_hostname'])}{ENDPOINT_OBSERVE}"
-        observe_data = await read_protobuf_file(os.path.join(os.path.dirname(__file__), "proto", "ObserveTraits.bin"))
+        observe_data = trait_registry.observe_request()
 
         _LOGGER.debug("Starting refresh_state with URL: %s", api_url)
+        reauthenticated = False
         retries = 0
         max_retries = 3
         while retries < max_retries:
             try:
                 async with self.session.post(api_url, headers=headers, data=observe_data) as response:
+                    if response.status == 401:
+                        raise NestAuthError("Observe rejected with HTTP 401")
                     if response.status != 200:
                         _LOGGER.error(f"HTTP {response.status}: {await response.text()}")
                         return {}
+                    # Chunks are arbitrary reads; only whole frames are decoded, so
+                    # the first frame with locks carries the complete lock list
+                    buffer = bytearray()
                     async for chunk in response.content.iter_chunked(1024):
-                        locks_data = await self.protobuf_handler._process_message(chunk)
-                        if "yale" in locks_data:
-                            self.current_state["devices"]["locks"] = locks_data["yale"]
-                            if locks_data.get("user_id"):
-                                old_user_id = self._user_id
-                                self._user_id = locks_data["user_id"]
-                                self.current_state["user_id"] = self._user_id
-                                if old_user_id != self._user_id:
-                                    _LOGGER.info(f"Updated user_id from stream: {self._user_id} (was {old_user_id})")
-                            if locks_data.get("structure_id"):
-                                old_structure_id = self._structure_id
-                                self._structure_id = locks_data["structure_id"]
-                                self.current_state["structure_id"] = self._structure_id
-                                if old_structure_id != self._structure_id:
-                                    _LOGGER.info(f"Updated structure_id from stream: {self._structure_id} (was {old_structure_id})")
-                            return locks_data["yale"]
+                        self.metrics.bytes_received.inc(len(chunk))
+                        buffer.extend(chunk)
+                        for frame in self.protobuf_handler.pop_frames(buffer):
+                            locks_data = await self._decode_frame(frame)
+                            if locks_data.get("yale"):
+                                self.current_state["devices"]["locks"] = locks_data["yale"]
+                                self._apply_stream_ids(locks_data)
+                                return locks_data["yale"]
                 return {}
+            except NestAuthError:
+                if reauthenticated:
+                    raise
+                reauthenticated = True
+                access_token = await self.token_manager.async_invalidate(access_token)
+                headers["Authorization"] = f"Basic {access_token}"
             except Exception as e:
                 retries += 1
                 _LOGGER.error(f"Refresh state failed (attempt {retries}/{max_retries}): {e}", exc_info=True)
@@ -206,12 +285,18 @@ class NestAPIClient:
                     _LOGGER.error("Max retries reached, giving up on refresh_state")
                     return {}
 
+    async def _decode_frame(self, frame):
+        """Decode one frame and hand its events over before the state is yielded."""
+        locks_data = await self.protobuf_handler._process_message(frame)
+        if locks_data.get("events") and self.on_events:
+            self.on_events(locks_data["events"], locks_data["received_at"])
+        return locks_data
+
     async def observe(self):
-        if not self.access_token or not self.connection.connected:
-            await self.authenticate()
+        access_token = await self.token_manager.async_get_token()
 
         headers = {
-            "Authorization": f"Basic {self.access_token}",
+            "Authorization": f"Basic {access_token}",
             "Content-Type": "application/x-protobuf",
             "User-Agent": USER_AGENT_STRING,
             "X-Accept-Response-Streaming": "true",
@@ -222,46 +307,50 @@ class NestAPIClient:
         }
 
         api_url = f"{URL_PROTOBUF.format(grpc_hostname=PRODUCTION_HOSTNAME['grpc_hostname'])}{ENDPOINT_OBSERVE}"
-        observe_data = await read_protobuf_file(os.path.join(os.path.dirname(__file__), "proto", "ObserveTraits.bin"))
+        observe_data = trait_registry.observe_request()
 
         _LOGGER.debug("Starting observe stream with URL: %s", api_url)
+        reauthenticated = False
         retries = 0
         max_retries = 3
         while retries < max_retries:
             try:
+                # A frame can span reads and a read can hold several frames,
+                # so reads are buffered and only whole frames decoded
+                buffer = bytearray()
                 async for chunk in self.connection.stream(api_url, headers, observe_data):
-                    locks_data = await self.protobuf_handler._process_message(chunk)
-                    if "yale" in locks_data:
-                        if locks_data.get("user_id"):
-                            old_user_id = self._user_id
-                            self._user_id = locks_data["user_id"]
-                            self.current_state["user_id"] = self._user_id
-                            if old_user_id != self._user_id:
-                                _LOGGER.info(f"Updated user_id from stream: {self._user_id} (was {old_user_id})")
-                        if locks_data.get("structure_id"):
-                            old_structure_id = self._structure_id
-                            self._structure_id = locks_data["structure_id"]
-                            self.current_state["structure_id"] = self._structure_id
-                            if old_structure_id != self._structure_id:
-                                _LOGGER.info(f"Updated structure_id from stream: {self._structure_id} (was {old_structure_id})")
-                    yield locks_data.get("yale", {})
+                    buffer.extend(chunk)
+                    for frame in self.protobuf_handler.pop_frames(buffer):
+                        locks_data = await self._decode_frame(frame)
+                        if "yale" in locks_data:
+                            self._apply_stream_ids(locks_data)
+                        yield locks_data.get("yale", {})
                 break
+            except NestAuthError:
+                if reauthenticated:
+                    raise
+                reauthenticated = True
+                access_token = await self.token_manager.async_invalidate(access_token)
+                headers["Authorization"] = f"Basic {access_token}"
+                self.metrics.reconnects.inc()
             except Exception as e:
                 retries += 1
                 _LOGGER.error(f"Error in observe stream (attempt {retries}/{max_retries}): {e}", exc_info=True)
                 self.connection.connected = False
                 if retries < max_retries:
-                    await asyncio.sleep(API_RETRY_DELAY_SECONDS)
+                    # Jittered so accounts dropped together do not reconnect in lockstep
+                    await asyncio.sleep(reconnect_delay(retries))
+                    self.metrics.reconnects.inc()
                 else:
                     raise
 
     #async def send_command(self, command, device_id):
     async def send_command(self, command, device_id, structure_id=None):
-        if not self.access_token:
-            await self.authenticate()
+        # Normally a cached token: the manager refreshes ahead of expiry
+        access_token = await self.token_manager.async_get_token()
 
         headers = {
-            "Authorization": f"Basic {self.access_token}",
+            "Authorization": f"Basic {access_token}",
             "Content-Type": "application/x-protobuf",
             "User-Agent": USER_AGENT_STRING,
             "X-Accept-Content-Transfer-Encoding": "binary",
@@ -272,8 +361,8 @@ class NestAPIClient:
             "request-id": str(uuid.uuid4()),
         }
 
-        # Always include a structure_id header, defaulting to the fetched one
-        effective_structure_id = structure_id or self._structure_id
+        # Route to the device's own structure, defaulting to the account's
+        effective_structure_id = structure_id or self.structure_for(device_id)
         if effective_structure_id:
             headers["X-Nest-Structure-Id"] = effective_structure_id
             _LOGGER.debug(f"[nest_yale] Using structure_id: {effective_structure_id}")
@@ -285,34 +374,109 @@ class NestAPIClient:
         cmd_any.value = command["command"]["value"] if isinstance(command["command"]["value"], bytes) else command["command"]["value"].SerializeToString()
 
     #   request = root_pb2.ResourceCommandRequest()
-        request = v1_pb2.ResourceCommandRequest()
+        request = trait_registry.load_module("nestlabs.gateway.v1_pb2").ResourceCommandRequest()
         request.resourceCommands.add().command.CopyFrom(cmd_any)
         request.resourceRequest.resourceId = device_id
         request.resourceRequest.requestId = str(uuid.uuid4())
         encoded_data = request.SerializeToString()
 
-        _LOGGER.debug(f"Sending command to {device_id}: {command}, encoded: {encoded_data.hex()}, structure_id: {self._structure_id}")
+        _LOGGER.debug("Sending command to %s: %s, %d bytes, structure_id: %s",
+                      device_id, command, len(encoded_data), effective_structure_id)
+        start = time.monotonic()
+        completed = False
         try:
-            raw_data = await self.connection.post(api_url, headers, encoded_data)
-            await asyncio.sleep(2)
-            await self.refresh_state()
+            reauthenticated = False
+            for attempt in range(1, COMMAND_MAX_ATTEMPTS + 1):
+                try:
+                    raw_data = await self.connection.post(api_url, headers, encoded_data)
+                except NestAuthError:
+                    if reauthenticated:
+                        raise
+                    reauthenticated = True
+                    access_token = await self.token_manager.async_invalidate(access_token)
+                    headers["Authorization"] = f"Basic {access_token}"
+                    raw_data = await self.connection.post(api_url, headers, encoded_data)
+                try:
+                    failures = self.protobuf_handler.decode_command_response(raw_data)
+                except DecodeError as e:
+                    raise NestCommandDecodeError(2, f"undecodable response: {e}", device_id) from e
+                if not failures:
+                    break
+                code, message = failures[0]
+                error = command_error_from_status(code, message, device_id)
+                if not error.retryable or attempt == COMMAND_MAX_ATTEMPTS:
+                    raise error
+                # Transient rejection: resend straight away with the same requestId
+                _LOGGER.warning(f"Retrying command to {device_id} after {error.status_name} (attempt {attempt}/{COMMAND_MAX_ATTEMPTS})")
+            completed = True
+            self.metrics.command_latency.observe(time.monotonic() - start)
+            self.metrics.commands.inc(label_value="ok")
+            # The response confirmed the command; the stream reports the new state
             return raw_data
         except Exception as e:
+            if not completed:
+                self.metrics.command_latency.observe(time.monotonic() - start)
+                self.metrics.commands.inc(label_value=getattr(e, "status_name", None) or type(e).__name__)
             _LOGGER.error(f"Failed to send command to {device_id}: {e}", exc_info=True)
             raise
 
     async def close(self):
+        self.token_manager.stop()
         if self.connection and self.connection.connected:
             await self.connection.close()
             _LOGGER.debug("NestAPIClient session closed")
 
+    def export_state(self, locks=None):
+        """Return the JSON-safe state persisted for warm restarts."""
+        if locks is None:
+            locks = self.current_state["devices"]["locks"]
+        return {
+            "access_token": self.token_manager.access_token,
+            "expires_at": self.token_manager.expires_at,
+            "user_id": self._user_id,
+            "structure_id": self._structure_id,
+            "device_structures": dict(self.device_structures),
+            "devices": {device_id: self.get_device_metadata(device_id) for device_id in locks},
+            "locks": {device_id: device.evolve(bolt_moving=False).as_dict() for device_id, device in locks.items()},
+        }
+
+    def restore_state(self, data):
+        """Seed token, IDs and lock snapshot from persisted state.
+
+        Returns the restored lock snapshot (empty on a cold start).
+        """
+        if not data:
+            return {}
+        if data.get("access_token") and data.get("expires_at"):
+            # An expired token is seeded too; the manager refreshes it straight away
+            self.token_manager.seed(data["access_token"], data["expires_at"])
+        self._user_id = data.get("user_id")
+        self._structure_id = data.get("structure_id")
+        self.device_structures.update(data.get("device_structures") or {})
+        self.structure_ids.update(filter(None, [self._structure_id, *self.device_structures.values()]))
+        self.current_state["user_id"] = self._user_id
+        self.current_state["structure_id"] = self._structure_id
+        self.device_metadata.update(data.get("devices") or {})
+        locks = {}
+        for device_id, device in data.get("locks", {}).items():
+            try:
+                record = LockStateRecord.from_dict({"device_id": device_id, **device})
+            except (TypeError, ValueError) as e:
+                _LOGGER.warning(f"Ignoring unreadable persisted state for {device_id}: {e}")
+                continue
+            locks[record.device_id] = record.evolve(bolt_moving=False)
+        self.current_state["devices"]["locks"] = locks
+        self.protobuf_handler.seed_records(locks)
+        _LOGGER.debug(f"Restored {len(locks)} locks, user_id: {self._user_id}, structure_id: {self._structure_id}")
+        return locks
+
     def get_device_metadata(self, device_id):
-        lock_data = self.current_state["devices"]["locks"].get(device_id, {})
+        lock_data = self.device_metadata.get(device_id, {})
         metadata = {
             "serial_number": lock_data.get("serial_number", device_id),
             "firmware_revision": lock_data.get("firmware_revision", "unknown"),
             "name": lock_data.get("name", "Front Door Lock"),
-            "structure_id": self._structure_id if self._structure_id else "unknown",
+            "structure_id": self.structure_for(device_id) or "unknown",
         }
         if "devices" in self.auth_data:
             for dev in self.auth_data.get("devices", []):
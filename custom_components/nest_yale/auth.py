@@ -10,6 +10,7 @@ from .const import (
     USER_AGENT_STRING,
     PRODUCTION_HOSTNAME,
     API_AUTH_FAIL_RETRY_DELAY_SECONDS,
+    NEST_JWT_LIFETIME_SECONDS,
     parse_cookies,
 )
 
@@ -137,7 +138,7 @@ class NestAuthenticator:
 
                     nest_data = {
                         "embed_google_oauth_access_token": True,
-                        "expire_after": "3600s",
+                        "expire_after": f"{NEST_JWT_LIFETIME_SECONDS}s",
                         "google_oauth_access_token": google_token,
                         "policy_id": "authproxy-oauth-policy"
                     }
@@ -0,0 +1,13 @@
+import random
+from .const import RECONNECT_BACKOFF_BASE_SECONDS, RECONNECT_BACKOFF_MAX_SECONDS
+
+
+def reconnect_delay(attempt):
+    """Exponential backoff with full jitter for the `attempt`-th consecutive failure.
+
+    Attempt 0 (a clean stream end) still waits a random slice of the base
+    delay, so several accounts dropped by the same server event spread out
+    instead of reconnecting in lockstep.
+    """
+    ceiling = min(RECONNECT_BACKOFF_MAX_SECONDS, RECONNECT_BACKOFF_BASE_SECONDS * (2 ** attempt))
+    return random.uniform(0, ceiling)
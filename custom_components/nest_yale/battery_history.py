@@ -0,0 +1,227 @@
+"""Per-lock battery voltage history and depletion forecast.
+
+Each lock keeps a fixed-size ring of raw ``assessedVoltage`` samples in
+``array('d')`` buffers. Samples evicted from the ring are folded into daily
+min/mean/max buckets, themselves a fixed-size ring, so memory per lock is
+bounded no matter how long HA runs and nothing goes through the recorder.
+
+The depletion rate is a least-squares line over the raw window. Its sums
+(n, Σx, Σy, Σxy, Σx²) are updated as samples enter and leave the ring, so a
+new sample costs O(1) rather than a refit over the window.
+"""
+import time
+from array import array
+from .const import (
+    BATTERY_EMPTY_VOLTAGE,
+    BATTERY_FORECAST_MIN_DAYS,
+    BATTERY_FORECAST_MIN_SAMPLES,
+    BATTERY_HISTORY_BUCKET_SECONDS,
+    BATTERY_HISTORY_BUCKETS,
+    BATTERY_HISTORY_SAMPLES,
+    BATTERY_REPLACED_JUMP_VOLTS,
+    BATTERY_SAMPLE_MIN_INTERVAL_SECONDS,
+)
+
+SECONDS_PER_DAY = 86400
+
+
+class _Ring:
+    """Fixed-capacity ring over parallel float arrays."""
+
+    def __init__(self, capacity, columns):
+        self.capacity = capacity
+        self.columns = [array("d", bytes(8 * capacity)) for _ in range(columns)]
+        self.start = 0
+        self.count = 0
+
+    def _index(self, offset):
+        return (self.start + offset) % self.capacity
+
+    def get(self, offset):
+        index = self._index(offset)
+        return tuple(column[index] for column in self.columns)
+
+    def set(self, offset, values):
+        index = self._index(offset)
+        for column, value in zip(self.columns, values):
+            column[index] = value
+
+    def push(self, values):
+        """Append `values`; returns the evicted row when the ring was full."""
+        evicted = None
+        if self.count == self.capacity:
+            evicted = self.get(0)
+            self.start = self._index(1)
+            self.count -= 1
+        self.set(self.count, values)
+        self.count += 1
+        return evicted
+
+    def pop_oldest(self):
+        row = self.get(0)
+        self.start = self._index(1)
+        self.count -= 1
+        return row
+
+    def rows(self):
+        return [self.get(offset) for offset in range(self.count)]
+
+
+class VoltageHistory:
+    """Raw voltage window, downsampled buckets and a rolling regression for one lock."""
+
+    def __init__(self, samples=BATTERY_HISTORY_SAMPLES, buckets=BATTERY_HISTORY_BUCKETS):
+        self._raw = _Ring(samples, 2)  # timestamp, volts
+        self._buckets = _Ring(buckets, 5)  # bucket start, min, sum, max, count
+        self._origin = None  # regression x is days since this timestamp
+        self._n = 0
+        self._sx = self._sy = self._sxy = self._sxx = 0.0
+
+    def add(self, timestamp, volts):
+        """Record a sample; returns False when it was too soon after the last one."""
+        if self._raw.count:
+            last_ts, last_volts = self._raw.get(self._raw.count - 1)
+            if volts - last_volts >= BATTERY_REPLACED_JUMP_VOLTS:
+                # Fresh batteries: the old discharge line says nothing about these
+                self._flush_raw()
+            elif timestamp - last_ts < BATTERY_SAMPLE_MIN_INTERVAL_SECONDS:
+                return False
+        if self._origin is None:
+            self._origin = timestamp
+        evicted = self._raw.push((timestamp, volts))
+        if evicted is not None:
+            self._forget(*evicted)
+        self._fit(timestamp, volts, 1)
+        return True
+
+    def _fit(self, timestamp, volts, sign):
+        x = (timestamp - self._origin) / SECONDS_PER_DAY
+        self._n += sign
+        self._sx += sign * x
+        self._sy += sign * volts
+        self._sxy += sign * x * volts
+        self._sxx += sign * x * x
+
+    def _forget(self, timestamp, volts):
+        self._fit(timestamp, volts, -1)
+        self._fold(timestamp, volts)
+
+    def _fold(self, timestamp, volts):
+        start = timestamp - timestamp % BATTERY_HISTORY_BUCKET_SECONDS
+        buckets = self._buckets
+        if buckets.count:
+            last = buckets.count - 1
+            bucket_start, low, total, high, count = buckets.get(last)
+            if bucket_start == start:
+                buckets.set(last, (start, min(low, volts), total + volts, max(high, volts), count + 1))
+                return
+        buckets.push((start, volts, volts, volts, 1))
+
+    def _flush_raw(self):
+        while self._raw.count:
+            self._forget(*self._raw.pop_oldest())
+        # Restart the regression from exact zeros rather than accumulated residue
+        self._origin = None
+        self._n = 0
+        self._sx = self._sy = self._sxy = self._sxx = 0.0
+
+    @property
+    def latest(self):
+        if not self._raw.count:
+            return None
+        return self._raw.get(self._raw.count - 1)
+
+    @property
+    def depletion_rate(self):
+        """Fitted voltage change in V/day over the raw window, or None."""
+        n = self._n
+        if n < 2:
+            return None
+        denominator = n * self._sxx - self._sx * self._sx
+        if denominator <= 0:
+            return None
+        return (n * self._sxy - self._sx * self._sy) / denominator
+
+    def days_to_empty(self, empty_volts=BATTERY_EMPTY_VOLTAGE):
+        """Days until the fitted line reaches `empty_volts`, or None if unknown."""
+        if self._n < BATTERY_FORECAST_MIN_SAMPLES:
+            return None
+        first_ts = self._raw.get(0)[0]
+        last_ts = self._raw.get(self._raw.count - 1)[0]
+        if (last_ts - first_ts) / SECONDS_PER_DAY < BATTERY_FORECAST_MIN_DAYS:
+            return None
+        slope = self.depletion_rate
+        if slope is None or slope >= 0:
+            return None
+        x_last = (last_ts - self._origin) / SECONDS_PER_DAY
+        intercept = (self._sy - slope * self._sx) / self._n
+        fitted_now = intercept + slope * x_last
+        remaining = (fitted_now - empty_volts) / -slope
+        # Measured from now, not from the last sample
+        remaining -= (time.time() - last_ts) / SECONDS_PER_DAY
+        return max(0.0, remaining)
+
+    def buckets(self):
+        """Downsampled history, oldest first, as (start, min, mean, max, count)."""
+        return [
+            (start, low, total / count, high, int(count))
+            for start, low, total, high, count in self._buckets.rows()
+        ]
+
+    def as_dict(self):
+        return {
+            "samples": [[ts, round(volts, 3)] for ts, volts in self._raw.rows()],
+            "buckets": [list(row) for row in self._buckets.rows()],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        history = cls()
+        for row in data.get("buckets", ()):
+            history._buckets.push(tuple(float(value) for value in row))
+        for timestamp, volts in data.get("samples", ()):
+            if history._origin is None:
+                history._origin = timestamp
+            evicted = history._raw.push((timestamp, volts))
+            if evicted is not None:
+                history._forget(*evicted)
+            history._fit(timestamp, volts, 1)
+        return history
+
+
+class BatteryHistory:
+    """Voltage histories for every lock of one config entry."""
+
+    def __init__(self):
+        self._locks = {}
+
+    def get(self, device_id):
+        return self._locks.get(device_id)
+
+    def record(self, device_id, volts, timestamp=None):
+        history = self._locks.get(device_id)
+        if history is None:
+            history = self._locks[device_id] = VoltageHistory()
+        return history.add(time.time() if timestamp is None else timestamp, volts)
+
+    def forecast(self, device_id):
+        """Sensor attributes for one lock: depletion rate and days to empty."""
+        history = self._locks.get(device_id)
+        if history is None:
+            return {}
+        rate = history.depletion_rate
+        days = history.days_to_empty()
+        return {
+            "depletion_rate_v_per_day": None if rate is None else round(rate, 5),
+            "days_to_empty": None if days is None else round(days, 1),
+        }
+
+    def as_dict(self):
+        return {device_id: history.as_dict() for device_id, history in self._locks.items()}
+
+    def restore(self, data):
+        for device_id, history in (data or {}).items():
+            try:
+                self._locks[device_id] = VoltageHistory.from_dict(history)
+            except (TypeError, ValueError):
+                continue
@@ -0,0 +1,70 @@
+import logging
+from dataclasses import dataclass
+from typing import Callable
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from .const import DOMAIN
+from .entity import NestYaleDeviceEntity, async_add_device_entities
+from .models import LockStateRecord
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True)
+class NestYaleBinarySensorDescription(BinarySensorEntityDescription):
+    is_on_fn: Callable[[LockStateRecord], bool | None]
+
+
+BINARY_SENSORS = (
+    NestYaleBinarySensorDescription(
+        key="battery_low",
+        name="Battery low",
+        device_class=BinarySensorDeviceClass.BATTERY,
+        # On once the lock's replacement indicator reads SOON or IMMEDIATELY
+        is_on_fn=lambda r: r.battery_low,
+    ),
+    NestYaleBinarySensorDescription(
+        key="tamper",
+        name="Tamper",
+        device_class=BinarySensorDeviceClass.TAMPER,
+        is_on_fn=lambda r: r.tampered,
+    ),
+    NestYaleBinarySensorDescription(
+        key="door",
+        name="Door",
+        device_class=BinarySensorDeviceClass.DOOR,
+        # OpenCloseTrait of the sensor paired through DoorCheckSettingsTrait
+        is_on_fn=lambda r: r.door_open,
+    ),
+)
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_device_entities(
+        entry,
+        coordinator,
+        async_add_entities,
+        lambda coordinator, device_id: [
+            NestYaleBinarySensor(coordinator, device_id, description) for description in BINARY_SENSORS
+        ],
+    )
+
+
+class NestYaleBinarySensor(NestYaleDeviceEntity, BinarySensorEntity):
+    """Binary sensor over one condition of a lock's record."""
+
+    def __init__(self, coordinator, device_id, description):
+        super().__init__(coordinator, device_id, description.key)
+        self.entity_description = description
+
+    @property
+    def is_on(self):
+        record = self.record
+        return None if record is None else self.entity_description.is_on_fn(record)
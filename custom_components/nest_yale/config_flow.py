@@ -1,5 +1,7 @@
 """Config flow for Nest Yale integration."""
+import hashlib
 import logging
+import urllib.parse
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
@@ -9,6 +11,15 @@ from .const import DOMAIN, CONF_ISSUE_TOKEN, CONF_API_KEY, CONF_COOKIES
 _LOGGER = logging.getLogger(__name__)
 
 
+def account_unique_id(issue_token):
+    """Stable per-account ID: the Google login_hint in the issue_token URL, else a hash of it."""
+    query = urllib.parse.urlparse(issue_token.strip()).query
+    login_hint = urllib.parse.parse_qs(query).get("login_hint", [None])[0]
+    if login_hint:
+        return login_hint
+    return hashlib.sha256(issue_token.strip().encode("utf-8")).hexdigest()[:32]
+
+
 class NestYaleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle the config flow for Nest Yale."""
 
@@ -18,19 +29,24 @@ class NestYaleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
 
         if user_input is not None:
-            await self.async_set_unique_id(DOMAIN)
-            self._abort_if_unique_id_configured()
             try:
                 # Basic presence validation (full auth happens later in async_setup_entry)
                 for key in (CONF_ISSUE_TOKEN, CONF_API_KEY, CONF_COOKIES):
                     if not user_input.get(key):
                         raise ValueError(f"Missing {key}")
-                return self.async_create_entry(title="Nest Yale", data=user_input)
+                unique_id = account_unique_id(user_input[CONF_ISSUE_TOKEN])
             except ValueError:
                 errors["base"] = "auth_failure"
             except Exception as err:  # pragma: no cover
                 _LOGGER.exception("Unexpected error during config flow: %s", err)
                 errors["base"] = "unknown_error"
+            else:
+                # One entry per Google account; each runs its own client and stream
+                await self.async_set_unique_id(unique_id)
+                self._abort_if_unique_id_configured()
+                existing = len(self._async_current_entries())
+                title = f"Nest Yale ({existing + 1})" if existing else "Nest Yale"
+                return self.async_create_entry(title=title, data=user_input)
 
         return self.async_show_form(
             step_id="user",
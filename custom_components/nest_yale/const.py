@@ -42,6 +42,33 @@ API_RETRY_DELAY_SECONDS = 10
 API_GOOGLE_REAUTH_MINUTES = 55
 API_NEST_REAUTH_MINUTES = 20 * 24 * 60  # 20 days
 API_HTTP2_PING_INTERVAL_SECONDS = 60
+RECONNECT_BACKOFF_BASE_SECONDS = 2
+RECONNECT_BACKOFF_MAX_SECONDS = 5 * 60
+NEST_JWT_LIFETIME_SECONDS = 3600  # expire_after requested from issue_jwt
+TOKEN_REFRESH_LEAD_SECONDS = 5 * 60  # refresh this long before the token expires
+
+# SendCommand status handling (nest.rpc.Status uses google.rpc.Code numbering)
+GRPC_STATUS_NAMES = {
+    0: "OK",
+    1: "CANCELLED",
+    2: "UNKNOWN",
+    3: "INVALID_ARGUMENT",
+    4: "DEADLINE_EXCEEDED",
+    5: "NOT_FOUND",
+    6: "ALREADY_EXISTS",
+    7: "PERMISSION_DENIED",
+    8: "RESOURCE_EXHAUSTED",
+    9: "FAILED_PRECONDITION",
+    10: "ABORTED",
+    11: "OUT_OF_RANGE",
+    12: "UNIMPLEMENTED",
+    13: "INTERNAL",
+    14: "UNAVAILABLE",
+    15: "DATA_LOSS",
+    16: "UNAUTHENTICATED",
+}
+COMMAND_RETRYABLE_STATUS_CODES = frozenset({4, 10, 14})  # DEADLINE_EXCEEDED, ABORTED, UNAVAILABLE
+COMMAND_MAX_ATTEMPTS = 3
 
 # REST API Endpoints (from nest-endpoints.js)
 URL_NEST_AUTH = "https://{api_hostname}/session"
@@ -64,11 +91,61 @@ CLIENT_ID_FT = "384529615266-57v6vaptkmhm64n9hn5dcmkr4at14p8j.apps.googleusercon
 
 # Home Assistant Integration Constants
 DOMAIN = "nest_yale"
-PLATFORMS = ["lock"]
+PLATFORMS = ["lock", "sensor", "binary_sensor", "event"]
 CONF_ISSUE_TOKEN = "issue_token"
 CONF_API_KEY = "api_key"
 CONF_COOKIES = "cookies"
 UPDATE_INTERVAL_SECONDS = timedelta(seconds=30)  # Use timedelta for DataUpdateCoordinator
+STARTUP_SNAPSHOT_TIMEOUT_SECONDS = 30
+ENTITY_SETUP_TIMEOUT_SECONDS = 15
+BOLT_MOVING_TIMEOUT_SECONDS = 5  # the bolt has settled by then; drop the motion hint
+
+# Persisted state (token, IDs, last lock snapshot) for fast warm restarts
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY_SECONDS = 10
+
+# Opt-in payload dumps (custom_components.nest_yale.payload logger)
+PAYLOAD_LOG_SAMPLE_EVERY = 20  # dump one payload in N per channel
+PAYLOAD_LOG_MAX_BYTES = 256
+
+# Diagnostics download
+DECODE_ERROR_HISTORY = 20  # last N decode failures kept with payload hashes
+DIAGNOSTICS_RECENT_SAMPLES = 32  # recent frame sizes / decode timings included
+
+# Battery voltage history (battery_history.py)
+BATTERY_HISTORY_SAMPLES = 256  # raw samples kept per lock for the depletion fit
+BATTERY_HISTORY_BUCKETS = 180  # downsampled buckets kept per lock
+BATTERY_HISTORY_BUCKET_SECONDS = 86400  # one min/mean/max bucket per day
+BATTERY_SAMPLE_MIN_INTERVAL_SECONDS = 900  # voltage jitter inside this is dropped
+BATTERY_REPLACED_JUMP_VOLTS = 0.3  # a rise this large means new batteries
+BATTERY_EMPTY_VOLTAGE = 4.4  # four AA cells at ~1.1 V
+BATTERY_FORECAST_MIN_SAMPLES = 8
+BATTERY_FORECAST_MIN_DAYS = 3
+
+# Lock activity (who moved the bolt, and how)
+EVENT_LOCK_ACTIVITY = f"{DOMAIN}_lock_activity"
+EVENT_KEYPAD_ENTRY = f"{DOMAIN}_keypad_entry"
+ACTIVITY_DEDUPE_SECONDS = 5  # an event and a state change this close are one activity
+ACTIVITY_LOG_SEGMENT_RECORDS = 16384  # 24-byte records per segment file
+ACTIVITY_LOG_MAX_SEGMENTS = 8  # ~3 MB per config entry at most
+ACTIVITY_LOG_RETENTION_DAYS = 365
+
+# Tamper alerts skip the per-device dispatch batching
+EVENT_TAMPER = f"{DOMAIN}_tamper"
+
+# Liveness: a lock not reported by the stream or a refresh within its
+# heartbeat window (LivenessTrait.maxInactivityDuration) is unavailable
+LIVENESS_DEFAULT_WINDOW_SECONDS = 1800  # until the lock reports its own window
+LIVENESS_GRACE_SECONDS = 60
+TIMER_WHEEL_TICK_SECONDS = 1.0
+TIMER_WHEEL_SLOTS = 512
+
+# Auto-relock: polling pauses while a lock is expected to relock by itself;
+# a relock not pushed within the tolerance gets one refresh
+RELOCK_TOLERANCE_SECONDS = 30
+
+# nest_yale.sync_pin_codes
+PIN_SYNC_CONCURRENCY = 4  # locks receiving PIN commands at once
 
 # SSL Certificate Path
 SSL_VERIFY_PATH = certifi.where()
@@ -1,16 +1,49 @@
 #!/usr/bin/env python3
+import time
 import logging
 import asyncio
-from homeassistant.core import HomeAssistant
+from functools import partial
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from .const import DOMAIN, UPDATE_INTERVAL_SECONDS
+from .backoff import reconnect_delay
+from .battery_history import BatteryHistory
+from .const import (
+    DOMAIN,
+    EVENT_KEYPAD_ENTRY,
+    EVENT_LOCK_ACTIVITY,
+    EVENT_TAMPER,
+    LIVENESS_DEFAULT_WINDOW_SECONDS,
+    LIVENESS_GRACE_SECONDS,
+    RELOCK_TOLERANCE_SECONDS,
+    STARTUP_SNAPSHOT_TIMEOUT_SECONDS,
+    TIMER_WHEEL_SLOTS,
+    TIMER_WHEEL_TICK_SECONDS,
+    UPDATE_INTERVAL_SECONDS,
+)
+from .models import EMPTY_SNAPSHOT, KeypadEntry, LockActivity, TamperAlert, merge_snapshot
+from .startup import StartupTimeline
+from .timer_wheel import TimerWheel
 
 _LOGGER = logging.getLogger(__name__)
 
+def _add_keyed_listener(listeners_by_key, key, listener):
+    listeners = listeners_by_key.setdefault(key, [])
+    listeners.append(listener)
+
+    @callback
+    def remove_listener():
+        listeners.remove(listener)
+        if not listeners:
+            listeners_by_key.pop(key, None)
+
+    return remove_listener
+
+
 class NestCoordinator(DataUpdateCoordinator):
     """Coordinator to manage Nest Yale Lock data."""
 
-    def __init__(self, hass: HomeAssistant, api_client):
+    def __init__(self, hass: HomeAssistant, api_client, store=None, activity_log=None):
         """Initialize the coordinator."""
         super().__init__(
             hass,
@@ -19,27 +52,281 @@ class NestCoordinator(DataUpdateCoordinator):
             update_interval=UPDATE_INTERVAL_SECONDS,
         )
         self.api_client = api_client
+        self.metrics = api_client.metrics
+        self.battery_history = BatteryHistory()
+        self.store = store
+        self.activity_log = activity_log
+        self._activity_pending = []  # activities waiting for the log writer, in arrival order
+        self._activity_writer = None  # the one task appending them
         self._observer_task = None
-        self.data = {}
+        self._first_snapshot = asyncio.Event()
+        self.startup_timeline = StartupTimeline()
+        self._device_listeners = {}  # device_id -> [callback]
+        self._event_listeners = {}  # device_id -> [callback(event)]
+        self._dispatched = EMPTY_SNAPSHOT  # snapshot last dispatched to device listeners
+        self._pending_devices = set()
+        self._dispatch_handle = None
+        # Per-device deadlines (heartbeat windows, ...) share one wheel
+        self.timers = TimerWheel(hass.loop, TIMER_WHEEL_TICK_SECONDS, TIMER_WHEEL_SLOTS)
+        self._stale = set()  # devices that missed their heartbeat window
+        self._relocks_at = {}  # device_id -> epoch seconds the lock should relock by itself
+        self._relock_fetch = False  # next refresh is an overdue relock's check, not a poll
+        self.data = EMPTY_SNAPSHOT
+        if store:
+            api_client.token_manager.on_refresh = self._schedule_save
+        # Looked up per call, so a profiling session's wrapper of _handle_events is used
+        api_client.on_events = lambda events, received_at: self._handle_events(events, received_at)
         _LOGGER.debug("Initialized NestCoordinator with initial data: %s", self.data)
 
+    def async_restore(self, locks):
+        """Publish a persisted snapshot so entities can be created before the stream connects."""
+        self.data = merge_snapshot(EMPTY_SNAPSHOT, locks)
+        # Treat it as already dispatched: the restored voltages were recorded
+        # by the session that saved them, not read again now
+        self._dispatched = self.data
+        # Restored state only stays trusted for one heartbeat window
+        self._mark_seen(locks)
+        _LOGGER.debug("Restored %d locks from storage", len(locks))
+
+    def device_available(self, device_id):
+        """Known, reported reachable by the cloud, and heard from within its heartbeat window."""
+        record = (self.data or EMPTY_SNAPSHOT).get(device_id)
+        return record is not None and record.reachable and device_id not in self._stale
+
+    @callback
+    def _mark_seen(self, records):
+        """Re-arm the heartbeat window of every device in `records`."""
+        recovered = self._stale & records.keys()
+        for device_id, record in records.items():
+            window = record.max_inactivity or LIVENESS_DEFAULT_WINDOW_SECONDS
+            self.timers.schedule(("liveness", device_id), window + LIVENESS_GRACE_SECONDS,
+                                 partial(self._mark_stale, device_id))
+        if recovered:
+            self._stale -= recovered
+            self._notify_devices(recovered)
+
+    @callback
+    def _mark_stale(self, device_id):
+        _LOGGER.warning("No update for %s within its heartbeat window, marking unavailable", device_id)
+        self._stale.add(device_id)
+        self._notify_devices((device_id,))
+
+    @callback
+    def async_add_device_listener(self, device_id, update_callback):
+        """Listen for changes to one device only; returns a remover.
+
+        Unlike async_add_listener, the callback runs only when this device's
+        state changed, at most once per event-loop tick.
+        """
+        return _add_keyed_listener(self._device_listeners, device_id, update_callback)
+
+    @callback
+    def async_add_event_listener(self, device_id, event_callback):
+        """Receive one device's stream events (e.g. KeypadEntry); returns a remover.
+
+        Called synchronously from the frame that carried the event, ahead of
+        any state dispatch.
+        """
+        return _add_keyed_listener(self._event_listeners, device_id, event_callback)
+
+    @callback
+    def async_update_listeners(self):
+        """Notify generic listeners, then queue per-device listeners for changed devices.
+
+        Devices whose tamper state changed are dispatched right away instead
+        of on the next tick, so security alerts land within the frame.
+        """
+        super().async_update_listeners()
+        data = self.data or EMPTY_SNAPSHOT
+        previous = self._dispatched
+        if data is previous:
+            return
+        # Snapshots share unchanged records, so identity is the change test
+        changed = {device_id for device_id, device in data.items() if previous.get(device_id) is not device}
+        changed.update(device_id for device_id in previous if device_id not in data)
+        self._dispatched = data
+        if not changed:
+            return
+        for device_id in changed:
+            record = data.get(device_id)
+            if record is not None and record.battery_voltage is not None:
+                held = previous.get(device_id)
+                if held is None or held.battery_voltage != record.battery_voltage:
+                    self.battery_history.record(device_id, record.battery_voltage)
+            self._track_relock(device_id, previous.get(device_id), record)
+        urgent = {
+            device_id for device_id in changed
+            if device_id in data and device_id in previous
+            and data[device_id].tamper_state is not previous[device_id].tamper_state
+        }
+        if urgent:
+            self._pending_devices -= urgent
+            self._notify_devices(urgent)
+            changed -= urgent
+            if not changed:
+                return
+        self._pending_devices |= changed
+        if self._dispatch_handle is None:
+            self._dispatch_handle = self.hass.loop.call_soon(self._dispatch_device_updates)
+
+    def relocks_at(self, device_id):
+        """Epoch seconds at which the lock is expected to auto-relock, or None."""
+        return self._relocks_at.get(device_id)
+
+    @callback
+    def _track_relock(self, device_id, held, record):
+        """Arm an expected-relock checkpoint on unlock, drop it once locked."""
+        key = ("relock", device_id)
+        if record is None or record.bolt_locked or not record.auto_relock_on or not record.auto_relock_duration:
+            if self._relocks_at.pop(device_id, None) is not None:
+                self.timers.cancel(key)
+            return
+        if held is None or not held.bolt_locked or device_id in self._relocks_at:
+            return
+        relocks_at = (record.locked_changed_at or time.time()) + record.auto_relock_duration
+        self._relocks_at[device_id] = relocks_at
+        self.timers.schedule(key, max(0, relocks_at - time.time()) + RELOCK_TOLERANCE_SECONDS,
+                             partial(self._relock_overdue, device_id))
+
+    @callback
+    def _relock_overdue(self, device_id):
+        _LOGGER.debug("No relock pushed for %s within tolerance, fetching its state", device_id)
+        self._relocks_at.pop(device_id, None)
+        self._notify_devices((device_id,))
+        self._relock_fetch = True
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _dispatch_device_updates(self):
+        self._dispatch_handle = None
+        changed, self._pending_devices = self._pending_devices, set()
+        self._notify_devices(changed)
+
+    @callback
+    def _notify_devices(self, device_ids):
+        for device_id in device_ids:
+            for update_callback in tuple(self._device_listeners.get(device_id, ())):
+                update_callback()
+
+    @callback
+    def _handle_events(self, events, received_at):
+        """Fire stream events on the bus straight from the frame that carried them."""
+        activities = []
+        for event in events:
+            if isinstance(event, LockActivity):
+                activities.append(event)
+                data = event.as_event_data()
+                data["entity_id"] = self.entity_id_for("lock", event.device_id)
+                self.hass.bus.async_fire(EVENT_LOCK_ACTIVITY, data)
+            elif isinstance(event, KeypadEntry):
+                data = event.as_event_data()
+                data["entity_id"] = self.entity_id_for("lock", event.device_id)
+                self.hass.bus.async_fire(EVENT_KEYPAD_ENTRY, data)
+            elif isinstance(event, TamperAlert):
+                data = event.as_event_data()
+                data["entity_id"] = self.entity_id_for("lock", event.device_id)
+                self.hass.bus.async_fire(EVENT_TAMPER, data)
+            for event_callback in tuple(self._event_listeners.get(event.device_id, ())):
+                event_callback(event)
+            self.metrics.event_latency.observe(time.perf_counter() - received_at)
+        if activities and self.activity_log:
+            self._activity_pending.extend(activities)
+            if self._activity_writer is None:
+                self._activity_writer = self.hass.async_create_background_task(
+                    self._write_activity(), f"{DOMAIN}_activity_log"
+                )
+
+    async def _write_activity(self):
+        """Drain queued activities into the log one batch at a time, in order."""
+        try:
+            while self._activity_pending:
+                batch, self._activity_pending = self._activity_pending, []
+                try:
+                    await self.hass.async_add_executor_job(self.activity_log.append, batch)
+                except Exception as e:
+                    _LOGGER.error("Failed to write %d activities to the log: %s", len(batch), e, exc_info=True)
+        finally:
+            self._activity_writer = None
+
+    def entity_id_for(self, platform, device_id):
+        registry = er.async_get(self.hass)
+        return registry.async_get_entity_id(platform, DOMAIN, f"{DOMAIN}_{device_id}")
+
+    def _schedule_save(self):
+        if self.store:
+            self.store.async_schedule_save(self._export_state)
+
+    def _export_state(self):
+        state = self.api_client.export_state(self.data)
+        state["battery_history"] = self.battery_history.as_dict()
+        return state
+
     async def async_setup(self):
-        """Set up the coordinator."""
+        """Set up the coordinator.
+
+        Authenticates once (pre-warming the gRPC connection meanwhile), then
+        opens the Observe stream and runs the REST structure lookup alongside it.
+        """
         _LOGGER.debug("Starting async_setup for coordinator")
-        await self.api_client.async_setup()
+        timeline = self.startup_timeline
+        prewarm = self.hass.loop.create_task(self._timed(timeline, "prewarm", self.api_client.async_prewarm()))
+        async with timeline.phase("auth"):
+            await self.api_client.async_setup()
 
-        await self.async_refresh()
+        self._observer_task = self.hass.loop.create_task(self._run_observer())
+        _LOGGER.debug("Observer task created: %s", self._observer_task)
+        results = await asyncio.gather(
+            prewarm,
+            self._timed(timeline, "structure_lookup", self.api_client.update_structure_id()),
+            self._timed(timeline, "first_snapshot", self._async_wait_first_snapshot()),
+            return_exceptions=True,
+        )
+        for name, result in zip(("prewarm", "structure_lookup", "first_snapshot"), results):
+            if isinstance(result, BaseException):
+                _LOGGER.warning("Startup step %s failed: %s", name, result, exc_info=result)
+        timeline.log_summary()
         if not self.data:
-            _LOGGER.warning("Coordinator data is empty after initial refresh, waiting for observer updates.")
+            _LOGGER.warning("Coordinator data is empty after startup, waiting for observer updates.")
         else:
             _LOGGER.debug("Initial data fetched: %s", self.data)
 
-        self._observer_task = self.hass.loop.create_task(self._run_observer())
-        _LOGGER.debug("Observer task created: %s", self._observer_task)
+    @staticmethod
+    async def _timed(timeline, name, coro):
+        async with timeline.phase(name):
+            return await coro
+
+    @property
+    def ready(self):
+        return bool(self.data) or self._first_snapshot.is_set()
+
+    async def async_wait_ready(self, timeout):
+        """Wait until lock data is available (restored or first snapshot)."""
+        if self.ready:
+            return True
+        try:
+            async with asyncio.timeout(timeout):
+                await self._first_snapshot.wait()
+        except TimeoutError:
+            return False
+        return True
+
+    async def _async_wait_first_snapshot(self):
+        try:
+            async with asyncio.timeout(STARTUP_SNAPSHOT_TIMEOUT_SECONDS):
+                await self._first_snapshot.wait()
+        except TimeoutError:
+            _LOGGER.warning("No lock snapshot from the observe stream within %ss", STARTUP_SNAPSHOT_TIMEOUT_SECONDS)
 
     async def _async_update_data(self):
         """Fetch data from API client."""
         _LOGGER.debug("Starting _async_update_data")
+        relock_fetch, self._relock_fetch = self._relock_fetch, False
+        if self._relocks_at and not relock_fetch:
+            # A refresh reads every lock of the account, so while any lock is
+            # due to relock by itself, polls are skipped account-wide: the
+            # relock arrives as a push, and an overdue one gets its own fetch
+            _LOGGER.debug("Skipping refresh while awaiting auto-relock of %s", list(self._relocks_at))
+            return self.data
         try:
             new_data = await self.api_client.refresh_state()
             if not new_data:
@@ -47,51 +334,80 @@ class NestCoordinator(DataUpdateCoordinator):
                 return self.data
 
             normalized_data = new_data.get("yale", new_data) if new_data else {}
-            for device_id, device in normalized_data.items():
-                device["bolt_moving"] = device.get("bolt_moving", False)
             _LOGGER.debug("Normalized data from refresh_state: %s", normalized_data)
-            return normalized_data
+            # A refresh reads the stream's initial frame, which lists every lock
+            snapshot = merge_snapshot(self.data, normalized_data, replace_all=True)
+            self._mark_seen(normalized_data)
+            self._first_snapshot.set()
+            if snapshot is not self.data:
+                self._schedule_save()
+            return snapshot
         except Exception as e:
             _LOGGER.error("Failed to update data: %s", e, exc_info=True)
-            for device in self.data.values():
-                device["bolt_moving"] = False
-            return self.data
+            return self._motion_cleared()
 
     async def _run_observer(self):
-        """Listen for real-time updates."""
+        """Listen for real-time updates, reconnecting with jittered backoff."""
         _LOGGER.debug("Starting _run_observer")
-        try:
-            async for update in self.api_client.observe():
-                if update:
-                    _LOGGER.debug("Received observer update: %s", update)
-                    normalized_update = update.get("yale", update) if update else {}
-                    if normalized_update:
-                        for device_id, device in normalized_update.items():
-                            if "actuatorState" in device:
-                                device["actuator_state"] = device["actuatorState"]
-                            device["bolt_moving"] = device.get("bolt_moving", False)
-                        self.api_client.current_state["user_id"] = update.get("user_id")  # Persist user_id
-                        self.async_set_updated_data(normalized_update)
-                        _LOGGER.debug("Applied normalized observer update: %s, current_state user_id: %s",
-                                      normalized_update, self.api_client.current_state["user_id"])
-                    else:
-                        _LOGGER.debug("Normalized observer update is empty: %s", normalized_update)
-                        for device in self.data.values():
-                            device["bolt_moving"] = False
-                        self.async_set_updated_data(self.data)
-                else:
-                    _LOGGER.debug("Observer update received but is empty.")
-                    for device in self.data.values():
-                        device["bolt_moving"] = False
-                    self.async_set_updated_data(self.data)
-        except Exception as e:
-            _LOGGER.error("Observer failed: %s", e, exc_info=True)
-            await asyncio.sleep(5)
-            self._observer_task = self.hass.loop.create_task(self._run_observer())
+        failures = 0
+        while True:
+            try:
+                async for update in self.api_client.observe():
+                    failures = 0
+                    self._handle_observer_update(update)
+                _LOGGER.debug("Observe stream ended, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failures += 1
+                _LOGGER.error("Observer failed (%d consecutive): %s", failures, e, exc_info=True)
+            await asyncio.sleep(reconnect_delay(failures))
+            self.metrics.reconnects.inc()
+
+    @callback
+    def _handle_observer_update(self, update):
+        if update:
+            _LOGGER.debug("Received observer update: %s", update)
+            normalized_update = update.get("yale", update) if update else {}
+            if normalized_update:
+                # Stream frames usually carry no user_id (observe() applies it), keep the known one
+                if "user_id" in update:
+                    self.api_client.current_state["user_id"] = update["user_id"]  # Persist user_id
+                snapshot = merge_snapshot(self.data, normalized_update)
+                self._mark_seen(normalized_update)
+                if snapshot is self.data:
+                    # Re-sent state (reconnect, or matching the restored one) with nothing new
+                    self.metrics.stale_updates.inc()
+                    self._first_snapshot.set()
+                    return
+                self.async_set_updated_data(snapshot)
+                self._first_snapshot.set()
+                self._schedule_save()
+                _LOGGER.debug("Applied normalized observer update: %s, current_state user_id: %s",
+                              normalized_update, self.api_client.current_state["user_id"])
+            else:
+                # Nothing to apply. bolt_moving hints are cleared by their
+                # timer or by a reported bolt state, not by keepalive frames
+                _LOGGER.debug("Normalized observer update is empty: %s", normalized_update)
+        else:
+            _LOGGER.debug("Observer update received but is empty.")
+
+    def _motion_cleared(self):
+        """Snapshot of the current data with every bolt_moving hint cleared."""
+        return merge_snapshot(self.data, {
+            device_id: record.evolve(bolt_moving=False, bolt_moving_to=None)
+            for device_id, record in (self.data or EMPTY_SNAPSHOT).items()
+        })
 
     async def async_unload(self):
         """Unload the coordinator."""
         _LOGGER.debug("Starting async_unload for coordinator")
+        if self._dispatch_handle:
+            self._dispatch_handle.cancel()
+            self._dispatch_handle = None
+        self.timers.stop()
+        if self._activity_writer:
+            await self._activity_writer
         if self._observer_task:
             _LOGGER.debug("Cancelling observer task")
             self._observer_task.cancel()
@@ -99,5 +415,7 @@ class NestCoordinator(DataUpdateCoordinator):
                 await self._observer_task
             except asyncio.CancelledError:
                 _LOGGER.debug("Observer task cancelled")
+        if self.store:
+            await self.store.async_save(self._export_state())
         await self.api_client.close()
         _LOGGER.debug("Coordinator unloaded")
\ No newline at end of file
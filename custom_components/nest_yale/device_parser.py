@@ -1,10 +1,5 @@
 import logging
-from google.protobuf import any_pb2
-from custom_components.nest_yale.proto.weave.trait import security_pb2 as weave_security_pb2
-from custom_components.nest_yale.proto.weave.trait import power_pb2 as weave_power_pb2
-from custom_components.nest_yale.proto.nest.trait import user_pb2 as nest_user_pb2
-from custom_components.nest_yale.proto.weave.trait import description_pb2 as weave_description_pb2
-from custom_components.nest_yale.proto.nest.trait import security_pb2 as nest_security_pb2
+from . import trait_registry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,7 +50,7 @@ class DeviceParser:
                     # BoltLockTrait
                     if (property_any.type_url == "type.nestlabs.com/weave.trait.security.BoltLockTrait" or
                         (trait_key and trait_key.lower() == "bolt_lock")):
-                        property_value = weave_security_pb2.BoltLockTrait()
+                        property_value = trait_registry.message_class("weave.trait.security.BoltLockTrait")()
                         if property_any.Unpack(property_value):
                             if resource_id.startswith("DEVICE_"):
                                 device_id = resource_id.replace("DEVICE_", "")
@@ -64,7 +59,7 @@ class DeviceParser:
                     # BatteryPowerSourceTrait
                     elif (property_any.type_url == "type.nestlabs.com/weave.trait.power.BatteryPowerSourceTrait" or
                           (trait_key and trait_key.lower() == "battery_power_source")):
-                        property_value = weave_power_pb2.BatteryPowerSourceTrait()
+                        property_value = trait_registry.message_class("weave.trait.power.BatteryPowerSourceTrait")()
                         if property_any.Unpack(property_value):
                             if resource_id.startswith("DEVICE_"):
                                 device_id = resource_id.replace("DEVICE_", "")
@@ -75,14 +70,14 @@ class DeviceParser:
                     # UserInfoTrait – extract user_id
                     elif (property_any.type_url == "type.nestlabs.com/nest.trait.user.UserInfoTrait" or
                           (trait_key and trait_key.lower() == "user_info")):
-                        property_value = nest_user_pb2.UserInfoTrait()
+                        property_value = trait_registry.message_class("nest.trait.user.UserInfoTrait")()
                         if property_any.Unpack(property_value):
                             body["user_id"] = getattr(property_value, "legacyId", None)
                             _LOGGER.debug(f"Extracted user_id: {body['user_id']}")
                     # DeviceIdentityTrait
                     elif (property_any.type_url == "type.nestlabs.com/weave.trait.description.DeviceIdentityTrait" or
                           (trait_key and trait_key.lower() == "device_identity")):
-                        property_value = weave_description_pb2.DeviceIdentityTrait()
+                        property_value = trait_registry.message_class("weave.trait.description.DeviceIdentityTrait")()
                         if property_any.Unpack(property_value):
                             if resource_id.startswith("DEVICE_"):
                                 device_id = resource_id.replace("DEVICE_", "")
@@ -93,7 +88,7 @@ class DeviceParser:
                     # EnhancedBoltLockSettingsTrait
                     elif (property_any.type_url == "type.nestlabs.com/nest.trait.security.EnhancedBoltLockSettingsTrait" or
                           (trait_key and trait_key.lower() == "enhanced_bolt_lock_settings")):
-                        property_value = nest_security_pb2.EnhancedBoltLockSettingsTrait()
+                        property_value = trait_registry.message_class("nest.trait.security.EnhancedBoltLockSettingsTrait")()
                         if property_any.Unpack(property_value):
                             if resource_id.startswith("DEVICE_"):
                                 device_id = resource_id.replace("DEVICE_", "")
@@ -115,15 +110,16 @@ class DeviceParser:
     @staticmethod
     def _parse_bolt_lock(property_value, device_id):
         """Parse lock data from BoltLockTrait."""
+        BoltLockTrait = trait_registry.message_class("weave.trait.security.BoltLockTrait")
         return {
             "device_id": device_id,
-            "bolt_locked": property_value.lockedState == weave_security_pb2.BoltLockTrait.BoltLockedState.BOLT_LOCKED_STATE_LOCKED,
+            "bolt_locked": property_value.lockedState == BoltLockTrait.BoltLockedState.BOLT_LOCKED_STATE_LOCKED,
             "bolt_moving": property_value.actuatorState in (
-                weave_security_pb2.BoltLockTrait.BoltActuatorState.BOLT_ACTUATOR_STATE_LOCKING,
-                weave_security_pb2.BoltLockTrait.BoltActuatorState.BOLT_ACTUATOR_STATE_UNLOCKING,
-                weave_security_pb2.BoltLockTrait.BoltActuatorState.BOLT_ACTUATOR_STATE_MOVING
+                BoltLockTrait.BoltActuatorState.BOLT_ACTUATOR_STATE_LOCKING,
+                BoltLockTrait.BoltActuatorState.BOLT_ACTUATOR_STATE_UNLOCKING,
+                BoltLockTrait.BoltActuatorState.BOLT_ACTUATOR_STATE_MOVING
             ),
-            "bolt_moving_to": property_value.actuatorState == weave_security_pb2.BoltLockTrait.BoltActuatorState.BOLT_ACTUATOR_STATE_LOCKING,
+            "bolt_moving_to": property_value.actuatorState == BoltLockTrait.BoltActuatorState.BOLT_ACTUATOR_STATE_LOCKING,
             "using_protobuf": True
         }
 
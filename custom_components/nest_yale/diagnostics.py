@@ -0,0 +1,125 @@
+"""Diagnostics download: a redacted state and performance snapshot.
+
+Everything here is read from state the integration keeps anyway (metrics,
+the last lock snapshot, the token manager), so generating it needs no debug
+logging and no extra traffic to Nest.
+"""
+from datetime import datetime, timezone
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from .const import CONF_API_KEY, CONF_COOKIES, CONF_ISSUE_TOKEN, DIAGNOSTICS_RECENT_SAMPLES, DOMAIN
+
+TO_REDACT = {
+    CONF_ISSUE_TOKEN,
+    CONF_API_KEY,
+    CONF_COOKIES,
+    "access_token",
+    "id_token",
+    "user_id",
+    "actor_originator",
+    "structure_id",
+    "serial_number",
+    "device_id",
+    "lock_id",
+    "door_sensor_id",
+}
+
+
+def _recent(histogram, scale, digits):
+    samples = list(histogram.recent)[-DIAGNOSTICS_RECENT_SAMPLES:]
+    return [round(value * scale, digits) for value in samples]
+
+
+def _percentiles(histogram, scale, digits):
+    summary = {}
+    for q in (50, 90, 95, 99):
+        value = histogram.percentile(q)
+        summary[f"p{q}"] = None if value is None else round(value * scale, digits)
+    summary["count"] = histogram.count
+    return summary
+
+
+def _timestamp(epoch):
+    if epoch is None:
+        return None
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).isoformat()
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry):
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    diagnostics = {"entry": async_redact_data(dict(entry.data), TO_REDACT)}
+    if coordinator is None:
+        diagnostics["loaded"] = False
+        return diagnostics
+
+    api_client = coordinator.api_client
+    handler = api_client.protobuf_handler
+    metrics = coordinator.metrics
+    token_manager = api_client.token_manager
+    last_frame_age = metrics.seconds_since_last_frame
+
+    diagnostics.update({
+        "loaded": True,
+        "protobuf": {
+            "backend": handler.decoder.backend,
+            "decode_strategy": handler.decoder.strategy,
+        },
+        "token": {
+            "valid": token_manager.is_valid(),
+            "expires_at": _timestamp(token_manager.expires_at),
+            "seconds_until_expiry": (
+                None if token_manager.seconds_until_expiry is None
+                else round(token_manager.seconds_until_expiry)
+            ),
+            "refresh_count": token_manager.refresh_count,
+        },
+        "stream": {
+            "connected": metrics.stream_connected_at is not None,
+            "uptime_seconds": metrics.stream_uptime.value,
+            "seconds_since_last_frame": None if last_frame_age is None else round(last_frame_age, 1),
+            "reconnects": metrics.reconnects.value,
+            "frames_received": metrics.frames_received.value,
+            "bytes_received": metrics.bytes_received.value,
+            "stale_updates_dropped": metrics.stale_updates.value,
+            "traits_decoded": metrics.traits_decoded.as_dict(),
+            "recent_frame_bytes": [int(v) for v in _recent(metrics.frame_size, 1, 0)],
+            "recent_decode_us": _recent(metrics.decode_time, 1e6, 1),
+            "decode_us": _percentiles(metrics.decode_time, 1e6, 1),
+        },
+        "decode_errors": {
+            "total": metrics.decode_errors.value,
+            # Payloads are hashed, never included: they can carry user IDs
+            "recent": [
+                dict(error, at=_timestamp(error["at"]))
+                for error in reversed(handler.decode_errors)
+            ],
+        },
+        "commands": {
+            "by_result": metrics.commands.as_dict(),
+            "latency_ms": _percentiles(metrics.command_latency, 1e3, 0),
+        },
+        "events": {
+            "fired": metrics.event_latency.count,
+            "fire_latency_ms": _percentiles(metrics.event_latency, 1e3, 3),
+        },
+        "startup": coordinator.startup_timeline.as_dict(),
+        "trait_store": async_redact_data(
+            {
+                "user_id": api_client.user_id,
+                "structure_id": api_client.structure_id,
+                # Keyed by position: the device IDs themselves are redacted
+                "locks": {
+                    f"lock_{index}": {
+                        "state": device.as_dict(),
+                        "metadata": api_client.get_device_metadata(device_id),
+                        "available": coordinator.device_available(device_id),
+                    }
+                    for index, (device_id, device) in enumerate((coordinator.data or {}).items(), 1)
+                },
+            },
+            TO_REDACT,
+        ),
+    })
+    return diagnostics
@@ -0,0 +1,63 @@
+import logging
+from homeassistant.core import callback
+from homeassistant.helpers.entity import Entity
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_add_device_entities(entry, coordinator, async_add_entities, factory):
+    """Add entities for every lock now and for locks that appear later.
+
+    `factory(coordinator, device_id)` returns the entities for one lock.
+    """
+    known_ids = set()
+
+    @callback
+    def _async_add_new():
+        entities = []
+        for device_id in coordinator.data or {}:
+            if device_id not in known_ids:
+                known_ids.add(device_id)
+                entities.extend(factory(coordinator, device_id))
+        if entities:
+            async_add_entities(entities)
+
+    _async_add_new()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new))
+
+
+class NestYaleDeviceEntity(Entity):
+    """Entity reading one lock's record, attached to the lock's device."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, coordinator, device_id, key):
+        self._coordinator = coordinator
+        self._device_id = device_id
+        self._attr_unique_id = f"{DOMAIN}_{device_id}_{key}"
+        metadata = coordinator.api_client.get_device_metadata(device_id)
+        # Same identifiers as the lock entity, so HA groups them on one device
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, metadata["serial_number"])},
+            "manufacturer": "Nest",
+            "model": "Nest x Yale Lock",
+            "name": metadata["name"],
+            "sw_version": metadata["firmware_revision"],
+        }
+
+    @property
+    def record(self):
+        return (self._coordinator.data or {}).get(self._device_id)
+
+    @property
+    def available(self):
+        return self._coordinator.device_available(self._device_id)
+
+    async def async_added_to_hass(self):
+        # Only woken when this lock's own record changed
+        self.async_on_remove(
+            self._coordinator.async_add_device_listener(self._device_id, self.async_write_ha_state)
+        )
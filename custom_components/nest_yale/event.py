@@ -0,0 +1,47 @@
+import logging
+from homeassistant.components.event import EventEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from .const import DOMAIN
+from .entity import NestYaleDeviceEntity, async_add_device_entities
+from .models import KeypadEntry, PincodeEntryResult
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_device_entities(
+        entry,
+        coordinator,
+        async_add_entities,
+        lambda coordinator, device_id: [NestYaleKeypadEvent(coordinator, device_id)],
+    )
+
+
+class NestYaleKeypadEvent(NestYaleDeviceEntity, EventEntity):
+    """Keypad code entries on one lock, pushed from the Observe stream."""
+
+    _attr_name = "Keypad"
+    _attr_event_types = [result.slug for result in PincodeEntryResult]
+
+    def __init__(self, coordinator, device_id):
+        super().__init__(coordinator, device_id, "keypad")
+
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._coordinator.async_add_event_listener(self._device_id, self._handle_event)
+        )
+
+    @callback
+    def _handle_event(self, event):
+        if not isinstance(event, KeypadEntry):
+            return
+        self._trigger_event(event.result.slug, {
+            "user_id": event.user_id,
+            "slot": event.slot,
+            "invalid_entry_count": event.invalid_entry_count,
+        })
+        self.async_write_ha_state()
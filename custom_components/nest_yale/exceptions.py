@@ -0,0 +1,40 @@
+"""Exceptions raised by the Nest Yale integration."""
+from .const import COMMAND_RETRYABLE_STATUS_CODES, GRPC_STATUS_NAMES
+
+
+class NestYaleError(Exception):
+    """Base class for Nest Yale errors."""
+
+
+class NestAuthError(NestYaleError):
+    """Authentication failed or the access token was rejected (HTTP 401)."""
+
+
+class NestCommandError(NestYaleError):
+    """A SendCommand request was rejected by the Nest API."""
+
+    retryable = False
+
+    def __init__(self, code, message=None, device_id=None):
+        self.code = code
+        self.status_name = GRPC_STATUS_NAMES.get(code, f"STATUS_{code}")
+        self.device_id = device_id
+        detail = f": {message}" if message else ""
+        super().__init__(f"Command for {device_id} failed with {self.status_name} ({code}){detail}")
+
+
+class NestCommandRetryableError(NestCommandError):
+    """A transient SendCommand failure that is safe to resend immediately."""
+
+    retryable = True
+
+
+class NestCommandDecodeError(NestCommandError):
+    """The SendCommand response body could not be decoded."""
+
+
+def command_error_from_status(code, message=None, device_id=None):
+    """Map a nest.rpc.Status code onto the matching typed command error."""
+    if code in COMMAND_RETRYABLE_STATUS_CODES:
+        return NestCommandRetryableError(code, message, device_id)
+    return NestCommandError(code, message, device_id)
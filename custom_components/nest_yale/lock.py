@@ -1,61 +1,39 @@
 import logging
 import asyncio
+from functools import partial
 from homeassistant.components.lock import LockEntity, LockState
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from .const import DOMAIN
-from .proto.weave.trait import security_pb2 as weave_security_pb2
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+from .const import BOLT_MOVING_TIMEOUT_SECONDS, DOMAIN, ENTITY_SETUP_TIMEOUT_SECONDS
+from .entity import async_add_device_entities
+from .exceptions import NestCommandError
+from . import trait_registry
 
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     _LOGGER.debug("Starting async_setup_entry for lock platform, entry_id: %s", entry.entry_id)
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    locks_data = coordinator.data
-    _LOGGER.debug("Coordinator data at setup: %s", locks_data)
-
-    if locks_data is None or not locks_data:
-        _LOGGER.warning("No lock data available yet, waiting for observer updates.")
-        await asyncio.sleep(5)
-        locks_data = coordinator.data
-        if not locks_data:
-            _LOGGER.error("Still no lock data after waiting, setup failed.")
-            return
-
-    locks = []
-    existing_entities = hass.data[DOMAIN].get("entities", [])
-    existing_ids = {entity.unique_id for entity in existing_entities}
-    _LOGGER.debug("Existing entity IDs: %s", existing_ids)
-
-    for device_id, device in locks_data.items():
-        _LOGGER.debug("Processing device_id: %s, device: %s", device_id, device)
-        if not isinstance(device, dict):
-            _LOGGER.warning("Invalid device entry for %s: %s", device_id, device)
-            continue
-        if "device_id" not in device:
-            _LOGGER.warning("Skipping device without 'device_id': %s", device)
-            continue
-        unique_id = f"{DOMAIN}_{device_id}"
-        if unique_id not in existing_ids:
-            lock = NestYaleLock(coordinator, device)
-            locks.append(lock)
-            hass.data[DOMAIN]["entities"].append(lock)
-            _LOGGER.debug("Added new lock entity: %s", unique_id)
-
-    if locks:
-        _LOGGER.info("Adding %d Nest Yale locks", len(locks))
-        async_add_entities(locks)
-    else:
-        _LOGGER.warning("No valid locks found to add.")
+    if not await coordinator.async_wait_ready(ENTITY_SETUP_TIMEOUT_SECONDS):
+        _LOGGER.warning("No lock data after %ss, locks will be added as they appear in the stream",
+                        ENTITY_SETUP_TIMEOUT_SECONDS)
+    _LOGGER.debug("Coordinator data at setup: %s", coordinator.data)
+    # Locks that show up later in the stream get entities without a reload
+    async_add_device_entities(
+        entry,
+        coordinator,
+        async_add_entities,
+        lambda coordinator, device_id: [NestYaleLock(coordinator, coordinator.data[device_id])],
+    )
 
 class NestYaleLock(LockEntity):
     def __init__(self, coordinator, device):
         self._coordinator = coordinator
-        self._device = device.copy()
-        self._device["bolt_moving"] = False
-        self._device["bolt_moving_to"] = None
-        self._device_id = device.get("device_id")
+        self._record = device.evolve(bolt_moving=False, bolt_moving_to=None)
+        self._device_id = device.device_id
         self._attr_unique_id = f"{DOMAIN}_{self._device_id}"
         metadata = self._coordinator.api_client.get_device_metadata(self._device_id)
         self._attr_name = metadata["name"]
@@ -72,36 +50,49 @@ class NestYaleLock(LockEntity):
         self._attr_should_poll = False
         self._state = None
         self._user_id = self._coordinator.api_client.user_id
-        self._structure_id = self._coordinator.api_client.structure_id
         _LOGGER.debug("Initialized lock with user_id: %s, structure_id: %s, device_id=%s, unique_id=%s, entity_id=%s, device=%s",
-                      self._user_id, self._structure_id, self._device_id, self._attr_unique_id, self._attr_entity_id, self._device)
+                      self._user_id, self._structure_id, self._device_id, self._attr_unique_id, self._attr_entity_id, self._record)
+
+    @property
+    def _structure_id(self):
+        return self._coordinator.api_client.structure_for(self._device_id)
 
     @property
     def is_locked(self):
-        state = self._device.get("bolt_locked", False)
+        state = self._record.bolt_locked
         _LOGGER.debug("is_locked check for %s: %s", self._attr_unique_id, state)
         return state
 
     @property
     def is_locking(self):
-        state = self._device.get("bolt_moving", False) and self._device.get("bolt_moving_to", False)
+        state = self._record.bolt_moving and self._record.bolt_moving_to is True
         _LOGGER.debug("is_locking check for %s: %s", self._attr_unique_id, state)
         return state
 
     @property
     def is_unlocking(self):
-        state = self._device.get("bolt_moving", False) and not self._device.get("bolt_moving_to", True)
+        state = self._record.bolt_moving and self._record.bolt_moving_to is False
         _LOGGER.debug("is_unlocking check for %s: %s", self._attr_unique_id, state)
         return state
 
     @property
     def extra_state_attributes(self):
         serial_number = next(iter(self._attr_device_info["identifiers"]))[1]
+        relocks_at = self._coordinator.relocks_at(self._device_id)
         attrs = {
-            "bolt_moving": self._device.get("bolt_moving", False),
-            "bolt_moving_to": self._device.get("bolt_moving_to"),
-            "battery_status": self._device.get("battery_status"),
-            "battery_voltage": self._device.get("battery_voltage"),
+            "bolt_moving": self._record.bolt_moving,
+            "bolt_moving_to": self._record.bolt_moving_to,
+            # Who moved the bolt last, from BoltLockTrait.boltLockActor
+            "last_actor_method": self._record.actor_method.slug,
+            "last_actor": self._record.actor_originator,
+            "last_changed_at": (
+                None if self._record.locked_changed_at is None
+                else dt_util.utc_from_timestamp(self._record.locked_changed_at).isoformat()
+            ),
+            # Expected auto-relock, from (Enhanced)BoltLockSettingsTrait
+            "relocks_at": (
+                None if relocks_at is None else dt_util.utc_from_timestamp(relocks_at).isoformat()
+            ),
             "serial_number": serial_number,
             "firmware_revision": self._attr_device_info["sw_version"],
             "user_id": self._user_id,
@@ -121,10 +112,11 @@ class NestYaleLock(LockEntity):
         await self._send_command(False)
 
     async def _send_command(self, lock: bool):
-        state = weave_security_pb2.BoltLockTrait.BOLT_STATE_EXTENDED if lock else weave_security_pb2.BoltLockTrait.BOLT_STATE_RETRACTED
-        request = weave_security_pb2.BoltLockTrait.BoltLockChangeRequest()
+        BoltLockTrait = trait_registry.message_class("weave.trait.security.BoltLockTrait")
+        state = BoltLockTrait.BOLT_STATE_EXTENDED if lock else BoltLockTrait.BOLT_STATE_RETRACTED
+        request = BoltLockTrait.BoltLockChangeRequest()
         request.state = state
-        request.boltLockActor.method = weave_security_pb2.BoltLockTrait.BOLT_LOCK_ACTOR_METHOD_REMOTE_USER_EXPLICIT
+        request.boltLockActor.method = BoltLockTrait.BOLT_LOCK_ACTOR_METHOD_REMOTE_USER_EXPLICIT
         request.boltLockActor.originator.resourceId = str(self._user_id) if self._user_id else "UNKNOWN_USER_ID"
 
         cmd_any = {
@@ -138,29 +130,29 @@ class NestYaleLock(LockEntity):
         try:
             _LOGGER.debug("Sending %s command to %s with cmd_any (user_id=%s, structure_id=%s): %s",
                           "lock" if lock else "unlock", self._attr_unique_id, self._user_id, self._structure_id, cmd_any)
-            #response = await self._coordinator.api_client.send_command(cmd_any, self._device_id)
             response = await self._coordinator.api_client.send_command(
                 cmd_any,
                 self._device_id,
-                structure_id="2ce65ea0-9f27-11ee-9b42-122fc90603fd"
+                structure_id=self._structure_id,
             )
-            _LOGGER.debug("Lock command response: %s", response.hex())
-            if response.hex() == "12020802":  # Updated to match actual response
-                _LOGGER.warning("Command failed with 12020802, not updating local state")
-                return
+            _LOGGER.debug("Lock command response: %d bytes", len(response))
 
-            self._device["bolt_moving"] = True
-            self._device["bolt_moving_to"] = lock
+            self._record = self._record.evolve(bolt_moving=True, bolt_moving_to=lock)
             self._state = LockState.LOCKING if lock else LockState.UNLOCKING
             self.async_schedule_update_ha_state()  # Replace force_refresh
-            await asyncio.sleep(5)
-            self._device["bolt_moving"] = False
-            await self._coordinator.async_request_refresh()
-            _LOGGER.debug("Refresh successful, updated state: %s", self._device)
-
+            # Confirm the final state once the bolt should have settled
+            self._arm_bolt_moving_timeout(refresh=True)
+
+        except NestCommandError as e:
+            _LOGGER.warning("Command rejected for %s, not updating local state: %s", self._attr_unique_id, e)
+            self._coordinator.timers.cancel(self._bolt_moving_key)
+            self._record = self._record.evolve(bolt_moving=False)
+            self.async_schedule_update_ha_state()
+            raise HomeAssistantError(str(e)) from e
         except Exception as e:
             _LOGGER.error("Command failed for %s: %s", self._attr_unique_id, e, exc_info=True)
-            self._device["bolt_moving"] = False
+            self._coordinator.timers.cancel(self._bolt_moving_key)
+            self._record = self._record.evolve(bolt_moving=False)
             self.async_schedule_update_ha_state()  # Replace force_refresh
             raise
 
@@ -170,35 +162,52 @@ class NestYaleLock(LockEntity):
         def update_listener():
             new_data = self._coordinator.data.get(self._device_id)
             if new_data:
-                old_state = self._device.copy()
-                self._device.update(new_data)
-                if "bolt_moving" in new_data and new_data["bolt_moving"]:
-                    self._device["bolt_moving"] = True
-                    asyncio.create_task(self._clear_bolt_moving())
+                old_state = self._record
+                # The stream does not know which way a local command moves the bolt
+                self._record = new_data.evolve(
+                    bolt_moving_to=old_state.bolt_moving_to if new_data.bolt_moving else None
+                )
+                if new_data.bolt_moving:
+                    # Re-arming replaces the previous deadline, so only the latest move counts
+                    self._arm_bolt_moving_timeout(refresh=False)
                 else:
-                    self._device["bolt_moving"] = False
+                    self._coordinator.timers.cancel(self._bolt_moving_key)
                 if self.is_locked:
                     self._state = LockState.LOCKED
                 else:
                     self._state = LockState.UNLOCKED
                 self.async_write_ha_state()
-                _LOGGER.debug("Updated lock state for %s: old=%s, new=%s", self._attr_unique_id, old_state, self._device)
+                _LOGGER.debug("Updated lock state for %s: old=%s, new=%s", self._attr_unique_id, old_state, self._record)
             else:
                 _LOGGER.debug("No updated data for lock %s in coordinator", self._attr_unique_id)
-                self._device["bolt_moving"] = False
+                self._record = self._record.evolve(bolt_moving=False)
                 self.async_write_ha_state()
 
-        self.async_on_remove(self._coordinator.async_add_listener(update_listener))
+        # Only woken when this lock's own state changed
+        self.async_on_remove(self._coordinator.async_add_device_listener(self._device_id, update_listener))
 
-    async def _clear_bolt_moving(self):
-        await asyncio.sleep(5)
-        self._device["bolt_moving"] = False
-        self.async_schedule_update_ha_state()  # Replace force_refresh
+    @property
+    def _bolt_moving_key(self):
+        return ("bolt_moving", self._device_id)
+
+    @callback
+    def _arm_bolt_moving_timeout(self, refresh):
+        self._coordinator.timers.schedule(
+            self._bolt_moving_key, BOLT_MOVING_TIMEOUT_SECONDS, partial(self._clear_bolt_moving, refresh)
+        )
+
+    @callback
+    def _clear_bolt_moving(self, refresh):
+        self._record = self._record.evolve(bolt_moving=False)
+        self.async_write_ha_state()
         _LOGGER.debug("Cleared bolt_moving for %s after delay", self._attr_unique_id)
+        # An expected auto-relock gets its own fetch if it is not pushed in time
+        if refresh and self._coordinator.relocks_at(self._device_id) is None:
+            self.hass.async_create_task(self._coordinator.async_request_refresh())
 
     @property
     def available(self):
-        available = bool(self._device)
+        available = self._coordinator.device_available(self._device_id)
         _LOGGER.debug("Availability check for %s: %s", self._attr_unique_id, available)
         return available
 
@@ -226,4 +235,5 @@ class NestYaleLock(LockEntity):
         await asyncio.sleep(0.1)
 
     async def async_will_remove_from_hass(self):
-        _LOGGER.debug("Removing entity %s from HA", self._attr_unique_id)
\ No newline at end of file
+        _LOGGER.debug("Removing entity %s from HA", self._attr_unique_id)
+        self._coordinator.timers.cancel(self._bolt_moving_key)
\ No newline at end of file
@@ -0,0 +1,227 @@
+"""In-process metrics for the stream, decode and command paths.
+
+Each config entry owns one ``MetricsRegistry``; the API client, connection,
+protobuf handler, token manager and coordinator record into it. Recording is
+a dict lookup and an add, cheap enough for the per-frame path. The registry
+backs the diagnostic sensors and can be rendered as a Prometheus text
+exposition snapshot.
+"""
+import time
+import bisect
+from collections import deque
+
+PREFIX = "nest_yale_"
+
+# Upper bounds in seconds; frame decodes sit in the tens of microseconds,
+# commands in the hundreds of milliseconds.
+DECODE_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05)
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144)
+EVENT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.1)
+RECENT_SAMPLES = 256
+
+
+class Counter:
+    """Monotonic counter, optionally split by a single label."""
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, label=None):
+        self.name = name
+        self.documentation = documentation
+        self.label = label
+        self.values = {}
+
+    def inc(self, amount=1, label_value=None):
+        self.values[label_value] = self.values.get(label_value, 0) + amount
+
+    @property
+    def value(self):
+        return sum(self.values.values())
+
+    def samples(self):
+        if not self.values:
+            yield self.name, {}, 0
+        for label_value, value in self.values.items():
+            labels = {self.label: label_value} if self.label and label_value is not None else {}
+            yield self.name, labels, value
+
+    def as_dict(self):
+        if self.label:
+            return {str(k): v for k, v in self.values.items()}
+        return self.value
+
+
+class Gauge:
+    """Point-in-time value, either set directly or read from a callable."""
+
+    kind = "gauge"
+
+    def __init__(self, name, documentation, func=None):
+        self.name = name
+        self.documentation = documentation
+        self._func = func
+        self._value = 0
+
+    def set(self, value):
+        self._value = value
+
+    @property
+    def value(self):
+        return self._func() if self._func else self._value
+
+    def samples(self):
+        yield self.name, {}, self.value
+
+    def as_dict(self):
+        return self.value
+
+
+class Histogram:
+    """Bucketed distribution plus a window of recent samples for percentiles."""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, buckets):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.recent = deque(maxlen=RECENT_SAMPLES)
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.recent.append(value)
+
+    @property
+    def last(self):
+        return self.recent[-1] if self.recent else None
+
+    @property
+    def mean(self):
+        return self.sum / self.count if self.count else None
+
+    def percentile(self, q):
+        """Nearest-rank percentile (0-100) over the recent window."""
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def samples(self):
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            yield f"{self.name}_bucket", {"le": repr(float(bound))}, cumulative
+        yield f"{self.name}_bucket", {"le": "+Inf"}, self.count
+        yield f"{self.name}_sum", {}, self.sum
+        yield f"{self.name}_count", {}, self.count
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+class MetricsRegistry:
+    """All metrics for one config entry, keyed by name without the prefix."""
+
+    def __init__(self):
+        self._metrics = {}
+        self.created_at = time.time()
+
+        self.bytes_received = self.counter("stream_bytes_received_total", "Bytes read from the Observe stream")
+        self.frames_received = self.counter("stream_frames_total", "Observe frames handed to the decoder")
+        self.frame_size = self.histogram("stream_frame_bytes", "Observe frame size in bytes", SIZE_BUCKETS)
+        self.decode_time = self.histogram("frame_decode_seconds", "Time to decode one Observe frame", DECODE_BUCKETS)
+        self.traits_decoded = self.counter("traits_decoded_total", "Trait payloads decoded", label="trait")
+        self.decode_errors = self.counter("decode_errors_total", "Observe frames that failed to decode")
+        self.reconnects = self.counter("stream_reconnects_total", "Observe stream reconnect attempts")
+        self.stream_connected_at = None  # monotonic, None while disconnected
+        self.last_frame_at = None  # perf_counter of the last decoded frame
+        self.stream_uptime = self.gauge(
+            "stream_uptime_seconds", "Seconds since the current Observe stream connected", self._stream_uptime
+        )
+        self.command_latency = self.histogram(
+            "command_latency_seconds", "SendCommand round trip, retries included", LATENCY_BUCKETS
+        )
+        self.event_latency = self.histogram(
+            "event_fire_seconds", "Frame arrival to stream event fired on the bus", EVENT_BUCKETS
+        )
+        self.commands = self.counter("commands_total", "Commands sent", label="result")
+        self.auth_refreshes = self.counter("auth_refreshes_total", "Nest JWT exchanges")
+        self.stale_updates = self.counter(
+            "stale_updates_dropped_total", "Observer updates dropped because nothing changed"
+        )
+
+    def counter(self, name, documentation, label=None):
+        return self._register(Counter(PREFIX + name, documentation, label))
+
+    def gauge(self, name, documentation, func=None):
+        return self._register(Gauge(PREFIX + name, documentation, func))
+
+    def histogram(self, name, documentation, buckets):
+        return self._register(Histogram(PREFIX + name, documentation, buckets))
+
+    def _register(self, metric):
+        self._metrics[metric.name[len(PREFIX):]] = metric
+        return metric
+
+    def get(self, name):
+        return self._metrics.get(name)
+
+    def stream_connected(self):
+        self.stream_connected_at = time.monotonic()
+
+    def stream_disconnected(self):
+        self.stream_connected_at = None
+
+    @property
+    def seconds_since_last_frame(self):
+        if self.last_frame_at is None:
+            return None
+        return time.perf_counter() - self.last_frame_at
+
+    def _stream_uptime(self):
+        if self.stream_connected_at is None:
+            return 0
+        return round(time.monotonic() - self.stream_connected_at, 1)
+
+    def as_dict(self):
+        return {name: metric.as_dict() for name, metric in self._metrics.items()}
+
+    def prometheus_text(self, labels=None):
+        """Render a Prometheus text exposition (format 0.0.4) snapshot."""
+        base = labels or {}
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, sample_labels, value in metric.samples():
+                merged = {**base, **sample_labels}
+                if merged:
+                    rendered = ",".join(f'{k}="{_escape(v)}"' for k, v in merged.items())
+                    lines.append(f"{name}{{{rendered}}} {_format(value)}")
+                else:
+                    lines.append(f"{name} {_format(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value):
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
@@ -0,0 +1,392 @@
+"""Typed device state shared between the decoder, coordinator and entities.
+
+Records are frozen and slotted: every holder (API client, coordinator data,
+entities) references the same instance, and a change produces a new record
+via ``evolve`` instead of mutating one in place. Equality is a field-wise
+tuple compare, so delta detection never walks nested dicts.
+"""
+import sys
+import hmac
+import hashlib
+import secrets
+from dataclasses import dataclass, fields, replace
+from enum import IntEnum
+from types import MappingProxyType
+
+# Coordinator data is always a read-only device_id -> record mapping
+EMPTY_SNAPSHOT = MappingProxyType({})
+
+# Keys PIN digests. A plain hash of a 4-8 digit code is reversed by trying
+# every code, so digests are only comparable within this process.
+_PIN_DIGEST_KEY = secrets.token_bytes(32)
+
+
+class ActuatorState(IntEnum):
+    """weave.trait.security.BoltLockTrait.BoltActuatorState."""
+
+    UNSPECIFIED = 0
+    OK = 1
+    LOCKING = 2
+    UNLOCKING = 3
+    MOVING = 4
+    JAMMED_LOCKING = 5
+    JAMMED_UNLOCKING = 6
+    JAMMED_OTHER = 7
+
+    @classmethod
+    def coerce(cls, value):
+        try:
+            return cls(value)
+        except ValueError:
+            return cls.UNSPECIFIED
+
+    @property
+    def jammed(self):
+        return self in (ActuatorState.JAMMED_LOCKING, ActuatorState.JAMMED_UNLOCKING, ActuatorState.JAMMED_OTHER)
+
+
+class ActorMethod(IntEnum):
+    """weave.trait.security.BoltLockTrait.BoltLockActorMethod: how the bolt was moved."""
+
+    UNSPECIFIED = 0
+    OTHER = 1
+    PHYSICAL = 2  # thumb turn or key
+    KEYPAD_PIN = 3
+    LOCAL_IMPLICIT = 4  # auto-relock and other lock-initiated moves
+    REMOTE_USER_EXPLICIT = 5
+    REMOTE_USER_IMPLICIT = 6
+    REMOTE_USER_OTHER = 7
+    REMOTE_DELEGATE = 8
+    LOW_POWER_SHUTDOWN = 9
+    VOICE_ASSISTANT = 10
+
+    @classmethod
+    def coerce(cls, value):
+        try:
+            return cls(value)
+        except ValueError:
+            return cls.UNSPECIFIED
+
+    @property
+    def slug(self):
+        return self.name.lower()
+
+
+class BatteryReplacement(IntEnum):
+    """weave.trait.power.BatteryPowerSourceTrait.BatteryReplacementIndicator."""
+
+    UNSPECIFIED = 0
+    NOT_AT_ALL = 1
+    SOON = 2
+    IMMEDIATELY = 3
+
+    @classmethod
+    def coerce(cls, value):
+        try:
+            return cls(value)
+        except ValueError:
+            return cls.UNSPECIFIED
+
+
+class PincodeEntryResult(IntEnum):
+    """weave.trait.security.PincodeInputTrait.PincodeEntryResult."""
+
+    UNSPECIFIED = 0
+    FAILURE_INVALID_PINCODE = 1
+    FAILURE_OUT_OF_SCHEDULE = 2
+    FAILURE_PINCODE_DISABLED = 3
+    SUCCESS = 4
+
+    @classmethod
+    def coerce(cls, value):
+        try:
+            return cls(value)
+        except ValueError:
+            return cls.UNSPECIFIED
+
+    @property
+    def slug(self):
+        return self.name.lower()
+
+
+class TamperState(IntEnum):
+    """weave.trait.security.TamperTrait.TamperState."""
+
+    UNSPECIFIED = 0
+    CLEAR = 1
+    TAMPERED = 2
+    UNKNOWN = 3
+
+    @classmethod
+    def coerce(cls, value):
+        try:
+            return cls(value)
+        except ValueError:
+            return cls.UNSPECIFIED
+
+
+class OpenCloseState(IntEnum):
+    """nest.trait.detector.OpenCloseTrait.OpenCloseState."""
+
+    UNSPECIFIED = 0
+    CLOSED = 1
+    OPEN = 2
+    UNKNOWN = 3
+    INVALID_CALIBRATION = 4
+
+    @classmethod
+    def coerce(cls, value):
+        try:
+            return cls(value)
+        except ValueError:
+            return cls.UNSPECIFIED
+
+
+class LivenessStatus(IntEnum):
+    """weave.trait.heartbeat.LivenessTrait.LivenessDeviceStatus."""
+
+    UNSPECIFIED = 0
+    ONLINE = 1
+    UNREACHABLE = 2
+    UNINITIALIZED = 3
+    REBOOTING = 4
+    UPGRADING = 5
+    SCHEDULED_DOWN = 6
+
+    @classmethod
+    def coerce(cls, value):
+        try:
+            return cls(value)
+        except ValueError:
+            return cls.UNSPECIFIED
+
+
+def intern_id(resource_id):
+    """Intern a resource ID so every record and dict key shares one string."""
+    return sys.intern(resource_id) if resource_id else resource_id
+
+
+@dataclass(frozen=True, slots=True)
+class LockStateRecord:
+    """State of one lock as reported by its traits, plus local motion hints."""
+
+    device_id: str
+    bolt_locked: bool = False
+    actuator_state: ActuatorState = ActuatorState.UNSPECIFIED
+    bolt_moving: bool = False
+    bolt_moving_to: bool | None = None  # True while locking, False while unlocking
+    # BatteryPowerSourceTrait; None until the lock has reported it
+    battery_voltage: float | None = None
+    battery_percent: float | None = None
+    battery_replacement: BatteryReplacement = BatteryReplacement.UNSPECIFIED
+    # boltLockActor and lockedStateLastChangedAt of the last bolt change
+    actor_method: ActorMethod = ActorMethod.UNSPECIFIED
+    actor_originator: str | None = None
+    locked_changed_at: float | None = None  # epoch seconds
+    tamper_state: TamperState = TamperState.UNSPECIFIED
+    # DoorCheckSettingsTrait, and OpenCloseTrait of the paired door sensor
+    door_check_enabled: bool | None = None
+    door_sensor_id: str | None = None
+    door_state: OpenCloseState = OpenCloseState.UNSPECIFIED
+    # LivenessTrait: the cloud's view of the lock's heartbeat
+    liveness: LivenessStatus = LivenessStatus.UNSPECIFIED
+    max_inactivity: float | None = None  # heartbeat window in seconds
+    # (Enhanced)BoltLockSettingsTrait
+    auto_relock_on: bool | None = None
+    auto_relock_duration: float | None = None  # seconds after an unlock
+
+    @property
+    def battery_low(self):
+        """True once the lock asks for new batteries; None when not reported."""
+        if self.battery_replacement is BatteryReplacement.UNSPECIFIED:
+            return None
+        return self.battery_replacement >= BatteryReplacement.SOON
+
+    @property
+    def reachable(self):
+        """False once the cloud reports the lock offline; unknown counts as reachable."""
+        return self.liveness in (LivenessStatus.UNSPECIFIED, LivenessStatus.ONLINE)
+
+    @property
+    def tampered(self):
+        """None while the lock reports no (or an unknown) tamper state."""
+        if self.tamper_state is TamperState.TAMPERED:
+            return True
+        return False if self.tamper_state is TamperState.CLEAR else None
+
+    @property
+    def door_open(self):
+        """None when door check is off or the sensor has no usable reading."""
+        if self.door_check_enabled is False:
+            return None
+        if self.door_state is OpenCloseState.OPEN:
+            return True
+        return False if self.door_state is OpenCloseState.CLOSED else None
+
+    def evolve(self, **changes):
+        """Copy-on-write: a new record with `changes`, or self when nothing differs."""
+        for name, value in changes.items():
+            if getattr(self, name) != value:
+                return replace(self, **changes)
+        return self
+
+    def as_dict(self):
+        """JSON-safe form for storage and diagnostics."""
+        return {
+            "device_id": self.device_id,
+            "bolt_locked": self.bolt_locked,
+            "actuator_state": int(self.actuator_state),
+            "bolt_moving": self.bolt_moving,
+            "bolt_moving_to": self.bolt_moving_to,
+            "battery_voltage": self.battery_voltage,
+            "battery_percent": self.battery_percent,
+            "battery_replacement": int(self.battery_replacement),
+            "actor_method": int(self.actor_method),
+            "actor_originator": self.actor_originator,
+            "locked_changed_at": self.locked_changed_at,
+            "tamper_state": int(self.tamper_state),
+            "door_check_enabled": self.door_check_enabled,
+            "door_sensor_id": self.door_sensor_id,
+            "door_state": int(self.door_state),
+            "liveness": int(self.liveness),
+            "max_inactivity": self.max_inactivity,
+            "auto_relock_on": self.auto_relock_on,
+            "auto_relock_duration": self.auto_relock_duration,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from ``as_dict`` output; unknown keys are ignored."""
+        known = {field.name for field in fields(cls)}
+        values = {key: value for key, value in data.items() if key in known}
+        values["device_id"] = intern_id(values["device_id"])
+        if "actuator_state" in values:
+            values["actuator_state"] = ActuatorState.coerce(values["actuator_state"])
+        if "battery_replacement" in values:
+            values["battery_replacement"] = BatteryReplacement.coerce(values["battery_replacement"])
+        if "actor_method" in values:
+            values["actor_method"] = ActorMethod.coerce(values["actor_method"])
+        if "tamper_state" in values:
+            values["tamper_state"] = TamperState.coerce(values["tamper_state"])
+        if "door_state" in values:
+            values["door_state"] = OpenCloseState.coerce(values["door_state"])
+        if "liveness" in values:
+            values["liveness"] = LivenessStatus.coerce(values["liveness"])
+        return cls(**values)
+
+
+@dataclass(frozen=True, slots=True)
+class LockActivity:
+    """One bolt movement: who moved it, how, and what it ended up as."""
+
+    device_id: str
+    timestamp: float  # epoch seconds, as reported by the lock when known
+    bolt_locked: bool | None
+    actuator_state: ActuatorState
+    method: ActorMethod
+    originator: str | None = None  # resource ID of the user, when known
+    agent: str | None = None  # resource ID of the app/device acting for them
+    source: str = "state"  # "state": BoltLockTrait change, "event": BoltActuatorStateChangeEvent
+
+    @property
+    def action(self):
+        if self.actuator_state.jammed:
+            return "jammed"
+        if self.bolt_locked is None:
+            return "moving"
+        return "locked" if self.bolt_locked else "unlocked"
+
+    def as_event_data(self):
+        return {
+            "lock_id": self.device_id,
+            "action": self.action,
+            "method": self.method.slug,
+            "originator": self.originator,
+            "agent": self.agent,
+            "timestamp": self.timestamp,
+            "source": self.source,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class KeypadEntry:
+    """One code typed on a lock's keypad (PincodeInputTrait.KeypadEntryEvent)."""
+
+    device_id: str
+    timestamp: float  # epoch seconds, as reported by the lock when known
+    result: PincodeEntryResult
+    user_id: str | None = None  # owner of the matched code
+    slot: int | None = None  # UserPincodesSettingsTrait slot holding that code
+    invalid_entry_count: int = 0
+
+    def as_event_data(self):
+        return {
+            "lock_id": self.device_id,
+            "result": self.result.slug,
+            "user_id": self.user_id,
+            "slot": self.slot,
+            "invalid_entry_count": self.invalid_entry_count,
+            "timestamp": self.timestamp,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class TamperAlert:
+    """A lock's tamper state changed (TamperStateChangeEvent or TamperTrait)."""
+
+    device_id: str
+    timestamp: float  # epoch seconds, as reported by the lock when known
+    tamper_state: TamperState
+    prior_state: TamperState = TamperState.UNSPECIFIED
+
+    def as_event_data(self):
+        return {
+            "lock_id": self.device_id,
+            "tampered": self.tamper_state is TamperState.TAMPERED,
+            "state": self.tamper_state.name.lower(),
+            "prior_state": self.prior_state.name.lower(),
+            "timestamp": self.timestamp,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class PinCodeSlot:
+    """One entry of UserPincodesSettingsTrait.userPincodes, minus the code itself."""
+
+    slot: int | None  # None until the stream reports where the lock stored it
+    digest: str  # pin_digest of the code, for comparing against a roster
+    enabled: bool = True
+
+
+def pin_digest(pincode):
+    """HMAC-SHA256 of a code under a per-process key, as bytes from the trait or a string from a roster."""
+    if isinstance(pincode, str):
+        pincode = pincode.encode()
+    return hmac.new(_PIN_DIGEST_KEY, pincode, hashlib.sha256).hexdigest()
+
+
+def merge_snapshot(current, update, replace_all=False):
+    """Return a new read-only snapshot with `update` applied to `current`.
+
+    Records that compare equal to the ones already held are dropped in favour
+    of the held instance, so unchanged devices keep their identity across
+    snapshots and readers can detect changes with ``is``. A partial update
+    (one frame naming a subset of locks) leaves the other locks untouched;
+    with `replace_all` the update is the complete device set. Returns
+    `current` itself when nothing changed.
+    """
+    current = current or EMPTY_SNAPSHOT
+    merged = {}
+    changed = False
+    for device_id, record in update.items():
+        held = current.get(device_id)
+        if held is not None and held == record:
+            record = held
+        else:
+            changed = True
+        merged[device_id] = record
+    if replace_all:
+        changed = changed or len(merged) != len(current)
+    else:
+        merged = {**current, **merged}
+    return MappingProxyType(merged) if changed else current
@@ -0,0 +1,51 @@
+"""Opt-in, sampled hex dumps of raw stream frames and command payloads.
+
+Payload dumps are far too expensive and noisy for the regular debug log, so
+they go to a dedicated ``custom_components.nest_yale.payload`` logger that
+stays silent unless its level is set explicitly (inheriting DEBUG from the
+integration logger is not enough)::
+
+    logger:
+      logs:
+        custom_components.nest_yale.payload: debug
+
+Only every ``PAYLOAD_LOG_SAMPLE_EVERY``-th payload per channel is dumped,
+truncated to ``PAYLOAD_LOG_MAX_BYTES``. When disabled, ``log()`` costs one
+attribute read and a comparison; nothing is formatted.
+"""
+import logging
+from .const import PAYLOAD_LOG_MAX_BYTES, PAYLOAD_LOG_SAMPLE_EVERY
+
+_LOGGER = logging.getLogger(__name__.rpartition(".")[0] + ".payload")
+
+
+class PayloadLog:
+    """Sampled payload channel, e.g. ``PayloadLog("observe frame")``."""
+
+    def __init__(self, channel, every=PAYLOAD_LOG_SAMPLE_EVERY):
+        self.channel = channel
+        self.every = max(int(every), 1)
+        self.count = 0
+
+    def log(self, data, detail=None):
+        """Dump `data` if this payload is sampled; returns whether it was."""
+        level = _LOGGER.level
+        if level == logging.NOTSET or level > logging.DEBUG:
+            return False
+        self.count += 1
+        if (self.count - 1) % self.every:
+            return False
+        _LOGGER.debug(
+            "%s #%d (%d bytes%s): %s%s",
+            self.channel,
+            self.count,
+            len(data),
+            f", {detail}" if detail else "",
+            bytes(data[:PAYLOAD_LOG_MAX_BYTES]).hex(),
+            "..." if len(data) > PAYLOAD_LOG_MAX_BYTES else "",
+        )
+        return True
+
+    def log_message(self, message):
+        """Dump a decoded protobuf message as text; call only for sampled payloads."""
+        _LOGGER.debug("%s #%d decoded: %s", self.channel, self.count, message)
@@ -0,0 +1,149 @@
+"""Diff-based PIN roster sync across locks.
+
+The desired roster is compared per lock against the codes the Observe
+stream last reported (``NestProtobufHandler.pin_codes``, held in memory as
+HMACs under a per-process key, see ``models.pin_digest``). A
+lock is only sent the Set/Delete commands its diff calls for, so an
+unchanged roster sends nothing. Locks are synced concurrently up to a limit;
+each lock's own commands go one at a time.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from . import trait_registry
+from .models import PinCodeSlot, pin_digest
+
+_LOGGER = logging.getLogger(__name__)
+
+PINCODES_TRAIT = "weave.trait.security.UserPincodesSettingsTrait"
+TYPE_URL_PREFIX = "type.nestlabs.com/"
+# PincodeErrorCodes a lock answers with when it applied the change
+PINCODE_OK = frozenset((
+    "PINCODE_ERROR_CODES_UNSPECIFIED",
+    "PINCODE_ERROR_CODES_SUCCESS_PINCODE_DELETED",
+    "PINCODE_ERROR_CODES_SUCCESS_PINCODE_STATUS",
+))
+
+
+@dataclass(frozen=True, slots=True)
+class PinChange:
+    action: str  # "set" or "delete"
+    user_id: str
+    pin: str | None = None
+    enabled: bool = True
+
+
+def plan_changes(current, roster, prune):
+    """Commands that bring one lock's codes (`current`) in line with `roster`.
+
+    `current` maps user_id -> PinCodeSlot, `roster` maps user_id ->
+    (pin, enabled). With `prune`, users missing from the roster lose their
+    code; otherwise they are left alone.
+    """
+    changes = []
+    for user_id, (pin, enabled) in roster.items():
+        held = current.get(user_id)
+        if held is None or held.digest != pin_digest(pin) or held.enabled != enabled:
+            changes.append(PinChange("set", user_id, pin, enabled))
+    if prune:
+        changes.extend(PinChange("delete", user_id) for user_id in current if user_id not in roster)
+    return changes
+
+
+def _response_name(change):
+    name = "SetUserPincodeResponse" if change.action == "set" else "DeleteUserPincodeResponse"
+    return f"{PINCODES_TRAIT}.{name}"
+
+
+def _rejection(handler, raw, change):
+    """The PincodeErrorCodes failure the lock answered `change` with, or None.
+
+    SendCommand only reports transport-level failures; a lock refusing a code
+    (duplicate, too many, rate limited, ...) still returns an OK status.
+    """
+    codes = trait_registry.message_class(PINCODES_TRAIT).PincodeErrorCodes
+    for response in handler.decode_command_results(raw, _response_name(change)):
+        name = codes.Name(response.status) if response.status in codes.values() else str(response.status)
+        if name not in PINCODE_OK:
+            return name.removeprefix("PINCODE_ERROR_CODES_").lower()
+    return None
+
+
+def _command(change):
+    settings = trait_registry.message_class(PINCODES_TRAIT)
+    if change.action == "set":
+        request = settings.SetUserPincodeRequest()
+        request.userPincode.userId.resourceId = change.user_id
+        request.userPincode.pincode = change.pin.encode()
+        request.userPincode.pincodeCredentialEnabled.value = change.enabled
+        name = "SetUserPincodeRequest"
+    else:
+        request = settings.DeleteUserPincodeRequest()
+        request.userId.resourceId = change.user_id
+        name = "DeleteUserPincodeRequest"
+    return {
+        "traitLabel": "user_pincodes_settings",
+        "command": {
+            "type_url": f"{TYPE_URL_PREFIX}{PINCODES_TRAIT}.{name}",
+            "value": request.SerializeToString(),
+        },
+    }
+
+
+async def _sync_lock(api_client, device_id, roster, prune, dry_run, semaphore):
+    handler = api_client.protobuf_handler
+    current = handler.pin_codes.get(device_id)
+    if current is None:
+        return {"error": "PIN codes not reported by this lock yet", "commands": 0, "slots": []}
+    changes = plan_changes(current, roster, prune)
+    report = {"commands": 0, "slots": []}
+    for user_id, held in current.items():
+        if user_id in roster and not any(change.user_id == user_id for change in changes):
+            report["slots"].append({"user_id": user_id, "slot": held.slot, "action": "unchanged", "result": "ok"})
+    if not changes:
+        return report
+
+    async with semaphore:
+        for change in changes:
+            held = current.get(change.user_id)
+            entry = {"user_id": change.user_id, "slot": held.slot if held else None, "action": change.action}
+            if dry_run:
+                entry["result"] = "planned"
+                report["slots"].append(entry)
+                continue
+            report["commands"] += 1
+            try:
+                raw = await api_client.send_command(_command(change), device_id)
+                rejection = _rejection(handler, raw, change)
+            except Exception as e:
+                _LOGGER.warning("PIN %s for %s on %s failed: %s", change.action, change.user_id, device_id, e)
+                entry["result"] = getattr(e, "status_name", None) or str(e)
+            else:
+                if rejection:
+                    _LOGGER.warning("PIN %s for %s on %s rejected by the lock: %s",
+                                    change.action, change.user_id, device_id, rejection)
+                    entry["result"] = rejection
+                else:
+                    entry["result"] = "ok"
+                    # Reflect the change now so an immediate re-run is a no-op
+                    codes = dict(handler.pin_codes.get(device_id, {}))
+                    if change.action == "set":
+                        codes[change.user_id] = PinCodeSlot(
+                            slot=entry["slot"], digest=pin_digest(change.pin), enabled=change.enabled
+                        )
+                    else:
+                        codes.pop(change.user_id, None)
+                    handler.pin_codes[device_id] = codes
+            report["slots"].append(entry)
+    return report
+
+
+async def async_sync_pin_codes(api_client, device_ids, roster, prune, dry_run, semaphore):
+    """Sync `roster` onto every lock in `device_ids`; returns a report per lock.
+
+    `semaphore` bounds how many locks are being sent commands at once.
+    """
+    results = await asyncio.gather(*(
+        _sync_lock(api_client, device_id, roster, prune, dry_run, semaphore) for device_id in device_ids
+    ))
+    return dict(zip(device_ids, results))
@@ -0,0 +1,103 @@
+"""On-demand cProfile sessions over the decode and coordinator paths.
+
+Nothing is instrumented until a session starts: ``ProfileSession`` shadows
+the profiled methods with instance attributes for the duration of the
+session and deletes them afterwards, so the class methods are used again
+and the hot path carries no profiling hooks while profiling is off.
+
+The profiler is only enabled while a wrapped call is on the stack, which
+keeps the rest of the event loop (other integrations, HA itself) out of
+the results.
+"""
+import os
+import time
+import pstats
+import cProfile
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+# (attribute path from the coordinator, method name)
+PROFILED_METHODS = (
+    # Frame decode. The API client reassembles whole frames from stream reads
+    # and hands each to _process_message, which decodes it in _decode_message.
+    ("api_client.protobuf_handler", "_decode_message"),
+    # Fan-out of coordinator updates to generic and per-device entity listeners
+    ("", "async_update_listeners"),
+    ("", "_dispatch_device_updates"),
+    # Bus firing of stream events (lock activity, keypad entries)
+    ("", "_handle_events"),
+)
+
+
+def _resolve(root, path):
+    for attr in filter(None, path.split(".")):
+        root = getattr(root, attr)
+    return root
+
+
+class ProfileSession:
+    """One profiling run across the coordinators of the targeted entries."""
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+        self.calls = 0
+        self._depth = 0
+        self._patched = []
+        self.started_at = None
+        self.stopped_at = None
+
+    def start(self, coordinators):
+        self.started_at = time.monotonic()
+        for coordinator in coordinators:
+            for path, name in PROFILED_METHODS:
+                self._wrap(_resolve(coordinator, path), name)
+
+    def stop(self):
+        for target, name in self._patched:
+            try:
+                delattr(target, name)
+            except AttributeError:
+                pass
+        self._patched.clear()
+        self.stopped_at = time.monotonic()
+
+    def _wrap(self, target, name):
+        original = getattr(target, name)
+        profile = self.profile
+
+        def profiled(*args, **kwargs):
+            if self._depth:
+                return original(*args, **kwargs)
+            self._depth += 1
+            self.calls += 1
+            profile.enable()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                profile.disable()
+                self._depth -= 1
+
+        setattr(target, name, profiled)
+        self._patched.append((target, name))
+
+    def write_report(self, path, sort_by="cumulative", top=15):
+        """Dump pstats to `path` and return the top entries; blocking, run in an executor."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.profile.dump_stats(path)
+        if not self.calls:
+            return []
+        stats = pstats.Stats(self.profile)
+        stats.sort_stats(sort_by)
+        hotspots = []
+        for func in stats.fcn_list[:top]:
+            filename, line, function = func
+            primitive_calls, total_calls, own_time, cumulative_time, _ = stats.stats[func]
+            hotspots.append({
+                "function": f"{os.path.basename(filename)}:{line}({function})" if line else function,
+                "calls": total_calls,
+                "primitive_calls": primitive_calls,
+                "tottime_ms": round(own_time * 1000, 3),
+                "cumtime_ms": round(cumulative_time * 1000, 3),
+            })
+        return hotspots
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: nest/stream.proto
+# Protobuf Python Version: 5.29.0
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    0,
+    '',
+    'nest/stream.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
+from . import rpc_pb2 as nest_dot_rpc__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11nest/stream.proto\x12\x0bnest.stream\x1a\x19google/protobuf/any.proto\x1a\x0enest/rpc.proto\"5\n\x0cObjectIdPair\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0b\n\x03key\x18\x02 \x01(\t\x12\x0c\n\x04uuid\x18\x03 \x01(\t\">\n\x14\x44ynamicProp_Indirect\x12&\n\x08property\x18\x01 \x01(\x0b\x32\x14.google.protobuf.Any\"n\n\x10TraitGetProperty\x12)\n\x06object\x18\x01 \x01(\x0b\x32\x19.nest.stream.ObjectIdPair\x12/\n\x04\x64\x61ta\x18\x03 \x01(\x0b\x32!.nest.stream.DynamicProp_Indirect\"9\n\x0bNestMessage\x12*\n\x03get\x18\x03 \x03(\x0b\x32\x1d.nest.stream.TraitGetProperty\"g\n\nStreamBody\x12)\n\x07message\x18\x01 \x03(\x0b\x32\x18.nest.stream.NestMessage\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.nest.rpc.Status\x12\x0c\n\x04noop\x18\x0f \x03(\x0c\"$\n\x0eResourceFilter\x12\x12\n\ntrait_type\x18\x01 \x01(\t\"a\n\x0eObserveRequest\x12\x0f\n\x07version\x18\x01 \x01(\r\x12\x11\n\tsubscribe\x18\x02 \x01(\x08\x12+\n\x06\x66ilter\x18\x03 \x03(\x0b\x32\x1b.nest.stream.ResourceFilterb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'nest.stream_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_OBJECTIDPAIR']._serialized_start=77
+  _globals['_OBJECTIDPAIR']._serialized_end=130
+  _globals['_DYNAMICPROP_INDIRECT']._serialized_start=132
+  _globals['_DYNAMICPROP_INDIRECT']._serialized_end=194
+  _globals['_TRAITGETPROPERTY']._serialized_start=196
+  _globals['_TRAITGETPROPERTY']._serialized_end=306
+  _globals['_NESTMESSAGE']._serialized_start=308
+  _globals['_NESTMESSAGE']._serialized_end=365
+  _globals['_STREAMBODY']._serialized_start=367
+  _globals['_STREAMBODY']._serialized_end=470
+  _globals['_RESOURCEFILTER']._serialized_start=472
+  _globals['_RESOURCEFILTER']._serialized_end=508
+  _globals['_OBSERVEREQUEST']._serialized_start=510
+  _globals['_OBSERVEREQUEST']._serialized_end=607
+# @@protoc_insertion_point(module_scope)
@@ -1,53 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# NO CHECKED-IN PROTOBUF GENCODE
-# source: google/protobuf/wrappers.proto
-# Protobuf Python Version: 5.29.2
-"""Generated protocol buffer code."""
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import runtime_version as _runtime_version
-from google.protobuf import symbol_database as _symbol_database
-from google.protobuf.internal import builder as _builder
-_runtime_version.ValidateProtobufRuntimeVersion(
-    _runtime_version.Domain.PUBLIC,
-    5,
-    29,
-  2,
-    '',
-    'google/protobuf/wrappers.proto'
-)
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1egoogle/protobuf/wrappers.proto\x12\x0fgoogle.protobuf\"\x1c\n\x0b\x44oubleValue\x12\r\n\x05value\x18\x01 \x01(\x01\"\x1b\n\nFloatValue\x12\r\n\x05value\x18\x01 \x01(\x02\"\x1b\n\nInt64Value\x12\r\n\x05value\x18\x01 \x01(\x03\"\x1c\n\x0bUInt64Value\x12\r\n\x05value\x18\x01 \x01(\x04\"\x1b\n\nInt32Value\x12\r\n\x05value\x18\x01 \x01(\x05\"\x1c\n\x0bUInt32Value\x12\r\n\x05value\x18\x01 \x01(\r\"\x1a\n\tBoolValue\x12\r\n\x05value\x18\x01 \x01(\x08\"\x1c\n\x0bStringValue\x12\r\n\x05value\x18\x01 \x01(\t\"\x1b\n\nBytesValue\x12\r\n\x05value\x18\x01 \x01(\x0c\x42\x83\x01\n\x13\x63om.google.protobufB\rWrappersProtoP\x01Z1google.golang.org/protobuf/types/known/wrapperspb\xf8\x01\x01\xa2\x02\x03GPB\xaa\x02\x1eGoogle.Protobuf.WellKnownTypesb\x06proto3')
-
-_globals = globals()
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'google.protobuf.wrappers_pb2', _globals)
-if not _descriptor._USE_C_DESCRIPTORS:
-  _globals['DESCRIPTOR']._loaded_options = None
-  _globals['DESCRIPTOR']._serialized_options = b'\n\023com.google.protobufB\rWrappersProtoP\001Z1google.golang.org/protobuf/types/known/wrapperspb\370\001\001\242\002\003GPB\252\002\036Google.Protobuf.WellKnownTypes'
-  _globals['_DOUBLEVALUE']._serialized_start=51
-  _globals['_DOUBLEVALUE']._serialized_end=79
-  _globals['_FLOATVALUE']._serialized_start=81
-  _globals['_FLOATVALUE']._serialized_end=108
-  _globals['_INT64VALUE']._serialized_start=110
-  _globals['_INT64VALUE']._serialized_end=137
-  _globals['_UINT64VALUE']._serialized_start=139
-  _globals['_UINT64VALUE']._serialized_end=167
-  _globals['_INT32VALUE']._serialized_start=169
-  _globals['_INT32VALUE']._serialized_end=196
-  _globals['_UINT32VALUE']._serialized_start=198
-  _globals['_UINT32VALUE']._serialized_end=226
-  _globals['_BOOLVALUE']._serialized_start=228
-  _globals['_BOOLVALUE']._serialized_end=254
-  _globals['_STRINGVALUE']._serialized_start=256
-  _globals['_STRINGVALUE']._serialized_end=284
-  _globals['_BYTESVALUE']._serialized_start=286
-  _globals['_BYTESVALUE']._serialized_end=313
-# @@protoc_insertion_point(module_scope)
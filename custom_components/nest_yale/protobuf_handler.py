@@ -1,35 +1,93 @@
-import os
+import time
+import hashlib
 import logging
-import uuid
-import asyncio
-import aiofiles
+from collections import deque
 from google.protobuf.message import DecodeError
-from google.protobuf.any_pb2 import Any
-from .proto.weave.trait import security_pb2 as weave_security_pb2
-from .proto import root_pb2
-from .protobuf_manager import read_protobuf_file
+from . import trait_registry
+from .metrics import MetricsRegistry
+from .models import (
+    ActorMethod,
+    ActuatorState,
+    BatteryReplacement,
+    KeypadEntry,
+    LivenessStatus,
+    LockActivity,
+    LockStateRecord,
+    OpenCloseState,
+    PincodeEntryResult,
+    PinCodeSlot,
+    TamperAlert,
+    TamperState,
+    intern_id,
+    pin_digest,
+)
+from .payload_log import PayloadLog
 from .const import (
-    USER_AGENT_STRING,
-    URL_PROTOBUF,
-    ENDPOINT_OBSERVE,
-    PRODUCTION_HOSTNAME,
+    ACTIVITY_DEDUPE_SECONDS,
+    DECODE_ERROR_HISTORY,
 )
 
 _LOGGER = logging.getLogger(__name__)
-logging.basicConfig(level=logging.DEBUG, format="%(asctime)s [%(levelname)s] [%(name)s] %(message)s")
 
-MAX_BUFFER_SIZE = 4194304  # 4MB
-LOG_PAYLOAD_TO_FILE = True
-RETRY_DELAY_SECONDS = 10
-STREAM_TIMEOUT_SECONDS = 600  # 10min
-PING_INTERVAL_SECONDS = 60
-CATALOG_THRESHOLD = 20000  # 20KB
+BOLT_CHANGE_EVENT = "weave.trait.security.BoltLockTrait.BoltActuatorStateChangeEvent"
+KEYPAD_ENTRY_EVENT = "weave.trait.security.PincodeInputTrait.KeypadEntryEvent"
+TAMPER_CHANGE_EVENT = "weave.trait.security.TamperTrait.TamperStateChangeEvent"
+EVENT_NOTIFICATIONS = ("nestlabs.gateway.v1.TraitEventsNotification", "nestlabs.gateway.v1.ResourceEventsNotify")
+# Trait event type -> handler method
+EVENT_DECODERS = {
+    BOLT_CHANGE_EVENT: "_bolt_change_event",
+    KEYPAD_ENTRY_EVENT: "_keypad_entry_event",
+    TAMPER_CHANGE_EVENT: "_tamper_change_event",
+}
+# Both carry autoRelockOn/autoRelockDuration; newer locks report the enhanced one
+RELOCK_SETTINGS_TRAITS = frozenset((
+    "weave.trait.security.BoltLockSettingsTrait",
+    "nest.trait.security.EnhancedBoltLockSettingsTrait",
+))
+# Door sensors report either trait depending on the device generation
+OPEN_CLOSE_TRAITS = frozenset(("nest.trait.detector.OpenCloseTrait", "nest.trait.security.SecurityOpenCloseTrait"))
+EVENT_TYPES = frozenset((*EVENT_DECODERS, *EVENT_NOTIFICATIONS))
+
+
+def _epoch(timestamp):
+    """google.protobuf.Timestamp -> epoch seconds."""
+    return timestamp.seconds + timestamp.nanos / 1e9
+
+def _peek_varint(buffer):
+    """(value, size) of the varint at the start of `buffer`, or (None, 0) while incomplete."""
+    value = 0
+    for index, byte in enumerate(buffer[:10]):
+        value |= (byte & 0x7F) << (7 * index)
+        if not byte & 0x80:
+            return value, index + 1
+    return None, 0
+
 
 class NestProtobufHandler:
-    def __init__(self):
-        self.buffer = bytearray()
-        self.pending_length = None
-        self.stream_body = root_pb2.StreamBody()
+    def __init__(self, metrics=None):
+        self.metrics = metrics or MetricsRegistry()
+        self.stream_body_cls = trait_registry.load_module("nest.stream_pb2").StreamBody
+        self.stream_body = self.stream_body_cls()
+        self.decoder = trait_registry.TraitDecoder()
+        self.frame_log = PayloadLog("Observe frame")
+        self.decode_errors = deque(maxlen=DECODE_ERROR_HISTORY)
+        # Latest record per lock. Frames carry one trait at a time, so each
+        # frame's fields are folded into these rather than replacing them.
+        self.device_records = {}
+        self._unclaimed = {}  # device_id -> fields seen before its BoltLockTrait
+        self._last_activity = {}  # device_id -> LockActivity, to drop event/state duplicates
+        self.pin_codes = {}  # device_id -> {user_id: PinCodeSlot} from UserPincodesSettingsTrait
+        self._tamper_states = {}  # device_id -> TamperState last alerted, to drop event/state duplicates
+        self._door_sensors = {}  # door sensor device_id -> lock device_id, from DoorCheckSettingsTrait
+        self._door_states = {}  # door sensor device_id -> last OpenCloseState
+
+    def seed_records(self, records):
+        """Start from a restored snapshot so partial frames extend it."""
+        self.device_records.update(records)
+        for device_id, record in records.items():
+            self._tamper_states[device_id] = record.tamper_state
+            if record.door_sensor_id:
+                self._door_sensors[record.door_sensor_id] = device_id
 
     def _decode_varint(self, buffer, pos):
         value = 0
@@ -42,170 +100,473 @@ class NestProtobufHandler:
             pos += 1
             shift += 7
             if not (byte & 0x80):
-                _LOGGER.debug(f"Decoded varint: {value} from position {start} using {pos - start} bytes")
                 return value, pos
             if pos - start >= max_bytes:
-                _LOGGER.error(f"Varint too long at pos {start}")
+                _LOGGER.error("Varint too long at pos %d", start)
                 return None, pos
-        _LOGGER.error(f"Incomplete varint at pos {start}")
+        _LOGGER.error("Incomplete varint at pos %d", start)
         return None, pos
 
+    def _parse_command_response(self, raw):
+        """Parse a SendCommand response, returning it and its request-level statuses.
+
+        Field 2 is declared as a `string` (`unknown`) in the bundled schema but
+        carries a serialized nest.rpc.Status when the whole request is
+        rejected. Parsing it as a string fails UTF-8 validation as soon as the
+        status holds a byte >= 0x80, so it is cut out of the wire bytes first.
+        """
+        statuses, rest = self._split_field(bytes(raw), 2)
+        response = trait_registry.load_module("nestlabs.gateway.v1_pb2").ResourceCommandResponseFromAPI()
+        response.ParseFromString(rest)
+        return response, statuses
+
+    def _split_field(self, message, number):
+        """Split length-delimited field `number` out of serialized `message`.
+
+        Returns the field's payloads and the message bytes without it.
+        """
+        values = []
+        rest = bytearray()
+        pos = 0
+        while pos < len(message):
+            start = pos
+            tag, pos = self._decode_varint(message, pos)
+            if tag is None:
+                raise DecodeError("truncated tag")
+            wire_type = tag & 0x7
+            if wire_type == 0:
+                value, pos = self._decode_varint(message, pos)
+                if value is None:
+                    raise DecodeError("truncated varint")
+            elif wire_type == 1:
+                pos += 8
+            elif wire_type == 5:
+                pos += 4
+            elif wire_type == 2:
+                length, pos = self._decode_varint(message, pos)
+                if length is None:
+                    raise DecodeError("truncated length")
+                if tag >> 3 == number:
+                    values.append(message[pos:pos + length])
+                    pos += length
+                    if pos > len(message):
+                        raise DecodeError("truncated field")
+                    continue
+                pos += length
+            else:
+                raise DecodeError(f"unsupported wire type {wire_type}")
+            if pos > len(message):
+                raise DecodeError("truncated field")
+            rest += message[start:pos]
+        return values, bytes(rest)
+
+    @staticmethod
+    def pop_frames(buffer):
+        """Yield each complete length-prefixed frame at the front of `buffer`, consuming it."""
+        while buffer:
+            length, offset = _peek_varint(buffer)
+            if length is None or len(buffer) - offset < length:
+                return
+            frame = bytes(buffer[offset:offset + length])
+            del buffer[:offset + length]
+            yield frame
+
+    def decode_command_response(self, raw):
+        """Decode a SendCommand response body.
+
+        Returns a list of ``(code, message)`` tuples for every non-OK status
+        found, empty when the command was accepted.
+        """
+        if not raw:
+            return []
+
+        response, statuses = self._parse_command_response(raw)
+        failures = []
+        for payload in statuses:
+            status = trait_registry.load_module("nest.rpc_pb2").Status()
+            status.ParseFromString(payload)
+            if status.code:
+                failures.append((status.code, status.message))
+
+        for command_response in response.resouceCommandResponse:
+            for operation in command_response.traitOperations:
+                if operation.HasField("status") and operation.status.code:
+                    failures.append((operation.status.code, operation.status.message))
+        return failures
+
+    def decode_command_results(self, raw, name):
+        """Trait command responses of type `name` in a SendCommand response body.
+
+        The lock's answer to a trait command comes back either as a trait
+        operation's event or in the details of its status.
+        """
+        if not raw:
+            return []
+        response, _ = self._parse_command_response(raw)
+        cls = trait_registry.message_class(name)
+        results = []
+        for command_response in response.resouceCommandResponse:
+            for operation in command_response.traitOperations:
+                payloads = [operation.event.event] if operation.HasField("event") else []
+                payloads.extend(operation.status.details)
+                for payload in payloads:
+                    if trait_registry.type_name(payload.type_url) == name:
+                        results.append(cls.FromString(payload.value))
+        return results
+
     async def _process_message(self, message):
-        _LOGGER.debug(f"Raw chunk (length={len(message)}): {message.hex()}")
+        metrics = self.metrics
+        start = time.perf_counter()
+        locks_data = self._decode_message(message)
+        locks_data["received_at"] = start  # perf_counter, for frame-to-event latency
+        metrics.decode_time.observe(time.perf_counter() - start)
+        metrics.frames_received.inc()
+        metrics.last_frame_at = start
+        metrics.frame_size.observe(len(message))
+        return locks_data
+
+    def _record_decode_error(self, message, error, context):
+        """Keep a payload fingerprint of a failed decode for diagnostics."""
+        self.metrics.decode_errors.inc()
+        self.decode_errors.append({
+            "at": time.time(),
+            "context": context,
+            "error": str(error),
+            "size": len(message),
+            "sha256": hashlib.sha256(message).hexdigest(),
+        })
+
+    def _decode_message(self, message):
+        sampled = self.frame_log.log(message)
 
         if not message:
             _LOGGER.error("Empty protobuf message received.")
             return {"yale": {}, "user_id": None, "structure_id": None}
 
-        locks_data = {"yale": {}, "user_id": None, "structure_id": None}
+        locks_data = {"yale": {}, "user_id": None, "structure_id": None, "events": []}
 
         try:
-            self.stream_body.Clear()
-            self.stream_body.ParseFromString(message)
-            _LOGGER.debug(f"Parsed StreamBody: {self.stream_body}")
+            self.stream_body = self.decoder.decode_envelope(self.stream_body_cls, bytes(message))
+            if sampled:
+                self.frame_log.log_message(self.stream_body)
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
+            frame_structures = set()
+            patches = {}  # device_id -> record fields decoded from this frame
+            door_states = {}  # door sensor device_id -> OpenCloseState from this frame
 
             for msg in self.stream_body.message:
                 for get_op in msg.get:
-                    obj_id = get_op.object.id if get_op.object.id else None
+                    obj_id = intern_id(get_op.object.id) if get_op.object.id else None
                     obj_key = get_op.object.key if get_op.object.key else "unknown"
 
                     type_url = getattr(get_op.data.property, "type_url", None)
                     if not type_url and 7 in get_op:
                         type_url = "weave.trait.security.BoltLockTrait"
 
-                    _LOGGER.debug(f"Extracting `{type_url}` for `{obj_id}` with key `{obj_key}`")
+                    if debug:
+                        _LOGGER.debug("Extracting `%s` for `%s` with key `%s`", type_url, obj_id, obj_key)
 
-                    if "BoltLockTrait" in type_url and obj_id:
-                        bolt_lock = weave_security_pb2.BoltLockTrait()
+                    if trait_registry.type_name(type_url) == "weave.trait.security.BoltLockTrait" and obj_id:
+                        BoltLockTrait = trait_registry.message_class("weave.trait.security.BoltLockTrait")
                         try:
-                            unpacked = get_op.data.property.Unpack(bolt_lock)
-                            if not unpacked:
-                                _LOGGER.warning(f"Unpacking failed for {obj_id}, skipping")
-                                continue
-
-                            locks_data["yale"][obj_id] = {
-                                "device_id": obj_id,
-                                "bolt_locked": bolt_lock.lockedState == weave_security_pb2.BoltLockTrait.BOLT_LOCKED_STATE_LOCKED,
-                                "bolt_moving": bolt_lock.actuatorState not in [weave_security_pb2.BoltLockTrait.BOLT_ACTUATOR_STATE_OK],
-                                "actuator_state": bolt_lock.actuatorState
-                            }
+                            bolt_lock = self.decoder.decode(get_op.data.property, "weave.trait.security.BoltLockTrait")
+                            self.metrics.traits_decoded.inc(label_value="BoltLockTrait")
+
+                            actuator_state = ActuatorState.coerce(bolt_lock.actuatorState)
+                            actor = bolt_lock.boltLockActor
+                            patch = patches.setdefault(obj_id, {})
+                            patch.update(
+                                bolt_locked=bolt_lock.lockedState == BoltLockTrait.BOLT_LOCKED_STATE_LOCKED,
+                                actuator_state=actuator_state,
+                                bolt_moving=actuator_state is not ActuatorState.OK,
+                                actor_method=ActorMethod.coerce(actor.method),
+                                actor_originator=intern_id(actor.originator.resourceId) or None,
+                            )
+                            if bolt_lock.HasField("lockedStateLastChangedAt"):
+                                patch["locked_changed_at"] = _epoch(bolt_lock.lockedStateLastChangedAt)
                             if bolt_lock.boltLockActor.originator.resourceId:
-                                locks_data["user_id"] = bolt_lock.boltLockActor.originator.resourceId
-                            _LOGGER.debug(f"Parsed BoltLockTrait for {obj_id}: {locks_data['yale'][obj_id]}, user_id={locks_data['user_id']}")
+                                locks_data["user_id"] = intern_id(bolt_lock.boltLockActor.originator.resourceId)
+                            if debug:
+                                _LOGGER.debug("Parsed BoltLockTrait for %s: %s, user_id=%s",
+                                              obj_id, patch, locks_data["user_id"])
 
                         except DecodeError as e:
-                            _LOGGER.error(f"Failed to decode BoltLockTrait for {obj_id}: {e}")
+                            self._record_decode_error(get_op.data.property.value, e, "BoltLockTrait")
+                            _LOGGER.error("Failed to decode BoltLockTrait for %s: %s", obj_id, e)
                             continue
                         except Exception as e:
-                            _LOGGER.error(f"Unexpected error unpacking BoltLockTrait for {obj_id}: {e}")
+                            _LOGGER.error("Unexpected error unpacking BoltLockTrait for %s: %s", obj_id, e)
                             continue
 
-                    elif "structure_info" in type_url and obj_id:
+                    elif trait_registry.type_name(type_url) == "nest.trait.structure.StructureInfoTrait" and obj_id:
                         try:
-                            # Log raw structure_info for debugging
-                            _LOGGER.debug(f"Raw structure_info data for {obj_id}: {get_op.data.property}")
-                            # Extract legacyId or use obj_id as fallback
-                            structure_id = None
-                            if hasattr(get_op.data.property, "value"):
-                                value = get_op.data.property.value
-                                if isinstance(value, dict) and "legacyId" in value:
-                                    structure_id = value["legacyId"].split('.')[1]
-                                elif hasattr(value, "legacyId"):
-                                    structure_id = value.legacyId.split('.')[1]
-                            if not structure_id:
-                                structure_id = obj_id.replace("STRUCTURE_", "")
+                            structure_info = self.decoder.decode(get_op.data.property, "nest.trait.structure.StructureInfoTrait")
+                            self.metrics.traits_decoded.inc(label_value="StructureInfoTrait")
+                            # legacy_id is "structure.<uuid>", the ID the REST API and SendCommand use
+                            legacy_id = structure_info.legacy_id
+                            structure_id = legacy_id.split(".", 1)[-1] if legacy_id else obj_id.replace("STRUCTURE_", "")
+                            frame_structures.add(structure_id)
                             locks_data["structure_id"] = structure_id
-                            _LOGGER.debug(f"Parsed structure_info for {obj_id}: structure_id={structure_id}")
+                            _LOGGER.debug("Parsed structure_info for %s: structure_id=%s", obj_id, structure_id)
+                        except DecodeError as e:
+                            self._record_decode_error(get_op.data.property.value, e, "StructureInfoTrait")
+                            _LOGGER.error("Failed to decode StructureInfoTrait for %s: %s", obj_id, e)
+
+                    elif trait_registry.type_name(type_url) == "weave.trait.power.BatteryPowerSourceTrait" and obj_id:
+                        try:
+                            battery = self.decoder.decode(get_op.data.property, "weave.trait.power.BatteryPowerSourceTrait")
+                            self.metrics.traits_decoded.inc(label_value="BatteryPowerSourceTrait")
+                            patch = patches.setdefault(obj_id, {})
+                            patch["battery_replacement"] = BatteryReplacement.coerce(battery.replacementIndicator)
+                            # FloatValue wrappers: absent means not reported, not zero
+                            if battery.HasField("assessedVoltage"):
+                                patch["battery_voltage"] = round(battery.assessedVoltage.value, 3)
+                            if battery.remaining.HasField("remainingPercent"):
+                                patch["battery_percent"] = round(battery.remaining.remainingPercent.value, 1)
+                            if debug:
+                                _LOGGER.debug("Parsed BatteryPowerSourceTrait for %s: %s", obj_id, patch)
+                        except DecodeError as e:
+                            self._record_decode_error(get_op.data.property.value, e, "BatteryPowerSourceTrait")
+                            _LOGGER.error("Failed to decode BatteryPowerSourceTrait for %s: %s", obj_id, e)
+
+                    elif trait_registry.type_name(type_url) == "weave.trait.security.UserPincodesSettingsTrait" and obj_id:
+                        try:
+                            settings = self.decoder.decode(get_op.data.property, "weave.trait.security.UserPincodesSettingsTrait")
+                            self.metrics.traits_decoded.inc(label_value="UserPincodesSettingsTrait")
+                            # Codes are kept as digests only, enough to diff a roster against
+                            self.pin_codes[obj_id] = {
+                                intern_id(pincode.userId.resourceId): PinCodeSlot(
+                                    slot=slot,
+                                    digest=pin_digest(pincode.pincode),
+                                    enabled=(
+                                        pincode.pincodeCredentialEnabled.value
+                                        if pincode.HasField("pincodeCredentialEnabled") else True
+                                    ),
+                                )
+                                for slot, pincode in settings.userPincodes.items()
+                                if pincode.userId.resourceId
+                            }
+                        except DecodeError as e:
+                            self._record_decode_error(get_op.data.property.value, e, "UserPincodesSettingsTrait")
+                            _LOGGER.error("Failed to decode UserPincodesSettingsTrait for %s: %s", obj_id, e)
+
+                    elif trait_registry.type_name(type_url) in RELOCK_SETTINGS_TRAITS and obj_id:
+                        name = trait_registry.type_name(type_url)
+                        try:
+                            settings = self.decoder.decode(get_op.data.property, name)
+                            self.metrics.traits_decoded.inc(label_value=name.rsplit(".", 1)[-1])
+                            patch = patches.setdefault(obj_id, {})
+                            patch["auto_relock_on"] = settings.autoRelockOn
+                            duration = settings.autoRelockDuration
+                            patch["auto_relock_duration"] = duration.seconds + duration.nanos / 1e9 or None
+                        except DecodeError as e:
+                            self._record_decode_error(get_op.data.property.value, e, name)
+                            _LOGGER.error("Failed to decode %s for %s: %s", name, obj_id, e)
+
+                    elif trait_registry.type_name(type_url) == "weave.trait.heartbeat.LivenessTrait" and obj_id:
+                        try:
+                            liveness = self.decoder.decode(get_op.data.property, "weave.trait.heartbeat.LivenessTrait")
+                            self.metrics.traits_decoded.inc(label_value="LivenessTrait")
+                            patch = patches.setdefault(obj_id, {})
+                            patch["liveness"] = LivenessStatus.coerce(liveness.status)
+                            if liveness.HasField("maxInactivityDuration"):
+                                window = liveness.maxInactivityDuration
+                                patch["max_inactivity"] = window.seconds + window.nanos / 1e9 or None
+                        except DecodeError as e:
+                            self._record_decode_error(get_op.data.property.value, e, "LivenessTrait")
+                            _LOGGER.error("Failed to decode LivenessTrait for %s: %s", obj_id, e)
+
+                    elif trait_registry.type_name(type_url) == "weave.trait.security.TamperTrait" and obj_id:
+                        try:
+                            tamper = self.decoder.decode(get_op.data.property, "weave.trait.security.TamperTrait")
+                            self.metrics.traits_decoded.inc(label_value="TamperTrait")
+                            patches.setdefault(obj_id, {})["tamper_state"] = TamperState.coerce(tamper.tamperState)
+                        except DecodeError as e:
+                            self._record_decode_error(get_op.data.property.value, e, "TamperTrait")
+                            _LOGGER.error("Failed to decode TamperTrait for %s: %s", obj_id, e)
+
+                    elif trait_registry.type_name(type_url) == "weave.trait.security.DoorCheckSettingsTrait" and obj_id:
+                        try:
+                            door_check = self.decoder.decode(get_op.data.property, "weave.trait.security.DoorCheckSettingsTrait")
+                            self.metrics.traits_decoded.inc(label_value="DoorCheckSettingsTrait")
+                            patch = patches.setdefault(obj_id, {})
+                            if door_check.HasField("doorCheckEnabled"):
+                                patch["door_check_enabled"] = door_check.doorCheckEnabled.value
+                            sensor_id = intern_id(door_check.sensorDeviceId.resourceId) or None
+                            patch["door_sensor_id"] = sensor_id
+                            if sensor_id:
+                                self._door_sensors[sensor_id] = obj_id
+                                if sensor_id in self._door_states:
+                                    patch["door_state"] = self._door_states[sensor_id]
+                        except DecodeError as e:
+                            self._record_decode_error(get_op.data.property.value, e, "DoorCheckSettingsTrait")
+                            _LOGGER.error("Failed to decode DoorCheckSettingsTrait for %s: %s", obj_id, e)
+
+                    elif trait_registry.type_name(type_url) in OPEN_CLOSE_TRAITS and obj_id:
+                        name = trait_registry.type_name(type_url)
+                        try:
+                            open_close = self.decoder.decode(get_op.data.property, name)
+                            self.metrics.traits_decoded.inc(label_value=name.rsplit(".", 1)[-1])
+                            door_states[obj_id] = OpenCloseState.coerce(open_close.openCloseState)
+                        except DecodeError as e:
+                            self._record_decode_error(get_op.data.property.value, e, name)
+                            _LOGGER.error("Failed to decode %s for %s: %s", name, obj_id, e)
+
+                    elif trait_registry.type_name(type_url) in EVENT_TYPES and obj_id:
+                        try:
+                            self._decode_events(obj_id, get_op.data.property, locks_data)
+                        except DecodeError as e:
+                            self._record_decode_error(get_op.data.property.value, e, trait_registry.type_name(type_url))
+                            _LOGGER.error("Failed to decode %s for %s: %s", type_url, obj_id, e)
                         except Exception as e:
-                            _LOGGER.error(f"Failed to parse structure_info for {obj_id}: {e}")
+                            _LOGGER.error("Unexpected error handling %s for %s: %s", type_url, obj_id, e, exc_info=True)
+
+            # Resolved after the loop: the lock's DoorCheckSettingsTrait may
+            # come later in the frame than its sensor's state
+            for sensor_id, state in door_states.items():
+                self._door_states[sensor_id] = state
+                patches.setdefault(self._door_sensors.get(sensor_id, sensor_id), {})["door_state"] = state
 
-            _LOGGER.debug(f"Final lock data: {locks_data}")
+            self._apply_patches(patches, locks_data)
+
+            # The protos carry no device -> structure link. A frame describing a
+            # single structure alongside locks is unambiguous, so those locks are
+            # attributed to it; multi-structure frames leave the map untouched.
+            if len(frame_structures) == 1 and locks_data["yale"]:
+                structure_id = next(iter(frame_structures))
+                locks_data["device_structures"] = dict.fromkeys(locks_data["yale"], structure_id)
+
+            _LOGGER.debug("Final lock data: %s", locks_data)
             return locks_data
 
         except DecodeError as e:
-            _LOGGER.error(f"DecodeError in StreamBody: {e}")
+            self._record_decode_error(message, e, "StreamBody")
+            _LOGGER.error("DecodeError in StreamBody: %s", e)
             return locks_data
         except Exception as e:
-            _LOGGER.error(f"Unexpected error processing message: {e}", exc_info=True)
+            _LOGGER.error("Unexpected error processing message: %s", e, exc_info=True)
             return locks_data
 
-    async def stream(self, api_url, headers, observe_data, connection):
-        attempt = 0
-        while True:
-            attempt += 1
-            _LOGGER.info(f"Starting stream attempt {attempt} with headers: {headers}")
-            self.buffer = bytearray()
-            self.pending_length = None
-            try:
-                async for data in connection.stream(api_url, headers, observe_data):
-                    if not isinstance(data, bytes):
-                        _LOGGER.error(f"Received non-bytes data: {data}")
-                        continue
-
-                    if self.pending_length is None:
-                        self.pending_length, offset = self._decode_varint(data, 0)
-                        if self.pending_length is None or offset >= len(data):
-                            _LOGGER.warning(f"Invalid varint in chunk: {data.hex()[:200]}... skipping")
-                            continue
-                        self.buffer.extend(data[offset:])
-                    else:
-                        self.buffer.extend(data)
-
-                    _LOGGER.debug(f"Buffer size: {len(self.buffer)} bytes, pending_length: {self.pending_length}")
-
-                    while self.pending_length and len(self.buffer) >= self.pending_length:
-                        message = self.buffer[:self.pending_length]
-                        self.buffer = self.buffer[self.pending_length:]
-                        locks_data = await self._process_message(message)
-                        self.pending_length = None if len(self.buffer) < 5 else self._decode_varint(self.buffer, 0)[0]
-
-                        if locks_data.get("yale"):
-                            yield locks_data
-                            continue
+    def _apply_patches(self, patches, locks_data):
+        """Fold a frame's decoded fields into the lock records it touched.
 
-                    if len(self.buffer) >= CATALOG_THRESHOLD and self.pending_length:
-                        message = self.buffer[:self.pending_length]
-                        self.buffer = self.buffer[self.pending_length:]
-                        locks_data = await self._process_message(message)
-                        self.pending_length = None if len(self.buffer) < 5 else self._decode_varint(self.buffer, 0)[0]
+        Only devices that have reported BoltLockTrait are locks. Fields for
+        other devices (or sent ahead of a lock's BoltLockTrait) are held in
+        `_unclaimed` until that device turns out to be a lock.
+        """
+        for obj_id, patch in patches.items():
+            record = self.device_records.get(obj_id)
+            if record is None:
+                pending = self._unclaimed.setdefault(obj_id, {})
+                pending.update(patch)
+                if "bolt_locked" not in pending:
+                    continue
+                del self._unclaimed[obj_id]
+                record = LockStateRecord(device_id=obj_id, **pending)
+            else:
+                previous, record = record, record.evolve(**patch)
+                if (previous.locked_changed_at is not None
+                        and record.locked_changed_at != previous.locked_changed_at):
+                    # The lock re-stamps lockedStateLastChangedAt on every bolt change
+                    self._add_activity(locks_data, LockActivity(
+                        device_id=obj_id,
+                        timestamp=record.locked_changed_at,
+                        bolt_locked=record.bolt_locked,
+                        actuator_state=record.actuator_state,
+                        method=record.actor_method,
+                        originator=record.actor_originator,
+                    ))
+                if record.tamper_state is not previous.tamper_state:
+                    self._add_tamper_alert(locks_data, TamperAlert(
+                        device_id=obj_id,
+                        timestamp=time.time(),
+                        tamper_state=record.tamper_state,
+                        prior_state=previous.tamper_state,
+                    ))
+            self.device_records[obj_id] = record
+            locks_data["yale"][obj_id] = record
 
-                        if locks_data.get("yale"):
-                            yield locks_data
-                            continue
-
-                await asyncio.sleep(PING_INTERVAL_SECONDS / 1000)
-
-            except asyncio.TimeoutError:
-                _LOGGER.warning("Stream timeout, retrying...")
-                yield {"yale": {}, "user_id": None, "structure_id": None}
+    def _decode_events(self, obj_id, any_msg, locks_data):
+        """Turn a bare or gateway-wrapped trait event into typed events."""
+        name = trait_registry.type_name(any_msg.type_url)
+        if name in EVENT_DECODERS:
+            handler = getattr(self, EVENT_DECODERS[name])
+            handler(obj_id, self.decoder.decode(any_msg, name), time.time(), locks_data)
+            return
+        notification = self.decoder.decode(any_msg, name)
+        # ResourceEventsNotify wraps a single TraitEventsNotification
+        batch = notification.events if name.endswith("ResourceEventsNotify") else notification
+        for event in batch.events:
+            event_name = trait_registry.type_name(event.data.type_url)
+            if event_name not in EVENT_DECODERS:
+                continue
+            subject = intern_id(event.subjectResourceId) or obj_id
+            timestamp = _epoch(event.utcTimestamp) if event.HasField("utcTimestamp") else time.time()
+            handler = getattr(self, EVENT_DECODERS[event_name])
+            # One bad event must not cost the rest of the frame its state
+            try:
+                handler(subject, self.decoder.decode(event.data, event_name), timestamp, locks_data)
+            except DecodeError as e:
+                self._record_decode_error(event.data.value, e, event_name)
+                _LOGGER.error("Failed to decode %s for %s: %s", event_name, subject, e)
             except Exception as e:
-                _LOGGER.error(f"Stream error: {e}", exc_info=True)
+                _LOGGER.error("Unexpected error handling %s for %s: %s", event_name, subject, e, exc_info=True)
 
-            _LOGGER.info(f"Retrying stream in {RETRY_DELAY_SECONDS} seconds")
-            await asyncio.sleep(RETRY_DELAY_SECONDS)
-            yield None
+    def _keypad_entry_event(self, obj_id, event, timestamp, locks_data):
+        self.metrics.traits_decoded.inc(label_value="KeypadEntryEvent")
+        user_id = intern_id(event.userId.resourceId) or None
+        locks_data["events"].append(KeypadEntry(
+            device_id=obj_id,
+            timestamp=timestamp,
+            result=PincodeEntryResult.coerce(event.pincodeEntryResult),
+            user_id=user_id,
+            slot=getattr(self.pin_codes.get(obj_id, {}).get(user_id), "slot", None),
+            invalid_entry_count=event.invalidEntryCount,
+        ))
 
-    async def refresh_state(self, connection, access_token):
-        headers = {
-            "Authorization": f"Basic {access_token}",
-            "Content-Type": "application/x-protobuf",
-            "User-Agent": USER_AGENT_STRING,
-            "X-Accept-Response-Streaming": "true",
-            "Accept": "application/x-protobuf",
-        }
+    def _tamper_change_event(self, obj_id, event, timestamp, locks_data):
+        self.metrics.traits_decoded.inc(label_value="TamperStateChangeEvent")
+        self._add_tamper_alert(locks_data, TamperAlert(
+            device_id=obj_id,
+            timestamp=timestamp,
+            tamper_state=TamperState.coerce(event.tamperState),
+            prior_state=TamperState.coerce(event.priorTamperState),
+        ))
 
-        api_url = f"{URL_PROTOBUF.format(grpc_hostname=PRODUCTION_HOSTNAME['grpc_hostname'])}{ENDPOINT_OBSERVE}"
-        observe_data = await read_protobuf_file(os.path.join(os.path.dirname(__file__), "proto", "ObserveTraits.bin"))
+    def _add_tamper_alert(self, locks_data, alert):
+        # The event and the TamperTrait update both report the same change
+        if self._tamper_states.get(alert.device_id) is alert.tamper_state:
+            return
+        self._tamper_states[alert.device_id] = alert.tamper_state
+        locks_data["events"].append(alert)
 
-        try:
-            async with connection.session.post(api_url, headers=headers, data=observe_data) as response:
-                if response.status != 200:
-                    _LOGGER.error(f"HTTP {response.status}: {await response.text()}")
-                    return {}
-                async for chunk in response.content.iter_chunked(1024):
-                    locks_data = await self._process_message(chunk)
-                    if locks_data.get("yale"):
-                        return locks_data
-        except Exception as e:
-            _LOGGER.error(f"Refresh state error: {e}", exc_info=True)
-        return {"yale": {}, "user_id": None, "structure_id": None}
\ No newline at end of file
+    def _bolt_change_event(self, obj_id, event, timestamp, locks_data):
+        self.metrics.traits_decoded.inc(label_value="BoltActuatorStateChangeEvent")
+        BoltLockTrait = trait_registry.message_class("weave.trait.security.BoltLockTrait")
+        if event.lockedState == BoltLockTrait.BOLT_LOCKED_STATE_LOCKED:
+            bolt_locked = True
+        elif event.lockedState == BoltLockTrait.BOLT_LOCKED_STATE_UNLOCKED:
+            bolt_locked = False
+        else:
+            bolt_locked = None
+        actor = event.boltLockActor
+        self._add_activity(locks_data, LockActivity(
+            device_id=obj_id,
+            timestamp=timestamp,
+            bolt_locked=bolt_locked,
+            actuator_state=ActuatorState.coerce(event.actuatorState),
+            method=ActorMethod.coerce(actor.method),
+            originator=intern_id(actor.originator.resourceId) or None,
+            agent=intern_id(actor.agent.resourceId) or None,
+            source="event",
+        ))
+
+    def _add_activity(self, locks_data, activity):
+        # A change can arrive both as an event and as a BoltLockTrait update
+        last = self._last_activity.get(activity.device_id)
+        if (last is not None
+                and (last.bolt_locked, last.method) == (activity.bolt_locked, activity.method)
+                and abs(activity.timestamp - last.timestamp) < ACTIVITY_DEDUPE_SECONDS):
+            return
+        self._last_activity[activity.device_id] = activity
+        locks_data["events"].append(activity)
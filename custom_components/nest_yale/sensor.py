@@ -0,0 +1,194 @@
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfElectricPotential,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from .const import DOMAIN
+from .entity import NestYaleDeviceEntity, async_add_device_entities
+from .metrics import MetricsRegistry
+from .models import LockStateRecord
+
+_LOGGER = logging.getLogger(__name__)
+
+# Metrics are read on a timer rather than pushed, so the stream path never
+# touches the state machine on their behalf.
+SCAN_INTERVAL = timedelta(seconds=60)
+
+
+def _scaled(value, factor, digits):
+    return None if value is None else round(value * factor, digits)
+
+
+@dataclass(frozen=True, kw_only=True)
+class NestYaleMetricDescription(SensorEntityDescription):
+    value_fn: Callable[[MetricsRegistry], object]
+
+
+METRIC_SENSORS = (
+    NestYaleMetricDescription(
+        key="frames_received",
+        name="Stream frames received",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda m: m.frames_received.value,
+    ),
+    NestYaleMetricDescription(
+        key="bytes_received",
+        name="Stream data received",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda m: m.bytes_received.value,
+    ),
+    NestYaleMetricDescription(
+        key="decode_time_p95",
+        name="Frame decode time (p95)",
+        native_unit_of_measurement=UnitOfTime.MICROSECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda m: _scaled(m.decode_time.percentile(95), 1e6, 1),
+    ),
+    NestYaleMetricDescription(
+        key="decode_errors",
+        name="Frame decode errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda m: m.decode_errors.value,
+    ),
+    NestYaleMetricDescription(
+        key="reconnects",
+        name="Stream reconnects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda m: m.reconnects.value,
+    ),
+    NestYaleMetricDescription(
+        key="stream_uptime",
+        name="Stream uptime",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda m: m.stream_uptime.value,
+    ),
+    NestYaleMetricDescription(
+        key="command_latency_p95",
+        name="Command latency (p95)",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda m: _scaled(m.command_latency.percentile(95), 1e3, 0),
+    ),
+    NestYaleMetricDescription(
+        key="event_latency_p95",
+        name="Event fire latency (p95)",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda m: _scaled(m.event_latency.percentile(95), 1e3, 2),
+    ),
+    NestYaleMetricDescription(
+        key="auth_refreshes",
+        name="Auth token refreshes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda m: m.auth_refreshes.value,
+    ),
+    NestYaleMetricDescription(
+        key="stale_updates_dropped",
+        name="Stale updates dropped",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda m: m.stale_updates.value,
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class NestYaleLockSensorDescription(SensorEntityDescription):
+    value_fn: Callable[[LockStateRecord], object]
+    # (coordinator, device_id) -> extra state attributes
+    attributes_fn: Callable[[object, str], dict] | None = None
+
+
+# Read from BatteryPowerSourceTrait on the Observe stream; no extra requests
+LOCK_SENSORS = (
+    NestYaleLockSensorDescription(
+        key="battery",
+        name="Battery",
+        device_class=SensorDeviceClass.BATTERY,
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda r: r.battery_percent,
+    ),
+    NestYaleLockSensorDescription(
+        key="battery_voltage",
+        name="Battery voltage",
+        device_class=SensorDeviceClass.VOLTAGE,
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda r: r.battery_voltage,
+        attributes_fn=lambda coordinator, device_id: coordinator.battery_history.forecast(device_id),
+    ),
+)
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(
+        NestYaleMetricSensor(entry, coordinator.metrics, description) for description in METRIC_SENSORS
+    )
+    async_add_device_entities(
+        entry,
+        coordinator,
+        async_add_entities,
+        lambda coordinator, device_id: [
+            NestYaleLockSensor(coordinator, device_id, description) for description in LOCK_SENSORS
+        ],
+    )
+
+
+class NestYaleMetricSensor(SensorEntity):
+    """Diagnostic sensor over one integration metric; disabled by default."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_should_poll = True
+
+    def __init__(self, entry, metrics, description):
+        self.entity_description = description
+        self._metrics = metrics
+        self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_{description.key}"
+        self._attr_name = f"Nest Yale {description.name}"
+
+    @property
+    def native_value(self):
+        return self.entity_description.value_fn(self._metrics)
+
+
+class NestYaleLockSensor(NestYaleDeviceEntity, SensorEntity):
+    """Sensor over one field of a lock's record, updated from the stream."""
+
+    def __init__(self, coordinator, device_id, description):
+        super().__init__(coordinator, device_id, description.key)
+        self.entity_description = description
+
+    @property
+    def native_value(self):
+        record = self.record
+        return None if record is None else self.entity_description.value_fn(record)
+
+    @property
+    def extra_state_attributes(self):
+        attributes_fn = self.entity_description.attributes_fn
+        return None if attributes_fn is None else attributes_fn(self._coordinator, self._device_id)
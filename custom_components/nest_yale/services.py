@@ -0,0 +1,221 @@
+import time
+import asyncio
+import logging
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import entity_registry as er
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
+from .const import DOMAIN, PIN_SYNC_CONCURRENCY
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_EXPORT_METRICS = "export_metrics"
+SERVICE_PROFILE = "profile"
+SERVICE_QUERY_ACTIVITY = "query_activity"
+SERVICE_SYNC_PIN_CODES = "sync_pin_codes"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_DURATION = "duration"
+ATTR_SORT_BY = "sort_by"
+ATTR_TOP = "top"
+ATTR_ENTITY_ID = "entity_id"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_LIMIT = "limit"
+ATTR_ROSTER = "roster"
+ATTR_USER_ID = "user_id"
+ATTR_PIN = "pin"
+ATTR_ENABLED = "enabled"
+ATTR_PRUNE = "prune"
+ATTR_DRY_RUN = "dry_run"
+
+EXPORT_METRICS_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTRY_ID): cv.string})
+PROFILE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_ENTRY_ID): cv.string,
+    vol.Optional(ATTR_DURATION, default=30): vol.All(vol.Coerce(float), vol.Range(min=1, max=600)),
+    vol.Optional(ATTR_SORT_BY, default="cumulative"): vol.In(["cumulative", "tottime", "ncalls"]),
+    vol.Optional(ATTR_TOP, default=15): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+})
+
+QUERY_ACTIVITY_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_ENTRY_ID): cv.string,
+    vol.Optional(ATTR_ENTITY_ID): cv.entity_id,
+    vol.Optional(ATTR_START): cv.datetime,
+    vol.Optional(ATTR_END): cv.datetime,
+    vol.Optional(ATTR_LIMIT, default=100): vol.All(vol.Coerce(int), vol.Range(min=1, max=10000)),
+})
+
+ROSTER_ENTRY_SCHEMA = vol.Schema({
+    vol.Required(ATTR_USER_ID): cv.string,
+    vol.Required(ATTR_PIN): vol.All(cv.string, vol.Match(r"^\d{4,8}$")),
+    vol.Optional(ATTR_ENABLED, default=True): cv.boolean,
+})
+SYNC_PIN_CODES_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_ENTRY_ID): cv.string,
+    vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+    vol.Required(ATTR_ROSTER): vol.All(cv.ensure_list, [ROSTER_ENTRY_SCHEMA]),
+    vol.Optional(ATTR_PRUNE, default=False): cv.boolean,
+    vol.Optional(ATTR_DRY_RUN, default=False): cv.boolean,
+})
+
+
+def _coordinators(hass: HomeAssistant, call: ServiceCall):
+    """Coordinators targeted by a service call (one entry or all of them)."""
+    coordinators = hass.data.get(DOMAIN, {})
+    entry_id = call.data.get(ATTR_ENTRY_ID)
+    if entry_id is None:
+        return dict(coordinators)
+    if entry_id not in coordinators:
+        raise ServiceValidationError(f"No loaded Nest Yale entry with id {entry_id}")
+    return {entry_id: coordinators[entry_id]}
+
+
+def _lock_device_id(hass: HomeAssistant, entity_id):
+    """(config entry id, Nest device id) of a Nest Yale lock entity."""
+    entity = er.async_get(hass).async_get(entity_id)
+    if entity is None or entity.platform != DOMAIN or entity.domain != "lock":
+        raise ServiceValidationError(f"{entity_id} is not a Nest Yale lock")
+    return entity.config_entry_id, entity.unique_id.removeprefix(f"{DOMAIN}_")
+
+
+@callback
+def async_setup_services(hass: HomeAssistant):
+    """Register the integration's services (once, from async_setup)."""
+
+    @callback
+    def _export_metrics(call: ServiceCall):
+        return {
+            entry_id: coordinator.metrics.prometheus_text({"entry_id": entry_id})
+            for entry_id, coordinator in _coordinators(hass, call).items()
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_METRICS,
+        _export_metrics,
+        schema=EXPORT_METRICS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    profile_lock = asyncio.Lock()
+
+    async def _profile(call: ServiceCall):
+        from .profiler import ProfileSession  # noqa: WPS433
+
+        coordinators = _coordinators(hass, call)
+        if not coordinators:
+            raise ServiceValidationError("No loaded Nest Yale entries to profile")
+        if profile_lock.locked():
+            raise ServiceValidationError("A Nest Yale profiling session is already running")
+        async with profile_lock:
+            session = ProfileSession()
+            session.start(coordinators.values())
+            _LOGGER.info("Profiling Nest Yale decode and listener paths for %.0f s", call.data[ATTR_DURATION])
+            try:
+                await asyncio.sleep(call.data[ATTR_DURATION])
+            finally:
+                session.stop()
+            path = hass.config.path(f"{DOMAIN}_profile_{time.strftime('%Y%m%d-%H%M%S')}.pstats")
+            hotspots = await hass.async_add_executor_job(
+                session.write_report, path, call.data[ATTR_SORT_BY], call.data[ATTR_TOP]
+            )
+        _LOGGER.info("Nest Yale profile written to %s (%d profiled calls)", path, session.calls)
+        return {
+            "file": path,
+            "duration_s": round(session.stopped_at - session.started_at, 1),
+            "profiled_calls": session.calls,
+            "entries": list(coordinators),
+            "hotspots": hotspots,
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def _query_activity(call: ServiceCall):
+        coordinators = _coordinators(hass, call)
+        device_id = None
+        if ATTR_ENTITY_ID in call.data:
+            lock_entry_id, device_id = _lock_device_id(hass, call.data[ATTR_ENTITY_ID])
+            coordinators = {
+                entry_id: coordinator for entry_id, coordinator in coordinators.items()
+                if entry_id == lock_entry_id
+            }
+        start = call.data.get(ATTR_START)
+        end = call.data.get(ATTR_END)
+        start = None if start is None else dt_util.as_utc(start).timestamp()
+        end = None if end is None else dt_util.as_utc(end).timestamp()
+        limit = call.data[ATTR_LIMIT]
+
+        events = []
+        for entry_id, coordinator in coordinators.items():
+            if coordinator.activity_log is None:
+                continue
+            activities = await hass.async_add_executor_job(
+                coordinator.activity_log.query, device_id, start, end, limit
+            )
+            for activity in activities:
+                event = activity.as_event_data()
+                event["entry_id"] = entry_id
+                event["time"] = dt_util.utc_from_timestamp(activity.timestamp).isoformat()
+                events.append(event)
+        events.sort(key=lambda event: event["timestamp"], reverse=True)
+        return {"events": events[:limit]}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_ACTIVITY,
+        _query_activity,
+        schema=QUERY_ACTIVITY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def _sync_pin_codes(call: ServiceCall):
+        from .pin_sync import async_sync_pin_codes  # noqa: WPS433
+
+        coordinators = _coordinators(hass, call)
+        roster = {entry[ATTR_USER_ID]: (entry[ATTR_PIN], entry[ATTR_ENABLED]) for entry in call.data[ATTR_ROSTER]}
+        targets = {entry_id: list(coordinator.data or {}) for entry_id, coordinator in coordinators.items()}
+        if ATTR_ENTITY_ID in call.data:
+            targets = {entry_id: [] for entry_id in coordinators}
+            for entity_id in call.data[ATTR_ENTITY_ID]:
+                entry_id, device_id = _lock_device_id(hass, entity_id)
+                if entry_id not in targets:
+                    raise ServiceValidationError(f"{entity_id} is not part of the targeted Nest Yale entries")
+                targets[entry_id].append(device_id)
+
+        # One limit across every account, not per account
+        semaphore = asyncio.Semaphore(PIN_SYNC_CONCURRENCY)
+        reports = await asyncio.gather(*(
+            async_sync_pin_codes(
+                coordinators[entry_id].api_client,
+                device_ids,
+                roster,
+                call.data[ATTR_PRUNE],
+                call.data[ATTR_DRY_RUN],
+                semaphore,
+            )
+            for entry_id, device_ids in targets.items()
+        ))
+        locks = {}
+        for entry_id, report in zip(targets, reports):
+            for device_id, result in report.items():
+                result["entity_id"] = coordinators[entry_id].entity_id_for("lock", device_id)
+                locks[device_id] = result
+        return {
+            "commands_sent": sum(result["commands"] for result in locks.values()),
+            "locks": locks,
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SYNC_PIN_CODES,
+        _sync_pin_codes,
+        schema=SYNC_PIN_CODES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
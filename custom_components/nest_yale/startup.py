@@ -0,0 +1,40 @@
+import time
+import logging
+from contextlib import asynccontextmanager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StartupTimeline:
+    """Records how long each setup phase took, relative to setup start."""
+
+    def __init__(self):
+        self._origin = time.monotonic()
+        self.phases = {}
+
+    @asynccontextmanager
+    async def phase(self, name):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            end = time.monotonic()
+            self.phases[name] = {
+                "start_ms": round((start - self._origin) * 1000, 1),
+                "duration_ms": round((end - start) * 1000, 1),
+            }
+
+    @property
+    def total_ms(self):
+        if not self.phases:
+            return 0.0
+        return max(p["start_ms"] + p["duration_ms"] for p in self.phases.values())
+
+    def as_dict(self):
+        return {"total_ms": self.total_ms, "phases": dict(self.phases)}
+
+    def log_summary(self):
+        summary = ", ".join(
+            f"{name} {p['duration_ms']:.0f} ms (+{p['start_ms']:.0f})" for name, p in self.phases.items()
+        )
+        _LOGGER.info("Nest Yale startup finished in %.0f ms: %s", self.total_ms, summary)
@@ -0,0 +1,31 @@
+import logging
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from .const import DOMAIN, STORAGE_SAVE_DELAY_SECONDS, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class NestYaleStore:
+    """Persists token, IDs and the last lock snapshot for one config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id):
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}", private=True)
+
+    async def async_load(self):
+        try:
+            data = await self._store.async_load()
+        except Exception as e:
+            _LOGGER.warning("Failed to load persisted Nest Yale state, starting cold: %s", e)
+            return {}
+        return data or {}
+
+    def async_schedule_save(self, data_func):
+        """Coalesce frequent updates into one write every few seconds."""
+        self._store.async_delay_save(data_func, STORAGE_SAVE_DELAY_SECONDS)
+
+    async def async_save(self, data):
+        await self._store.async_save(data)
+
+    async def async_remove(self):
+        await self._store.async_remove()
@@ -0,0 +1,108 @@
+"""Hashed timing wheel shared by every per-device deadline of a config entry.
+
+Deadlines are keyed (e.g. ``("liveness", device_id)``). Scheduling a key
+that already has a deadline replaces it, and cancelling drops it from its
+slot's dict, both in O(1). One ``loop.call_at`` handle drives the wheel and
+each tick only looks at the timers hashed into the current slot, so the
+cost of a tick does not grow with the number of devices. Deadlines further
+out than one revolution stay in their slot and are skipped until their tick
+comes round.
+
+The wheel only ticks while it holds timers. It must be used from the event
+loop thread.
+"""
+import math
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _Timer:
+    __slots__ = ("key", "tick", "callback")
+
+    def __init__(self, key, tick, callback):
+        self.key = key
+        self.tick = tick
+        self.callback = callback
+
+
+class TimerWheel:
+    """Re-armable, cancellable callbacks keyed by an arbitrary hashable."""
+
+    def __init__(self, loop, tick_seconds=1.0, slots=512):
+        self._loop = loop
+        self._tick_seconds = tick_seconds
+        self._slots = [{} for _ in range(slots)]
+        self._timers = {}  # key -> _Timer
+        self._origin = loop.time()
+        self._tick = 0  # last tick processed, counted from _origin
+        self._handle = None
+
+    def __len__(self):
+        return len(self._timers)
+
+    def __contains__(self, key):
+        return key in self._timers
+
+    def schedule(self, key, delay, callback):
+        """Run `callback()` after `delay` seconds, replacing any deadline for `key`."""
+        self.cancel(key)
+        if not self._timers:
+            # Idle wheel: skip the ticks that passed with nothing scheduled
+            self._tick = self._now_tick()
+        tick = self._tick + max(1, math.ceil(delay / self._tick_seconds))
+        timer = _Timer(key, tick, callback)
+        self._slots[tick % len(self._slots)][key] = timer
+        self._timers[key] = timer
+        if self._handle is None:
+            self._arm()
+
+    def cancel(self, key):
+        """Drop the deadline for `key`; returns False when there was none."""
+        timer = self._timers.pop(key, None)
+        if timer is None:
+            return False
+        del self._slots[timer.tick % len(self._slots)][key]
+        if not self._timers and self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        return True
+
+    def deadline(self, key):
+        """Loop time (``loop.time()``) at which `key` fires, or None."""
+        timer = self._timers.get(key)
+        return None if timer is None else self._origin + timer.tick * self._tick_seconds
+
+    def stop(self):
+        """Drop every deadline without running it."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        for slot in self._slots:
+            slot.clear()
+        self._timers.clear()
+
+    def _now_tick(self):
+        return int((self._loop.time() - self._origin) / self._tick_seconds)
+
+    def _arm(self):
+        self._handle = self._loop.call_at(self._origin + (self._tick + 1) * self._tick_seconds, self._advance)
+
+    def _advance(self):
+        self._handle = None
+        now_tick = self._now_tick()
+        # Catch up on ticks missed while the loop was busy
+        while self._tick < now_tick and self._timers:
+            self._tick += 1
+            slot = self._slots[self._tick % len(self._slots)]
+            due = [timer for timer in slot.values() if timer.tick <= self._tick]
+            for timer in due:
+                del slot[timer.key]
+                del self._timers[timer.key]
+            for timer in due:
+                try:
+                    timer.callback()
+                except Exception:  # noqa: BLE001 - one bad callback must not stop the wheel
+                    _LOGGER.exception("Timer %s failed", timer.key)
+        if self._timers and self._handle is None:
+            self._arm()
@@ -0,0 +1,144 @@
+import time
+import asyncio
+import logging
+import jwt
+from .exceptions import NestAuthError
+from .const import (
+    API_AUTH_FAIL_RETRY_DELAY_SECONDS,
+    API_GOOGLE_REAUTH_MINUTES,
+    NEST_JWT_LIFETIME_SECONDS,
+    TOKEN_REFRESH_LEAD_SECONDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class NestTokenManager:
+    """Owns the Nest JWT lifecycle for one account.
+
+    Tokens are refreshed ahead of expiry in the background, and concurrent
+    refresh requests share a single in-flight Google -> issue_jwt exchange.
+    """
+
+    def __init__(self, hass, authenticator, session, metrics=None):
+        self.hass = hass
+        self.authenticator = authenticator
+        self.session = session
+        self.metrics = metrics
+        self.auth_data = {}
+        self.access_token = None
+        self.expires_at = None  # epoch seconds
+        self.refresh_count = 0
+        self.on_refresh = None  # called after each successful exchange
+        self._refresh_task = None
+        self._refresh_handle = None
+
+    @property
+    def seconds_until_expiry(self):
+        if self.expires_at is None:
+            return None
+        return self.expires_at - time.time()
+
+    def is_valid(self, margin=0):
+        remaining = self.seconds_until_expiry
+        return bool(self.access_token) and remaining is not None and remaining > margin
+
+    async def async_get_token(self):
+        """Return a usable token, only waiting on auth when none is valid."""
+        if self.is_valid():
+            return self.access_token
+        return await self.async_refresh()
+
+    async def async_refresh(self):
+        """Refresh the token, joining an exchange that is already in flight."""
+        if self._refresh_task is None:
+            self._refresh_task = self.hass.loop.create_task(self._async_exchange())
+            self._refresh_task.add_done_callback(self._clear_refresh_task)
+        return await asyncio.shield(self._refresh_task)
+
+    async def async_invalidate(self, stale_token):
+        """Handle a 401 for `stale_token`.
+
+        Only the first caller holding the rejected token triggers a re-auth;
+        later callers pick up the replacement or join the same exchange.
+        """
+        if stale_token == self.access_token:
+            _LOGGER.info("Access token rejected, re-authenticating")
+            self.access_token = None
+            self.expires_at = None
+        return await self.async_get_token()
+
+    def seed(self, access_token, expires_at, auth_data=None):
+        """Adopt a token obtained elsewhere (e.g. restored from storage)."""
+        self.access_token = access_token
+        self.expires_at = expires_at
+        self.auth_data = auth_data or {"access_token": access_token}
+        self._schedule_refresh()
+
+    def _clear_refresh_task(self, task):
+        if self._refresh_task is task:
+            self._refresh_task = None
+
+    async def _async_exchange(self):
+        try:
+            auth_data = await self.authenticator.authenticate(self.session)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Timeouts and connection errors must not end the proactive refresh cycle
+            self._schedule_refresh(API_AUTH_FAIL_RETRY_DELAY_SECONDS)
+            raise
+        if not auth_data or "access_token" not in auth_data:
+            self._schedule_refresh(API_AUTH_FAIL_RETRY_DELAY_SECONDS)
+            raise NestAuthError("Invalid authentication data received")
+        issued_at = time.time()
+        self.auth_data = auth_data
+        self.access_token = auth_data["access_token"]
+        self.expires_at = self._token_expiry(self.access_token, issued_at)
+        self.refresh_count += 1
+        if self.metrics:
+            self.metrics.auth_refreshes.inc()
+        _LOGGER.debug("Obtained Nest JWT valid for %.0f seconds", self.expires_at - issued_at)
+        self._schedule_refresh()
+        if self.on_refresh:
+            self.on_refresh()
+        return self.access_token
+
+    @staticmethod
+    def _token_expiry(token, issued_at):
+        # The JWT embeds the Google OAuth token, which dies after
+        # API_GOOGLE_REAUTH_MINUTES regardless of the JWT's own exp claim.
+        expiry = issued_at + NEST_JWT_LIFETIME_SECONDS
+        try:
+            claims = jwt.decode(token, options={"verify_signature": False})
+            if claims.get("exp"):
+                expiry = float(claims["exp"])
+        except jwt.PyJWTError:
+            _LOGGER.debug("Nest token is not a decodable JWT, assuming %ss lifetime", NEST_JWT_LIFETIME_SECONDS)
+        return min(expiry, issued_at + API_GOOGLE_REAUTH_MINUTES * 60)
+
+    def _schedule_refresh(self, delay=None):
+        if self._refresh_handle:
+            self._refresh_handle.cancel()
+        if delay is None:
+            remaining = self.seconds_until_expiry or 0
+            delay = max(remaining - TOKEN_REFRESH_LEAD_SECONDS, 0)
+        self._refresh_handle = self.hass.loop.call_later(delay, self._background_refresh)
+
+    def _background_refresh(self):
+        self._refresh_handle = None
+        task = self.hass.loop.create_task(self.async_refresh())
+        task.add_done_callback(self._log_background_failure)
+
+    @staticmethod
+    def _log_background_failure(task):
+        if not task.cancelled() and task.exception():
+            _LOGGER.warning("Background token refresh failed: %s", task.exception())
+
+    def stop(self):
+        """Cancel the proactive refresh timer and any exchange in flight."""
+        if self._refresh_handle:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+        if self._refresh_task:
+            self._refresh_task.cancel()
@@ -0,0 +1,206 @@
+"""Trait registry: maps trait type names to their generated pb2 modules.
+
+Generated modules are imported on first use, so Home Assistant only pays
+for the descriptors of traits that are subscribed to or actually show up in
+the stream. The Observe envelope itself is decoded with the lean
+``proto/nest/stream_pb2`` (which only depends on Any and nest.rpc.Status)
+rather than ``root_pb2``, whose imports drag in every trait file.
+
+Decoding is tuned to the active protobuf backend (upb, cpp or pure Python);
+see ``TraitDecoder`` and ``benchmarks/decode_backend.py``.
+"""
+import logging
+import importlib
+from google.protobuf.message import DecodeError
+
+_LOGGER = logging.getLogger(__name__)
+
+TYPE_URL_PREFIX = "type.nestlabs.com/"
+
+# Trait type name -> (pb2 module relative to .proto, message path)
+TRAITS = {
+    "weave.trait.security.BoltLockTrait": ("weave.trait.security_pb2", "BoltLockTrait"),
+    "weave.trait.security.BoltLockSettingsTrait": ("weave.trait.security_pb2", "BoltLockSettingsTrait"),
+    "weave.trait.security.BoltLockCapabilitiesTrait": ("weave.trait.security_pb2", "BoltLockCapabilitiesTrait"),
+    "weave.trait.security.PincodeInputTrait": ("weave.trait.security_pb2", "PincodeInputTrait"),
+    "weave.trait.security.UserPincodesSettingsTrait": ("weave.trait.security_pb2", "UserPincodesSettingsTrait"),
+    "weave.trait.security.TamperTrait": ("weave.trait.security_pb2", "TamperTrait"),
+    "weave.trait.security.DoorCheckSettingsTrait": ("weave.trait.security_pb2", "DoorCheckSettingsTrait"),
+    "weave.trait.power.BatteryPowerSourceTrait": ("weave.trait.power_pb2", "BatteryPowerSourceTrait"),
+    "weave.trait.heartbeat.LivenessTrait": ("weave.trait.heartbeat_pb2", "LivenessTrait"),
+    "weave.trait.description.DeviceIdentityTrait": ("weave.trait.description_pb2", "DeviceIdentityTrait"),
+    "nest.trait.user.UserInfoTrait": ("nest.trait.user_pb2", "UserInfoTrait"),
+    "nest.trait.structure.StructureInfoTrait": ("nest.trait.structure_pb2", "StructureInfoTrait"),
+    "nest.trait.security.EnhancedBoltLockSettingsTrait": ("nest.trait.security_pb2", "EnhancedBoltLockSettingsTrait"),
+    "nest.trait.security.SecurityOpenCloseTrait": ("nest.trait.security_pb2", "SecurityOpenCloseTrait"),
+    "nest.trait.detector.OpenCloseTrait": ("nest.trait.detector_pb2", "OpenCloseTrait"),
+    # Trait events, either sent bare or wrapped in a gateway events notification
+    "weave.trait.security.BoltLockTrait.BoltActuatorStateChangeEvent": (
+        "weave.trait.security_pb2", "BoltLockTrait.BoltActuatorStateChangeEvent"
+    ),
+    "weave.trait.security.PincodeInputTrait.KeypadEntryEvent": (
+        "weave.trait.security_pb2", "PincodeInputTrait.KeypadEntryEvent"
+    ),
+    # Trait command responses, carried back in the SendCommand response
+    "weave.trait.security.UserPincodesSettingsTrait.SetUserPincodeResponse": (
+        "weave.trait.security_pb2", "UserPincodesSettingsTrait.SetUserPincodeResponse"
+    ),
+    "weave.trait.security.UserPincodesSettingsTrait.DeleteUserPincodeResponse": (
+        "weave.trait.security_pb2", "UserPincodesSettingsTrait.DeleteUserPincodeResponse"
+    ),
+    "weave.trait.security.TamperTrait.TamperStateChangeEvent": (
+        "weave.trait.security_pb2", "TamperTrait.TamperStateChangeEvent"
+    ),
+    "nestlabs.gateway.v1.TraitEventsNotification": ("nestlabs.gateway.v1_pb2", "TraitEventsNotification"),
+    "nestlabs.gateway.v1.ResourceEventsNotify": ("nestlabs.gateway.v1_pb2", "ResourceEventsNotify"),
+}
+
+# Traits requested in the Observe subscription, in wire order
+SUBSCRIBED_TRAITS = (
+    "nest.trait.user.UserInfoTrait",
+    "nest.trait.structure.StructureInfoTrait",
+    "weave.trait.security.BoltLockTrait",
+    "weave.trait.security.BoltLockSettingsTrait",
+    "nest.trait.security.EnhancedBoltLockSettingsTrait",
+    "weave.trait.security.BoltLockCapabilitiesTrait",
+    "weave.trait.security.PincodeInputTrait",
+    "weave.trait.security.UserPincodesSettingsTrait",
+    "weave.trait.security.TamperTrait",
+    "weave.trait.security.DoorCheckSettingsTrait",
+    "nest.trait.detector.OpenCloseTrait",
+    "nest.trait.security.SecurityOpenCloseTrait",
+    "weave.trait.power.BatteryPowerSourceTrait",
+    "weave.trait.heartbeat.LivenessTrait",
+)
+
+# Per-backend trait decode strategy, picked from benchmarks/decode_backend.py:
+#   unpack - Any.Unpack() into a fresh message (type_url check + parse)
+#   parse  - Message.FromString(Any.value) into a fresh message
+#   reuse  - Clear() + MergeFromString(Any.value) on a cached scratch message
+# On upb/cpp Unpack costs ~1.7x a direct parse and allocation is cheap, so a
+# fresh message wins. Pure Python pays mostly for building message objects,
+# which reusing a scratch message avoids.
+BACKEND_DECODE_STRATEGY = {
+    "upb": "parse",
+    "cpp": "parse",
+    "python": "reuse",
+}
+DEFAULT_DECODE_STRATEGY = "parse"
+
+_modules = {}
+_classes = {}
+_observe_request = None
+_backend_checked = False
+
+
+def load_module(module_name):
+    """Import a generated pb2 module (e.g. ``weave.trait.security_pb2``) once."""
+    module = _modules.get(module_name)
+    if module is None:
+        _LOGGER.debug("Loading protobuf module %s", module_name)
+        module = importlib.import_module(f"{__package__}.proto.{module_name}")
+        _modules[module_name] = module
+    return module
+
+
+def type_name(type_url):
+    """Strip the ``type.nestlabs.com/`` prefix from an Any type_url."""
+    return type_url.rsplit("/", 1)[-1] if type_url else ""
+
+
+def message_class(name):
+    """Return the message class for a trait type name, or None if unknown."""
+    cls = _classes.get(name)
+    if cls is None and name in TRAITS:
+        module_name, path = TRAITS[name]
+        cls = load_module(module_name)
+        for attr in path.split("."):
+            cls = getattr(cls, attr)
+        _classes[name] = cls
+    return cls
+
+
+def observe_request():
+    """Serialized ObserveRequest for SUBSCRIBED_TRAITS (built once)."""
+    global _observe_request
+    if _observe_request is None:
+        stream_pb2 = load_module("nest.stream_pb2")
+        request = stream_pb2.ObserveRequest(version=2, subscribe=True)
+        for trait in SUBSCRIBED_TRAITS:
+            request.filter.add(trait_type=trait)
+        _observe_request = request.SerializeToString()
+    return _observe_request
+
+
+def protobuf_backend():
+    """Name of the active google.protobuf implementation: upb, cpp or python."""
+    from google.protobuf.internal import api_implementation
+
+    return api_implementation.Type()
+
+
+def check_protobuf_backend():
+    """Log the protobuf backend once per process, warning on pure Python."""
+    global _backend_checked
+    backend = protobuf_backend()
+    if not _backend_checked:
+        _backend_checked = True
+        if backend == "python":
+            _LOGGER.warning(
+                "protobuf is running on the pure Python backend; stream decoding will be "
+                "30x or more slower than with upb. Install a protobuf wheel with the upb extension for "
+                "your platform, or unset PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION"
+            )
+        else:
+            _LOGGER.debug("protobuf backend: %s", backend)
+    return backend
+
+
+class TraitDecoder:
+    """Decodes Any-wrapped trait payloads with the strategy suited to the backend.
+
+    With the ``reuse`` strategy the returned message is a scratch object owned
+    by the decoder: it is overwritten by the next decode of the same trait, so
+    callers must copy out the fields they need before decoding again.
+    """
+
+    def __init__(self, strategy=None):
+        self.backend = protobuf_backend()
+        self.strategy = strategy or BACKEND_DECODE_STRATEGY.get(self.backend, DEFAULT_DECODE_STRATEGY)
+        self._decode = getattr(self, f"_decode_{self.strategy}")
+        self._scratch = {}
+
+    def decode(self, any_msg, name):
+        """Decode `any_msg` as trait `name`; None when the trait is unknown.
+
+        Raises DecodeError on a malformed payload.
+        """
+        cls = message_class(name)
+        if cls is None:
+            return None
+        return self._decode(any_msg, name, cls)
+
+    def decode_envelope(self, cls, data):
+        # A fresh parse beats Clear() + Merge on a reused envelope on upb and is
+        # within noise on pure Python, where clearing walks the old frame.
+        return cls.FromString(data)
+
+    @staticmethod
+    def _decode_unpack(any_msg, name, cls):
+        message = cls()
+        if not any_msg.Unpack(message):
+            raise DecodeError(f"Any holds {any_msg.type_url}, expected {name}")
+        return message
+
+    @staticmethod
+    def _decode_parse(any_msg, name, cls):
+        return cls.FromString(any_msg.value)
+
+    def _decode_reuse(self, any_msg, name, cls):
+        message = self._scratch.get(name)
+        if message is None:
+            message = self._scratch[name] = cls()
+        else:
+            message.Clear()
+        message.MergeFromString(any_msg.value)
+        return message